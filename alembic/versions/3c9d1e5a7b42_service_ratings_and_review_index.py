@@ -0,0 +1,58 @@
+"""service ratings aggregate table and review keyset index
+
+Revision ID: 3c9d1e5a7b42
+Revises: 7a20ffe0f47e
+Create Date: 2026-10-19 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9d1e5a7b42'
+down_revision: Union[str, Sequence[str], None] = '7a20ffe0f47e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('service_ratings',
+        sa.Column('service_id', sa.Integer(), nullable=False),
+        sa.Column('review_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('rating_sum', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('rating_1', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('rating_2', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('rating_3', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('rating_4', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('rating_5', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('updated_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['service_id'], ['services.id'], onupdate='CASCADE', ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('service_id')
+    )
+    op.create_index('ix_service_reviews_service_created', 'service_reviews', ['service_id', 'created_at', 'customer_id'], unique=False)
+
+    # backfill aggregates from existing reviews
+    op.execute("""
+        INSERT INTO service_ratings (service_id, review_count, rating_sum, rating_1, rating_2, rating_3, rating_4, rating_5)
+        SELECT
+            service_id,
+            count(*),
+            sum(rating),
+            count(*) FILTER (WHERE rating = 1),
+            count(*) FILTER (WHERE rating = 2),
+            count(*) FILTER (WHERE rating = 3),
+            count(*) FILTER (WHERE rating = 4),
+            count(*) FILTER (WHERE rating = 5)
+        FROM service_reviews
+        GROUP BY service_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_service_reviews_service_created', table_name='service_reviews')
+    op.drop_table('service_ratings')
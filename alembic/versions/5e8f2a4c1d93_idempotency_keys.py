@@ -0,0 +1,40 @@
+"""idempotency keys table
+
+Revision ID: 5e8f2a4c1d93
+Revises: 3c9d1e5a7b42
+Create Date: 2026-10-19 11:04:27.552190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e8f2a4c1d93'
+down_revision: Union[str, Sequence[str], None] = '3c9d1e5a7b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('idempotency_keys',
+        sa.Column('user_id', sa.VARCHAR(), nullable=False),
+        sa.Column('key', sa.VARCHAR(length=255), nullable=False),
+        sa.Column('request_hash', sa.VARCHAR(length=64), nullable=False),
+        sa.Column('status_code', sa.SMALLINT(), nullable=True),
+        sa.Column('media_type', sa.VARCHAR(), nullable=True),
+        sa.Column('response_body', sa.LargeBinary(), nullable=True),
+        sa.Column('created_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=False),
+        sa.Column('expires_at', sa.TIMESTAMP(), nullable=False),
+        sa.PrimaryKeyConstraint('user_id', 'key')
+    )
+    op.create_index(op.f('ix_idempotency_keys_expires_at'), 'idempotency_keys', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_idempotency_keys_expires_at'), table_name='idempotency_keys')
+    op.drop_table('idempotency_keys')
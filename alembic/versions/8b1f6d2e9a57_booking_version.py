@@ -0,0 +1,28 @@
+"""booking version column for optimistic concurrency
+
+Revision ID: 8b1f6d2e9a57
+Revises: 5e8f2a4c1d93
+Create Date: 2026-10-19 11:47:09.104236
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b1f6d2e9a57'
+down_revision: Union[str, Sequence[str], None] = '5e8f2a4c1d93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('bookings', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('bookings', 'version')
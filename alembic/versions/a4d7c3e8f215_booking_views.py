@@ -0,0 +1,41 @@
+"""booking read model table
+
+Revision ID: a4d7c3e8f215
+Revises: 8b1f6d2e9a57
+Create Date: 2026-10-19 12:31:52.640918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d7c3e8f215'
+down_revision: Union[str, Sequence[str], None] = '8b1f6d2e9a57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # rows are built lazily on first read, so no backfill is needed
+    op.create_table('booking_views',
+        sa.Column('booking_id', sa.Integer(), nullable=False),
+        sa.Column('customer_id', sa.VARCHAR(), nullable=False),
+        sa.Column('document', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('customer_status', sa.VARCHAR(), nullable=True),
+        sa.Column('gst_percent', sa.VARCHAR(), nullable=True),
+        sa.Column('updated_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['booking_id'], ['bookings.id'], onupdate='CASCADE', ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('booking_id')
+    )
+    op.create_index(op.f('ix_booking_views_customer_id'), 'booking_views', ['customer_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_booking_views_customer_id'), table_name='booking_views')
+    op.drop_table('booking_views')
@@ -0,0 +1,34 @@
+"""reference data epoch stamped on booking views
+
+Revision ID: b5e2c8a4d613
+Revises: f3a8d5b1c907
+Create Date: 2026-10-19 20:14:05.663190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e2c8a4d613'
+down_revision: Union[str, Sequence[str], None] = 'f3a8d5b1c907'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # bumped after every committed write to reference data shown in booking views;
+    # start at 1 (is_called) so the first nextval changes last_value
+    op.execute("CREATE SEQUENCE IF NOT EXISTS booking_view_epoch")
+    op.execute("SELECT setval('booking_view_epoch', 1)")
+    # existing rows get epoch 0 and are rebuilt on next read
+    op.add_column('booking_views', sa.Column('ref_epoch', sa.BigInteger(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('booking_views', 'ref_epoch')
+    op.execute("DROP SEQUENCE IF EXISTS booking_view_epoch")
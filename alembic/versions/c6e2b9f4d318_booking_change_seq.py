@@ -0,0 +1,78 @@
+"""booking change sequence for incremental dashboard
+
+Revision ID: c6e2b9f4d318
+Revises: a4d7c3e8f215
+Create Date: 2026-10-19 13:20:44.871302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6e2b9f4d318'
+down_revision: Union[str, Sequence[str], None] = 'a4d7c3e8f215'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# tables whose writes count as a change of the parent booking
+CHILD_TABLES = ['booking_progress', 'booking_analysis', 'booking_assignment', 'booked_services']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE SEQUENCE IF NOT EXISTS booking_change_seq")
+    # volatile default - existing rows get distinct values
+    op.add_column('bookings', sa.Column('change_seq', sa.BigInteger(), server_default=sa.text("nextval('booking_change_seq')"), nullable=False))
+    op.create_index(op.f('ix_bookings_change_seq'), 'bookings', ['change_seq'], unique=False)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_booking_change_seq()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            NEW.change_seq := nextval('booking_change_seq');
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_bookings_change_seq
+        BEFORE UPDATE ON bookings
+        FOR EACH ROW EXECUTE FUNCTION bump_booking_change_seq();
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION touch_parent_booking()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                UPDATE bookings SET change_seq = nextval('booking_change_seq') WHERE id = OLD.booking_id;
+            ELSE
+                UPDATE bookings SET change_seq = nextval('booking_change_seq') WHERE id = NEW.booking_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    for table in CHILD_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER trg_{table}_touch_booking
+            AFTER INSERT OR UPDATE OR DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION touch_parent_booking();
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in CHILD_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_touch_booking ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS touch_parent_booking()")
+    op.execute("DROP TRIGGER IF EXISTS trg_bookings_change_seq ON bookings")
+    op.execute("DROP FUNCTION IF EXISTS bump_booking_change_seq()")
+
+    op.drop_index(op.f('ix_bookings_change_seq'), table_name='bookings')
+    op.drop_column('bookings', 'change_seq')
+    op.execute("DROP SEQUENCE IF EXISTS booking_change_seq")
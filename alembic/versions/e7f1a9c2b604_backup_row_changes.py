@@ -0,0 +1,100 @@
+"""row change log for incremental backups
+
+Revision ID: e7f1a9c2b604
+Revises: c6e2b9f4d318
+Create Date: 2026-10-19 16:05:12.408715
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7f1a9c2b604'
+down_revision: Union[str, Sequence[str], None] = 'c6e2b9f4d318'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# tables backed up incrementally -> primary key columns; keep in step with
+# INCREMENTAL_TABLES in app/services/backup.py
+TRACKED_TABLES = {
+    'addresses': ['id'],
+    'admins': ['id'],
+    'booked_services': ['booking_id', 'service_id'],
+    'booking_analysis': ['booking_id'],
+    'booking_progress': ['id'],
+    'booking_recommendations': ['booking_id', 'service_id'],
+    'bookings': ['id'],
+    'cart': ['customer_id', 'service_id'],
+    'customer_cars': ['id'],
+    'customers': ['id'],
+    'favourites': ['customer_id', 'service_id'],
+    'mechanics': ['id'],
+    'notification_log': ['id'],
+    'offline_payments': ['id'],
+    'online_payments': ['id'],
+    'refunds': ['id'],
+    'service_reviews': ['service_id', 'customer_id'],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'backup_row_changes',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('table_name', sa.VARCHAR(), nullable=False),
+        sa.Column('row_pk', postgresql.JSONB(), nullable=False),
+        sa.Column('operation', sa.CHAR(1), nullable=False),  # U(pdate) or D(elete)
+        sa.Column('changed_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_backup_row_changes_table_changed', 'backup_row_changes', ['table_name', 'changed_at'], unique=False)
+
+    # trigger arguments are the table's primary key columns
+    op.execute("""
+        CREATE OR REPLACE FUNCTION log_row_change()
+        RETURNS TRIGGER AS $$
+        DECLARE
+            col text;
+            old_pk jsonb := '{}';
+            new_pk jsonb := '{}';
+        BEGIN
+            FOREACH col IN ARRAY TG_ARGV LOOP
+                old_pk := old_pk || jsonb_build_object(col, to_jsonb(OLD) -> col);
+                IF TG_OP = 'UPDATE' THEN
+                    new_pk := new_pk || jsonb_build_object(col, to_jsonb(NEW) -> col);
+                END IF;
+            END LOOP;
+
+            IF TG_OP = 'DELETE' OR old_pk <> new_pk THEN
+                INSERT INTO backup_row_changes (table_name, row_pk, operation) VALUES (TG_TABLE_NAME, old_pk, 'D');
+            END IF;
+            IF TG_OP = 'UPDATE' THEN
+                INSERT INTO backup_row_changes (table_name, row_pk, operation) VALUES (TG_TABLE_NAME, new_pk, 'U');
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    for table, primary_key in TRACKED_TABLES.items():
+        arguments = ", ".join(f"'{column}'" for column in primary_key)
+        op.execute(f"""
+            CREATE TRIGGER trg_{table}_log_change
+            AFTER UPDATE OR DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION log_row_change({arguments});
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TRACKED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_log_change ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS log_row_change()")
+
+    op.drop_index('ix_backup_row_changes_table_changed', table_name='backup_row_changes')
+    op.drop_table('backup_row_changes')
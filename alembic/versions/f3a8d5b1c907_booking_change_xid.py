@@ -0,0 +1,54 @@
+"""writing transaction id on bookings for a commit-safe dashboard cursor
+
+Revision ID: f3a8d5b1c907
+Revises: e7f1a9c2b604
+Create Date: 2026-10-19 18:42:31.250917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a8d5b1c907'
+down_revision: Union[str, Sequence[str], None] = 'e7f1a9c2b604'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # existing rows were all committed long ago - 0 sorts below every snapshot xmin
+    op.add_column('bookings', sa.Column('change_xid', sa.BigInteger(), server_default='0', nullable=False))
+    op.alter_column('bookings', 'change_xid', server_default=sa.text("pg_current_xact_id()::text::bigint"))
+    op.create_index(op.f('ix_bookings_change_xid'), 'bookings', ['change_xid'], unique=False)
+
+    # child table writes already touch the booking through this trigger
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_booking_change_seq()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            NEW.change_seq := nextval('booking_change_seq');
+            NEW.change_xid := pg_current_xact_id()::text::bigint;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_booking_change_seq()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            NEW.change_seq := nextval('booking_change_seq');
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    op.drop_index(op.f('ix_bookings_change_xid'), table_name='bookings')
+    op.drop_column('bookings', 'change_xid')
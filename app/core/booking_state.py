@@ -0,0 +1,167 @@
+from fastapi import HTTPException
+from sqlalchemy import select, update, func
+from sqlalchemy.ext.asyncio import AsyncSession as Session
+from sqlalchemy.orm.attributes import set_committed_value
+from typing import Dict, Optional
+
+from app.models import Booking, Status
+from app.core.events import publish_notification
+
+# Booking state machine.
+# action -> {current booking status: next booking status}
+# A next status of None keeps the current status but still bumps the booking
+# version, so concurrent writers acting on the same state are serialized.
+BOOKING_TRANSITIONS: Dict[str, Dict[str, Optional[str]]] = {
+    "assign_pickup": {"booked": "pickup"},
+    "assign_analysis": {"received": "analysis"},
+    "assign_service": {"in-progress": None},
+    "assign_drop": {"completed": "out for delivery", "cancelled": None},
+    "progress": {"pickup": "received", "in-progress": None, "out for delivery": "delivered", "cancelled": None},
+    "analyse": {"analysis": "analysed"},
+    "select_services": {"analysed": None},
+    "confirm_services": {"analysed": "in-progress"},
+    "complete_services": {"in-progress": "completed"},
+    "cancel": {
+        "booked": "cancelled",
+        "pickup": "cancelled",
+        "received": "cancelled",
+        "analysis": "cancelled",
+        "analysed": "cancelled",
+        "in-progress": "cancelled",
+    },
+}
+
+
+# Postgres channel announcing a write to the status table; every worker drops
+# its cached status maps when it is notified.
+STATUS_CHANNEL = "statuses"
+
+# status name <-> id maps, loaded once per process
+_status_ids: Optional[Dict[str, int]] = None
+_status_names: Optional[Dict[int, str]] = None
+
+
+async def load_statuses(db: Session) -> Dict[str, int]:
+    """
+    Get the status name to ID map, loading it on first use.
+
+    Args:
+        db: Async database session
+
+    Returns:
+        dict: Lower-cased status name to status ID
+    """
+    global _status_ids, _status_names
+
+    if _status_ids is None:
+        result = await db.execute(select(Status.id, Status.name))
+        rows = result.all()
+        _status_names = {status_id: name.lower() for status_id, name in rows}
+        _status_ids = {name: status_id for status_id, name in _status_names.items()}
+    return _status_ids
+
+
+async def get_status_name(db: Session, status_id: int) -> Optional[str]:
+    """
+    Get a status name by ID from the cached status map.
+
+    Args:
+        db: Async database session
+        status_id: Status ID
+
+    Returns:
+        Optional[str]: Lower-cased status name, or None if unknown
+    """
+    await load_statuses(db)
+    return _status_names.get(status_id)
+
+
+def invalidate_status_cache(payload: Optional[str] = None) -> None:
+    """Drop this worker's cached status maps; also used as the notification callback."""
+    global _status_ids, _status_names
+    _status_ids = None
+    _status_names = None
+
+
+async def publish_status_change() -> None:
+    """Drop the cached status maps in this and every other worker. Call after the status table is modified."""
+    invalidate_status_cache()
+    await publish_notification(STATUS_CHANNEL)
+
+
+def next_booking_status(action: str, current_status: str) -> Optional[str]:
+    """
+    Look up the status a booking moves to when an action is applied.
+
+    Args:
+        action: Transition action, a key of BOOKING_TRANSITIONS
+        current_status: Current booking status name
+
+    Returns:
+        Optional[str]: Next status name (the current one if the action keeps it)
+
+    Raises:
+        HTTPException: 400 if the action is not allowed from the current status
+    """
+    transitions = BOOKING_TRANSITIONS[action]
+    if current_status not in transitions:
+        raise HTTPException(status_code=400, detail="Attempting invalid state transition.")
+    return transitions[current_status] or current_status
+
+
+async def transition_booking(db: Session, booking: Booking, action: str) -> str:
+    """
+    Apply a state machine action to a booking.
+
+    The transition is checked against the in-memory table and written with a
+    single conditional UPDATE on the status and version the booking was read
+    at, so a concurrent write to the same booking is detected instead of lost.
+
+    Args:
+        db: Async database session
+        booking: Booking instance as read by the caller
+        action: Transition action, a key of BOOKING_TRANSITIONS
+
+    Returns:
+        str: New booking status name
+
+    Raises:
+        HTTPException:
+            - 400 if the action is not allowed from the current status
+            - 409 if the booking was modified by another request
+            - 404 if the next status is missing from the status table
+    """
+    status_ids = await load_statuses(db)
+    current_status = await get_status_name(db, booking.status_id)
+    new_status = next_booking_status(action, current_status)
+
+    if new_status not in status_ids:
+        raise HTTPException(status_code=404, detail=f"Status '{new_status}' not found")
+
+    values = {"status_id": status_ids[new_status], "version": Booking.version + 1}
+    if new_status == "delivered" and current_status != "delivered":
+        values["completed_at"] = func.now()
+
+    result = await db.execute(
+        update(Booking)
+        .where(
+            Booking.id == booking.id,
+            Booking.status_id == booking.status_id,
+            Booking.version == booking.version,
+        )
+        .values(**values)
+        .returning(Booking.status_id, Booking.version, Booking.completed_at, Booking.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(status_code=409, detail="Booking was updated by another request. Please retry.")
+
+    for key in ("status_id", "version", "completed_at", "updated_at"):
+        set_committed_value(booking, key, getattr(row, key))
+
+    # keep an already loaded status relationship in step (usually an identity map hit)
+    if "status" in booking.__dict__:
+        set_committed_value(booking, "status", await db.get(Status, row.status_id))
+
+    return new_status
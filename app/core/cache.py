@@ -0,0 +1,109 @@
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from app.core.events import publish_notification
+
+# Catalog version - bumped on every write to services, price charts or
+# service fuel-type mappings. Caches derived from the catalog stamp their
+# entries with the version they were built at.
+_catalog_version: int = 0
+
+# Postgres channel announcing a catalog write; every worker bumps its own
+# catalog version when it is notified.
+CATALOG_CHANNEL = "catalog"
+
+
+def get_catalog_version() -> int:
+    """
+    Get the current catalog version.
+
+    Returns:
+        int: Current catalog version
+    """
+    return _catalog_version
+
+
+def invalidate_catalog(payload: Optional[str] = None) -> int:
+    """
+    Invalidate this worker's cache entries derived from the service catalog.
+
+    Also used as the CATALOG_CHANNEL notification callback.
+
+    Returns:
+        int: New catalog version
+    """
+    global _catalog_version
+    _catalog_version += 1
+    return _catalog_version
+
+
+async def bump_catalog_version() -> int:
+    """
+    Invalidate every cache entry derived from the service catalog, in this and every other worker.
+
+    Should be called after the transaction that changed the catalog is committed.
+
+    Returns:
+        int: New catalog version in this worker
+    """
+    version = invalidate_catalog()
+    await publish_notification(CATALOG_CHANNEL)
+    return version
+
+
+class VersionedLRUCache:
+    """
+    Bounded LRU cache whose entries are stamped with a version.
+
+    An entry is only returned when it was stored at the version the caller
+    asks for, so bumping the version invalidates all entries at once without
+    walking the cache.
+    """
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, tuple[int, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, version: int) -> Optional[Any]:
+        """
+        Get a cached value for the given key and version.
+
+        Args:
+            key: Cache key
+            version: Version the value must have been stored at
+
+        Returns:
+            Optional[Any]: Cached value, or None on a miss or stale entry
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        entry_version, value = entry
+        if entry_version != version:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, version: int, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key
+            version: Version the value was computed at
+            value: Value to cache
+        """
+        self._entries[key] = (version, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -14,6 +14,7 @@ class Settings(BaseSettings):
     email service, and backup settings.
     """
     postgresql_url: str
+    postgresql_replica_url: str | None = None     # optional read replica for read-only routes
     secret_key: str
     refresh_secret_key: str
     hash_algorithm: str
@@ -25,6 +26,13 @@ class Settings(BaseSettings):
 
     mongodb_uri: str
     mongodb_db: str
+    mongodb_max_pool_size: int = 100
+    mongodb_min_pool_size: int = 0
+    mongodb_max_idle_time_ms: int | None = 300000           # close pooled connections idle this long
+    mongodb_connect_timeout_ms: int = 10000
+    mongodb_server_selection_timeout_ms: int = 10000        # fail fast when no suitable server is reachable
+    mongodb_socket_timeout_ms: int | None = None            # None waits for slow operations indefinitely
+    mongodb_read_preference: str = "primary"                # e.g. primaryPreferred, secondaryPreferred
 
     mail_username: str
     mail_password: str
@@ -39,17 +47,41 @@ class Settings(BaseSettings):
     template_folder: str = "app/templates/email"
 
     backup_dir: str = "backups"
-    max_backup_size_mb: int = 500  # Maximum size per backup
+    max_backup_size_mb: int = 500  # Maximum compressed size per PostgreSQL backup
     auto_delete_old_backups: bool = False
     max_backup_age_days: int = 30
+    backup_copy_format: str = "binary"          # COPY format of table dumps: binary or csv
+    backup_write_buffer_bytes: int = 1048576    # COPY output buffered per table before each disk write
+    backup_compression: str = "gzip"            # chunk compression: gzip, or zstd with the zstandard package installed
+    backup_chunk_size_mb: int = 64              # uncompressed size at which a table's data is split into a new chunk
+    backup_change_log_retention_days: int = 30  # change log kept for incremental backups; older bases need a new full backup
+    backup_parallel_workers: int = 1            # connections dumping tables concurrently; each uses a pool slot
 
     groq_api_key: str
     LANGFUSE_SECRET_KEY: str
     LANGFUSE_PUBLIC_KEY: str
     LANGFUSE_BASE_URL: str
 
+    # async engine connection pool
+    db_pool_size: int = 10                      # connections kept open per worker
+    db_max_overflow: int = 20                   # extra connections opened under load, closed when returned
+    db_pool_timeout_seconds: float = 30         # wait for a free connection before failing the request
+    db_pool_recycle_seconds: int = 1800         # replace connections older than this (-1 disables)
+    db_pool_pre_ping: bool = True               # test connections on checkout, drops ones the server closed
+    db_prepared_statement_cache_size: int = 100 # per-connection cache of prepared statements; 0 behind pgbouncer
+    db_statement_cache_size: int = 100          # asyncpg's own statement cache; 0 behind pgbouncer
+
+    # read replica routing
+    replica_max_lag_seconds: float = 5          # reads go to the primary while the replica lags more than this
+    replica_lag_check_interval_seconds: float = 2
+    replica_sticky_seconds: int = 10            # reads of a client go to the primary this long after its own write
+
     working_hrs: int = 9
 
+    idempotency_key_ttl_hours: int = 24
+    idempotency_wait_timeout_seconds: float = 30    # how long a duplicate waits for the first request
+    idempotency_lock_timeout_seconds: int = 300     # in-progress keys older than this are treated as abandoned
+
     class Config:
         """Pydantic configuration for Settings class."""
         env_file = str(PROJECT_ROOT / ".env")
@@ -0,0 +1,209 @@
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from typing import Callable, Dict, Optional, Set
+
+import asyncpg
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession as Session
+
+from app.core.config import settings
+from app.database.dependencies import db_session
+
+logger = logging.getLogger("uvicorn.error")
+
+# Postgres channel booking events are published on. NOTIFY is delivered on
+# commit to every listening connection, so each worker keeps one LISTEN
+# connection and fans events out to its own subscribers.
+BOOKING_EVENTS_CHANNEL = "booking_events"
+
+SUBSCRIBER_QUEUE_SIZE = 100
+RECONNECT_DELAY_SECONDS = 1
+MAX_RECONNECT_DELAY_SECONDS = 30
+# the LISTEN connection is pinged so a half-open connection (peer gone without
+# a FIN, e.g. after a failover) is noticed instead of silently missing events
+PING_INTERVAL_SECONDS = 15
+PING_TIMEOUT_SECONDS = 5
+
+
+async def publish_notification(channel: str, payload: str = "") -> None:
+    """
+    Send a notification on its own connection, outside any request transaction.
+
+    Used to tell every worker to drop a cache after a write that did not go
+    through Postgres. Failures are logged; the caller's write already succeeded.
+
+    Args:
+        channel: Postgres notification channel
+        payload: Notification payload
+    """
+    try:
+        async with db_session() as db:
+            await db.execute(select(func.pg_notify(channel, payload)))
+            await db.commit()
+    except Exception as exc:
+        logger.error(f"Failed to notify {channel}: {exc}")
+
+
+async def publish_booking_event(db: Session, event: dict) -> None:
+    """
+    Queue a booking event in the caller's transaction; it is delivered on commit.
+
+    Args:
+        db: Async database session
+        event: JSON-serializable event, must contain booking_id
+    """
+    await db.execute(select(func.pg_notify(BOOKING_EVENTS_CHANNEL, json.dumps(event, default=str))))
+
+
+class BookingEventBroker:
+    """
+    Per-worker fan-out of booking events from a Postgres LISTEN connection
+    to SSE subscribers of a single booking or of all bookings (admins).
+
+    Other per-worker notifications (e.g. settings changes) can share the
+    connection through add_channel().
+    """
+
+    def __init__(self):
+        self._booking_subscribers: Dict[int, Set[asyncio.Queue]] = defaultdict(set)
+        self._all_subscribers: Set[asyncio.Queue] = set()
+        self._channels: Dict[str, Callable[[Optional[str]], None]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._connection: Optional[asyncpg.Connection] = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._all_subscribers) + sum(len(queues) for queues in self._booking_subscribers.values())
+
+    def subscribe(self, booking_id: Optional[int] = None) -> asyncio.Queue:
+        """
+        Register a subscriber for one booking, or for all bookings when booking_id is None.
+
+        Args:
+            booking_id: Booking ID to follow
+
+        Returns:
+            asyncio.Queue: Queue receiving event payloads (JSON strings)
+        """
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        if booking_id is None:
+            self._all_subscribers.add(queue)
+        else:
+            self._booking_subscribers[booking_id].add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue, booking_id: Optional[int] = None) -> None:
+        """
+        Remove a subscriber registered with subscribe().
+
+        Args:
+            queue: Queue returned by subscribe()
+            booking_id: Booking ID the queue was registered for
+        """
+        if booking_id is None:
+            self._all_subscribers.discard(queue)
+            return
+
+        queues = self._booking_subscribers.get(booking_id)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._booking_subscribers[booking_id]
+
+    def dispatch(self, payload: str) -> None:
+        """
+        Deliver an event payload to the booking's subscribers and to all-booking subscribers.
+
+        Slow subscribers whose queue is full miss the event rather than
+        holding up everyone else.
+
+        Args:
+            payload: Event JSON as published with publish_booking_event()
+        """
+        try:
+            booking_id = json.loads(payload).get("booking_id")
+        except (ValueError, AttributeError):   # not JSON, or JSON but not an object
+            logger.error(f"Malformed booking event: {payload}")
+            return
+
+        queues = list(self._all_subscribers) + list(self._booking_subscribers.get(booking_id, ()))
+        for queue in queues:
+            try:
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                pass
+
+    def add_channel(self, channel: str, callback: Callable[[Optional[str]], None]) -> None:
+        """
+        Also listen on another channel over the same connection. Call before start().
+
+        The callback receives each notification payload, and None after every
+        (re)connect since notifications sent while disconnected are lost.
+
+        Args:
+            channel: Postgres notification channel
+            callback: Function called with the payload
+        """
+        self._channels[channel] = callback
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        self.dispatch(payload)
+
+    def _on_channel_notify(self, connection, pid, channel, payload) -> None:
+        self._channels[channel](payload)
+
+    async def _listen(self) -> None:
+        dsn = settings.postgresql_url.replace("+asyncpg", "")
+        delay = RECONNECT_DELAY_SECONDS
+
+        while True:
+            try:
+                self._connection = await asyncpg.connect(dsn)
+                await self._connection.add_listener(BOOKING_EVENTS_CHANNEL, self._on_notify)
+                for channel, callback in self._channels.items():
+                    await self._connection.add_listener(channel, self._on_channel_notify)
+                    callback(None)
+                delay = RECONNECT_DELAY_SECONDS
+
+                while not self._connection.is_closed():
+                    await asyncio.sleep(PING_INTERVAL_SECONDS)
+                    await asyncio.wait_for(self._connection.execute("SELECT 1"), timeout=PING_TIMEOUT_SECONDS)
+                logger.error("Booking events connection closed, reconnecting")
+
+            except asyncio.CancelledError:
+                raise
+            except asyncio.TimeoutError:
+                logger.error("Booking events connection did not answer a ping, reconnecting")
+            except Exception as exc:
+                logger.error(f"Booking events listener failed: {exc}")
+
+            # abort rather than close(), a half-open connection would not answer the goodbye
+            if self._connection is not None and not self._connection.is_closed():
+                self._connection.terminate()
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY_SECONDS)
+
+    async def start(self) -> None:
+        """Start listening for booking events in this worker."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop listening and close the LISTEN connection."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self._connection is not None and not self._connection.is_closed():
+            await self._connection.close()
+        self._connection = None
+
+
+booking_events = BookingEventBroker()
@@ -0,0 +1,103 @@
+import asyncio
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Optional
+
+from app.core.events import publish_notification
+from app.database.dependencies import get_mongo_db
+
+# Postgres channel announcing that a setting was changed; every worker drops
+# its cached settings when it is notified.
+APP_SETTINGS_CHANNEL = "app_settings"
+
+
+@dataclass(frozen=True)
+class AppSettings:
+    """Typed snapshot of the admin-editable application settings."""
+    gst_percent: Optional[int]
+    gst_rate: Decimal                   # gst_percent / 100, 0 when GST is not set
+    validation_automation: Optional[bool]
+    analysis_validation_automation: Optional[bool]
+
+
+class AppSettingsCache:
+    """
+    Per-worker cache of the application settings stored in MongoDB.
+
+    Settings are loaded once and then served from memory. Changes made in any
+    worker are announced with NOTIFY on APP_SETTINGS_CHANNEL, which bumps the
+    version here so the next read loads them again.
+    """
+
+    def __init__(self):
+        self._settings: Optional[AppSettings] = None
+        self._version = 0
+        self._lock = asyncio.Lock()
+
+    def invalidate(self, payload: Optional[str] = None) -> None:
+        """Drop the cached settings; also used as the notification callback."""
+        self._version += 1
+        self._settings = None
+
+    async def load(self) -> AppSettings:
+        """
+        Load all settings from MongoDB.
+
+        Returns:
+            AppSettings: Fresh settings snapshot
+        """
+        version = self._version
+        db = get_mongo_db()
+        gst_record, settings_records = await asyncio.gather(
+            db.gst.find_one({}, {"_id": 0, "percent": 1}),
+            db.app_settings.find({}, {"_id": 0, "setting_id": 1, "state": 1}).to_list(length=None),
+        )
+        states = {record.get("setting_id"): record.get("state") for record in settings_records}
+
+        gst_percent = gst_record.get("percent") if gst_record else None
+        settings = AppSettings(
+            gst_percent=gst_percent,
+            gst_rate=Decimal(str(gst_percent or 0)) / 100,
+            validation_automation=states.get("validation_automation"),
+            analysis_validation_automation=states.get("analysis_validation_automation"),
+        )
+
+        # an invalidation during the load means the result may already be stale
+        if version == self._version:
+            self._settings = settings
+        return settings
+
+    async def get(self) -> AppSettings:
+        """
+        Get the cached settings, loading them on first use or after a change.
+
+        Returns:
+            AppSettings: Settings snapshot
+        """
+        settings = self._settings
+        if settings is not None:
+            return settings
+
+        async with self._lock:
+            if self._settings is not None:
+                return self._settings
+            return await self.load()
+
+
+app_settings_cache = AppSettingsCache()
+
+
+async def get_app_settings() -> AppSettings:
+    """
+    Get the application settings from the per-worker cache.
+
+    Returns:
+        AppSettings: Settings snapshot
+    """
+    return await app_settings_cache.get()
+
+
+async def publish_settings_change() -> None:
+    """Invalidate the cached settings in this and every other worker. Call after a settings write."""
+    app_settings_cache.invalidate()
+    await publish_notification(APP_SETTINGS_CHANNEL)
@@ -1,5 +1,7 @@
 from contextlib import asynccontextmanager
-from .postgresql import SessionLocal
+from fastapi import Request
+from .postgresql import SessionLocal, ReadSessionLocal
+from .replica import use_replica
 from .mongo import get_mongo_database as get_mongo_db, get_mongo_client
 
 async def get_postgres_db():
@@ -23,4 +25,25 @@ async def db_session():
     """ Used to get postgresql session without dependency injection """
     async with SessionLocal() as db:
         yield db
-    
\ No newline at end of file
+    
+async def get_postgres_read_db(request: Request):
+    """
+    Async dependency for read-only routes that may be served from the read replica.
+    
+    Falls back to the primary when no replica is configured, when the replica
+    lags more than replica_max_lag_seconds or cannot be reached, and for
+    clients that wrote within the last replica_sticky_seconds, so users
+    always see their own writes. Never write through this session.
+    
+    Args:
+        request: Incoming request
+        
+    Yields:
+        AsyncSession: Replica or primary database session
+    """
+    session_factory = ReadSessionLocal if use_replica(request) else SessionLocal
+    async with session_factory() as db:
+        try:
+            yield db
+        finally:
+            await db.close()
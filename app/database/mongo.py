@@ -10,14 +10,24 @@ def get_mongo_client() -> AsyncIOMotorClient:
     """
     Get MongoDB client instance.
     
-    Returns a singleton MongoDB client instance. Creates a new client if one doesn't exist.
+    Returns a singleton MongoDB client instance. Creates a new client if one doesn't exist,
+    with the pool, timeout and read preference options from Settings.
     
     Returns:
         AsyncIOMotorClient: MongoDB client instance
     """
     global mongo_client
     if mongo_client is None:
-        mongo_client = AsyncIOMotorClient(settings.mongodb_uri)
+        mongo_client = AsyncIOMotorClient(
+            settings.mongodb_uri,
+            maxPoolSize=settings.mongodb_max_pool_size,
+            minPoolSize=settings.mongodb_min_pool_size,
+            maxIdleTimeMS=settings.mongodb_max_idle_time_ms,
+            connectTimeoutMS=settings.mongodb_connect_timeout_ms,
+            serverSelectionTimeoutMS=settings.mongodb_server_selection_timeout_ms,
+            socketTimeoutMS=settings.mongodb_socket_timeout_ms,
+            readPreference=settings.mongodb_read_preference,
+        )
     return mongo_client
 
 
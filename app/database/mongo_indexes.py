@@ -0,0 +1,98 @@
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+from pymongo.errors import PyMongoError
+
+logger = logging.getLogger("uvicorn.error")
+
+# Indexes per collection, created at startup. Give every index a name so a
+# changed spec shows up as a conflict instead of a silent duplicate.
+MONGO_INDEXES: Dict[str, List[IndexModel]] = {
+    "content": [
+        IndexModel([("content_id", ASCENDING)], name="content_id_unique", unique=True),
+    ],
+    "app_settings": [
+        IndexModel([("setting_id", ASCENDING)], name="setting_id_unique", unique=True),
+    ],
+    "queries": [
+        IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)], name="created_at_id_desc"),
+        IndexModel([("response", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)], name="response_created_at_id_desc"),
+        IndexModel([("query", TEXT)], name="query_text"),
+    ],
+    # gst holds a single document and is only read whole - no index needed
+}
+
+# Every filtered or sorted query the services run: (collection, filter, sort).
+# Full reads of small collections (content list, app_settings, gst) are left out,
+# as are text searches: their matches are always sorted in memory.
+# Keep in step with app/services when adding queries.
+MONGO_QUERY_SHAPES: List[Tuple[str, Dict[str, Any], Optional[List[Tuple[str, int]]]]] = [
+    ("content", {"content_id": ""}, None),
+    ("app_settings", {"setting_id": ""}, None),
+    ("queries", {}, [("created_at", DESCENDING), ("_id", DESCENDING)]),
+    ("queries", {"response": None}, [("created_at", DESCENDING), ("_id", DESCENDING)]),
+    ("queries", {"response": {"$ne": None}}, [("created_at", DESCENDING), ("_id", DESCENDING)]),
+]
+
+# plan stages that mean a query is not served by an index
+UNINDEXED_STAGES = {"COLLSCAN", "SORT"}
+
+
+async def ensure_mongo_indexes(db: AsyncIOMotorDatabase) -> None:
+    """
+    Create the declared indexes. Safe to run on every startup: existing
+    indexes with the same spec are left alone.
+
+    Failures (e.g. duplicates blocking a unique index) are logged and do not
+    stop the application.
+
+    Args:
+        db: MongoDB database instance
+    """
+    for collection, indexes in MONGO_INDEXES.items():
+        try:
+            await db[collection].create_indexes(indexes)
+        except PyMongoError as exc:
+            logger.error(f"Failed to create indexes on {collection}: {exc}")
+
+
+def _plan_stages(plan: Any) -> set:
+    stages = set()
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.add(plan["stage"])
+        for value in plan.values():
+            stages |= _plan_stages(value)
+    elif isinstance(plan, list):
+        for item in plan:
+            stages |= _plan_stages(item)
+    return stages
+
+
+async def check_index_coverage(db: AsyncIOMotorDatabase) -> List[str]:
+    """
+    Explain every query in MONGO_QUERY_SHAPES and report those the query
+    planner serves with a collection scan or an in-memory sort.
+
+    Args:
+        db: MongoDB database instance
+
+    Returns:
+        list: Descriptions of uncovered queries, empty when all are covered
+    """
+    uncovered = []
+    for collection, query_filter, sort in MONGO_QUERY_SHAPES:
+        cursor = db[collection].find(query_filter)
+        if sort:
+            cursor = cursor.sort(sort)
+        try:
+            explain = await cursor.explain()
+        except PyMongoError as exc:
+            logger.error(f"Failed to explain query on {collection}: {exc}")
+            continue
+
+        stages = _plan_stages(explain.get("queryPlanner", {}).get("winningPlan", {}))
+        if stages & UNINDEXED_STAGES:
+            uncovered.append(f"{collection} filter={list(query_filter)} sort={sort} plan={sorted(stages)}")
+    return uncovered
@@ -0,0 +1,78 @@
+import time
+from collections import defaultdict
+from typing import Dict
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from app.core.config import settings
+
+
+class PoolMetrics:
+    """Cumulative connection checkout statistics of one pool in this worker."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        self.checkouts += 0 if timed_out else 1
+        self.timeouts += 1 if timed_out else 0
+        self.total_wait_seconds += seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+    def snapshot(self) -> dict:
+        attempts = self.checkouts + self.timeouts
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(self.total_wait_seconds / attempts * 1000, 3) if attempts else 0.0,
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+            "total_wait_seconds": round(self.total_wait_seconds, 3),
+        }
+
+
+# keyed by pool name (the engine's pool_logging_name)
+pool_metrics: Dict[str, PoolMetrics] = defaultdict(PoolMetrics)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that records how long each checkout waited for a connection.
+
+    The wait includes opening a new connection when the pool grows, which is
+    what a request experiences as pool latency.
+    """
+
+    def _do_get(self):
+        metrics = pool_metrics[getattr(self, "logging_name", None) or "default"]
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            metrics.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        metrics.record_wait(time.perf_counter() - start)
+        return connection
+
+
+def get_pool_status(engine) -> dict:
+    """
+    Get live gauges and checkout statistics of an engine's pool.
+
+    Args:
+        engine: Async engine using InstrumentedAsyncQueuePool
+
+    Returns:
+        dict: Pool configuration, current usage and cumulative wait statistics
+    """
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "max_overflow": settings.db_max_overflow,
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "timeout_seconds": pool.timeout(),
+        **pool_metrics[getattr(pool, "logging_name", None) or "default"].snapshot(),
+    }
@@ -1,13 +1,52 @@
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from app.core.config import settings
+from app.database.pool import InstrumentedAsyncQueuePool
+
+
+def create_postgres_engine(url: str, name: str):
+    """
+    Create an async engine with the pool settings from Settings.
+
+    Args:
+        url: Database URL
+        name: Pool name used for logging and pool metrics
+
+    Returns:
+        AsyncEngine: Configured engine
+    """
+    return create_async_engine(
+        url,
+        echo=False,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_logging_name=name,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args={
+            "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+            "statement_cache_size": settings.db_statement_cache_size,
+        },
+    )
+
+
+def create_sessionmaker(bind):
+    return async_sessionmaker(
+        bind=bind,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+        autocommit=False,
+    )
+
+
+engine = create_postgres_engine(settings.postgresql_url, "primary")
+SessionLocal = create_sessionmaker(engine)
+
+# optional read replica; None when not configured
+read_engine = create_postgres_engine(settings.postgresql_replica_url, "replica") if settings.postgresql_replica_url else None
+ReadSessionLocal = create_sessionmaker(read_engine) if read_engine is not None else None
 
-engine = create_async_engine(settings.postgresql_url, echo=False)
-SessionLocal = async_sessionmaker(
-    bind=engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autoflush=False,
-    autocommit=False,
-)
 Base = declarative_base()
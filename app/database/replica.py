@@ -0,0 +1,149 @@
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+from fastapi import Request
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.database.postgresql import read_engine
+
+logger = logging.getLogger("uvicorn.error")
+
+# Set on responses to writes; while it is present the client's reads go to the
+# primary so it sees its own writes despite replication lag.
+PRIMARY_STICKY_COOKIE = "revcare_read_primary"
+# Same deadline as a header, for clients that do not send cookies (cross-site
+# fetch, mobile and server clients); they echo it back on their reads.
+PRIMARY_STICKY_HEADER = "X-Read-Primary-Until"
+
+LAG_QUERY = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+
+class ReplicaMonitor:
+    """
+    Per-worker replication lag probe of the read replica.
+
+    The replica is considered usable only while the last probe succeeded
+    recently and reported lag within replica_max_lag_seconds.
+    """
+
+    def __init__(self):
+        self.lag_seconds: Optional[float] = None
+        self.checked_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def is_usable(self) -> bool:
+        if self.lag_seconds is None or self.checked_at is None:
+            return False
+        stale_after = settings.replica_lag_check_interval_seconds * 3
+        if time.monotonic() - self.checked_at > stale_after:
+            return False
+        return self.lag_seconds <= settings.replica_max_lag_seconds
+
+    async def check(self) -> None:
+        """Measure the replica's replay lag, marking it unusable if it cannot be reached."""
+        try:
+            async with read_engine.connect() as conn:
+                self.lag_seconds = float(await conn.scalar(LAG_QUERY))
+            self.checked_at = time.monotonic()
+        except Exception as exc:
+            logger.error(f"Replica lag check failed: {exc}")
+            self.lag_seconds = None
+
+    async def _run(self) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(settings.replica_lag_check_interval_seconds)
+
+    async def start(self) -> None:
+        """Start probing the replica in this worker, if one is configured."""
+        if read_engine is not None and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop probing and close the replica's connections."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if read_engine is not None:
+            await read_engine.dispose()
+
+    def status(self) -> dict:
+        return {
+            "configured": read_engine is not None,
+            "usable": self.is_usable(),
+            "lag_seconds": self.lag_seconds,
+        }
+
+
+replica_monitor = ReplicaMonitor()
+
+
+# Postgres channel a worker announces a writer's token subject on, so every
+# worker starts that client's sticky window
+RECENT_WRITER_CHANNEL = "recent_writers"
+
+# token subject -> end of its sticky window
+_recent_writers: Dict[str, float] = {}
+MAX_RECENT_WRITERS = 10000
+
+
+def record_write(subject: Optional[str]) -> float:
+    """
+    Start the sticky window of a client that just wrote.
+
+    Also used as the RECENT_WRITER_CHANNEL notification callback.
+
+    Args:
+        subject: Token subject of the writer, if authenticated
+
+    Returns:
+        float: Unix time the window ends at
+    """
+    now = time.time()
+    until = now + settings.replica_sticky_seconds
+    if subject is not None:
+        if len(_recent_writers) >= MAX_RECENT_WRITERS:
+            for key in [key for key, value in _recent_writers.items() if value <= now]:
+                del _recent_writers[key]
+        _recent_writers[subject] = until
+    return until
+
+
+def wrote_recently(request: Request) -> bool:
+    """
+    Whether the client made a write within the sticky window.
+
+    Honours writes by the same token subject (announced on
+    RECENT_WRITER_CHANNEL), the PRIMARY_STICKY_COOKIE cookie and the
+    PRIMARY_STICKY_HEADER request header.
+    """
+    now = time.time()
+    subject = getattr(request.state, "token_subject", None)
+    if subject is not None and _recent_writers.get(subject, 0) > now:
+        return True
+
+    for value in (request.cookies.get(PRIMARY_STICKY_COOKIE), request.headers.get(PRIMARY_STICKY_HEADER)):
+        try:
+            if value is not None and float(value) > now:
+                return True
+        except ValueError:
+            pass
+    return False
+
+
+def use_replica(request: Request) -> bool:
+    """Whether a read-only request can be served from the replica."""
+    return read_engine is not None and replica_monitor.is_usable() and not wrote_recently(request)
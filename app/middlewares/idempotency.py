@@ -0,0 +1,131 @@
+from fastapi import FastAPI, Request, HTTPException
+from fastapi.responses import JSONResponse, Response
+import logging
+import re
+
+from app.auth.jwt_handler import decode_access_token
+from app.database.dependencies import db_session
+from app.services import idempotency as idempotency_service
+
+logger = logging.getLogger("uvicorn.error")
+
+# Write endpoints that honour the Idempotency-Key header, matched without a trailing slash
+IDEMPOTENT_ROUTES = [
+    ("POST", re.compile(r"^/api/v1/bookings$")),
+    ("PUT", re.compile(r"^/api/v1/bookings/\d+/confirm-services$")),
+    ("POST", re.compile(r"^/api/v1/payment/cash-on-delivery/\d+$")),
+]
+
+MAX_KEY_LENGTH = 255
+
+
+def normalize_path(path: str) -> str:
+    """Strip the trailing slash, so a request and its redirected retry share a key."""
+    return path.rstrip("/") or "/"
+
+
+def is_idempotent_route(method: str, path: str) -> bool:
+    return any(method == route_method and pattern.match(path) for route_method, pattern in IDEMPOTENT_ROUTES)
+
+
+def is_replayable(status_code: int) -> bool:
+    """
+    Whether a response is stored for replay.
+
+    Server errors, redirects (e.g. the trailing-slash redirect, whose Location
+    is not stored) and authentication or permission failures are not; the key
+    is released so the client can retry.
+    """
+    return status_code < 500 and not 300 <= status_code < 400 and status_code not in (401, 403)
+
+
+def get_request_user_id(request: Request) -> str | None:
+    """
+    Get the user ID from the bearer token without hitting the database.
+
+    The route still runs full token validation; this only scopes keys per user.
+    """
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    payload = decode_access_token(token)
+    return payload.get("sub") if payload else None
+
+
+def replay_response(record) -> Response:
+    return Response(
+        content=record.response_body or b"",
+        status_code=record.status_code,
+        media_type=record.media_type,
+        headers={"Idempotent-Replayed": "true"},
+    )
+
+
+def register_idempotency(app: FastAPI):
+    """
+    Register Idempotency-Key handling for booking and payment write endpoints.
+
+    The first request with a key executes and its response is stored; retries
+    with the same key replay the stored response byte-for-byte, and concurrent
+    duplicates wait for the first execution instead of running the write again.
+    Redirects, 401/403 and 5xx responses are not stored so the client can retry.
+
+    Args:
+        app: FastAPI application instance to register the middleware on
+    """
+    @app.middleware("http")
+    async def idempotency_middleware(request: Request, call_next):
+        key = request.headers.get("idempotency-key")
+        path = normalize_path(request.url.path)
+        if not key or not is_idempotent_route(request.method, path):
+            return await call_next(request)
+
+        if len(key) > MAX_KEY_LENGTH:
+            return JSONResponse(status_code=400, content={"detail": "Idempotency-Key is too long."})
+
+        user_id = get_request_user_id(request)
+        if user_id is None:
+            # unauthenticated - let the route reject it
+            return await call_next(request)
+
+        body = await request.body()
+        request_hash = idempotency_service.hash_request(request.method, path, request.url.query, body)
+
+        try:
+            while True:
+                async with db_session() as db:
+                    acquired = await idempotency_service.acquire_key(db, user_id, key, request_hash)
+                if acquired:
+                    break
+                # wait_for_key opens a session per poll, none is held while sleeping
+                record = await idempotency_service.wait_for_key(user_id, key, request_hash)
+                if record is not None:
+                    return replay_response(record)
+                # owner failed and released the key - try to claim it
+        except HTTPException as exc:
+            return JSONResponse(status_code=exc.status_code, content={"detail": exc.detail})
+
+        try:
+            response = await call_next(request)
+            response_body = b"".join([chunk async for chunk in response.body_iterator])
+        except BaseException:
+            async with db_session() as db:
+                await idempotency_service.release_key(db, user_id, key)
+            raise
+
+        media_type = response.headers.get("content-type")
+        async with db_session() as db:
+            if not is_replayable(response.status_code):
+                await idempotency_service.release_key(db, user_id, key)
+            else:
+                try:
+                    await idempotency_service.complete_key(db, user_id, key, response.status_code, media_type, response_body)
+                except Exception as exc:
+                    logger.error(f"Failed to store idempotent response: {exc}")
+
+        return Response(
+            content=response_body,
+            status_code=response.status_code,
+            headers=response.headers,
+            background=response.background,
+        )
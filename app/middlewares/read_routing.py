@@ -0,0 +1,46 @@
+from fastapi import FastAPI, Request
+
+from app.core.config import settings
+from app.database.postgresql import read_engine
+from app.core.events import publish_notification
+from app.database.replica import PRIMARY_STICKY_COOKIE, PRIMARY_STICKY_HEADER, RECENT_WRITER_CHANNEL, record_write
+from app.middlewares.idempotency import get_request_user_id
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+def register_read_routing(app: FastAPI):
+    """
+    Register read-your-writes stickiness for replica routing.
+
+    Successful writes start a short sticky window during which
+    get_postgres_read_db serves the client's reads from the primary. The
+    window is keyed on the bearer token subject, announced to every worker,
+    and also returned as a cookie and as the X-Read-Primary-Until
+    header, which clients without cookies echo back on their reads.
+
+    Args:
+        app: FastAPI application instance to register the middleware on
+    """
+    @app.middleware("http")
+    async def read_routing_middleware(request: Request, call_next):
+        if read_engine is None:
+            return await call_next(request)
+
+        request.state.token_subject = get_request_user_id(request)
+        response = await call_next(request)
+
+        if request.method in WRITE_METHODS and response.status_code < 400:
+            subject = request.state.token_subject
+            until = str(record_write(subject))
+            if subject is not None:
+                await publish_notification(RECENT_WRITER_CHANNEL, subject)
+            response.headers[PRIMARY_STICKY_HEADER] = until
+            response.set_cookie(
+                PRIMARY_STICKY_COOKIE,
+                until,
+                max_age=settings.replica_sticky_seconds,
+                httponly=True,
+                samesite="lax",
+            )
+        return response
@@ -23,12 +23,14 @@ from .price_chart import *
 from .service import *
 from .service_category import *
 from .service_reviews import *
+from .service_rating import *
 from .cart import *
 from .favourite import *
 from .assignment_type import *
 from .timeslot import *
 from .status import *
 from .booking import *
+from .booking_view import *
 from .booked_service import *
 from .booking_analysis import *
 from .booking_assignment import *
@@ -42,3 +44,5 @@ from .refund import *
 from .content import *
 from .query import *
 from .notification import *
+from .idempotency_key import *
+from .backup_row_change import *
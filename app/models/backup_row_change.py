@@ -0,0 +1,17 @@
+from sqlalchemy import Column, BigInteger, VARCHAR, CHAR, TIMESTAMP, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from app.database import Base
+
+class BackupRowChange(Base):
+    """Updates and deletes of incrementally backed up tables, written by the log_row_change trigger"""
+    __tablename__ = "backup_row_changes"
+    __table_args__ = (
+        Index("ix_backup_row_changes_table_changed", "table_name", "changed_at"),
+    )
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    table_name = Column(VARCHAR, nullable=False)
+    row_pk = Column(JSONB, nullable=False)          # primary key columns -> values
+    operation = Column(CHAR(1), nullable=False)     # U(pdate) or D(elete)
+    changed_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, VARCHAR, TIMESTAMP, ForeignKey, Integer, Date
+from sqlalchemy import Column, VARCHAR, TIMESTAMP, ForeignKey, Integer, BigInteger, Date, FetchedValue, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -21,6 +21,11 @@ class Booking(Base):
     completed_at = Column(TIMESTAMP)
     updated_at = Column(TIMESTAMP, onupdate=func.now())
     payment_method_id = Column(Integer, ForeignKey("payment_methods.id"), default=None)
+    version = Column(Integer, nullable=False, default=1, server_default="1")    # bumped by every state transition
+    # bumped by triggers on every write to the booking, its progress, analysis, assignments and booked services
+    change_seq = Column(BigInteger, nullable=False, server_default=text("nextval('booking_change_seq')"), server_onupdate=FetchedValue(), index=True)
+    # ID of the last transaction that bumped change_seq, for the dashboard cursor
+    change_xid = Column(BigInteger, nullable=False, server_default=text("pg_current_xact_id()::text::bigint"), server_onupdate=FetchedValue(), index=True)
     
     # Relationships
     customer = relationship("Customer", lazy="selectin")
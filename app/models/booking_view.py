@@ -0,0 +1,19 @@
+from sqlalchemy import Column, VARCHAR, TIMESTAMP, ForeignKey, Integer, BigInteger
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from app.database import Base
+
+class BookingView(Base):
+    """Denormalized booking detail document, rebuilt by the booking write paths"""
+    __tablename__ = "booking_views"
+    
+    booking_id = Column(Integer, ForeignKey("bookings.id", ondelete='CASCADE', onupdate='CASCADE'), primary_key=True)
+    customer_id = Column(VARCHAR, nullable=False, index=True)
+    document = Column(JSONB, nullable=False)        # booking detail as served to admins and mechanics
+    customer_status = Column(VARCHAR)               # condensed status served to customers
+    gst_percent = Column(VARCHAR)                   # GST the totals were computed with
+    ref_epoch = Column(BigInteger, nullable=False, server_default="0")  # booking_view_epoch the document was built at
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<BookingView(booking_id={self.booking_id}, customer_id='{self.customer_id}')>"
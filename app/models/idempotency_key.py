@@ -0,0 +1,19 @@
+from sqlalchemy import Column, VARCHAR, TIMESTAMP, SMALLINT, LargeBinary
+from sqlalchemy.sql import func
+from app.database import Base
+
+class IdempotencyKey(Base):
+    """Stored responses of requests sent with an Idempotency-Key header"""
+    __tablename__ = "idempotency_keys"
+    
+    user_id = Column(VARCHAR, primary_key=True)
+    key = Column(VARCHAR(255), primary_key=True)
+    request_hash = Column(VARCHAR(64), nullable=False)   # sha256 of method, path and body
+    status_code = Column(SMALLINT)                       # null while the first request is executing
+    media_type = Column(VARCHAR)
+    response_body = Column(LargeBinary)
+    created_at = Column(TIMESTAMP, server_default=func.now(), nullable=False)
+    expires_at = Column(TIMESTAMP, nullable=False, index=True)
+    
+    def __repr__(self):
+        return f"<IdempotencyKey(user_id='{self.user_id}', key='{self.key}', status_code={self.status_code})>"
@@ -35,7 +35,8 @@ class Service(Base):
     # Relationship
     category = relationship("ServiceCategory", back_populates="services", lazy="selectin")
     price_chart = relationship("PriceChart", back_populates="service", cascade="all, delete-orphan", lazy="selectin")
-    reviews = relationship("ServiceReview", back_populates="service", cascade="all, delete-orphan", lazy="selectin")
+    # reviews are paginated and aggregated in service_ratings, never loaded with the service
+    reviews = relationship("ServiceReview", back_populates="service", cascade="all, delete-orphan", lazy="select", passive_deletes=True)
     fuel_types = relationship("FuelType", secondary=service_fuel_types, lazy="selectin")
     
     def __repr__(self):
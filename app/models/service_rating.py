@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, TIMESTAMP, ForeignKey
+from sqlalchemy.sql import func
+from app.database import Base
+
+class ServiceRating(Base):
+    """Review aggregates per service, maintained on every review write"""
+    __tablename__ = "service_ratings"
+    
+    service_id = Column(Integer, ForeignKey("services.id", ondelete='CASCADE', onupdate='CASCADE'), primary_key=True)
+    review_count = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_sum = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_1 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_2 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_3 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_4 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_5 = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+
+    @property
+    def average_rating(self) -> float:
+        return round(self.rating_sum / self.review_count, 2) if self.review_count else 0.0
+
+    @property
+    def rating_distribution(self) -> dict:
+        return {rating: getattr(self, f"rating_{rating}") for rating in range(1, 6)}
+    
+    def __repr__(self):
+        return f"<ServiceRating(service_id={self.service_id}, review_count={self.review_count})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, TIMESTAMP, ForeignKey, SMALLINT, VARCHAR, ARRAY
+from sqlalchemy import Column, Integer, TIMESTAMP, ForeignKey, SMALLINT, VARCHAR, ARRAY, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -6,6 +6,10 @@ from app.database import Base
 class ServiceReview(Base):
     """Reviews added by customers to a service"""
     __tablename__ = "service_reviews"
+    __table_args__ = (
+        # keyset pagination of a service's reviews by recency
+        Index("ix_service_reviews_service_created", "service_id", "created_at", "customer_id"),
+    )
     
     service_id = Column(Integer, ForeignKey("services.id", ondelete='CASCADE', onupdate='CASCADE'), primary_key=True)
     customer_id = Column(VARCHAR, ForeignKey("customers.id", ondelete='CASCADE', onupdate='CASCADE'), primary_key=True)
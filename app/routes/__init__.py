@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from . import admin, customer, helper, mechanic, auth, car, address, service, utility, bookings, payment, payment_demo, content, gst, query, notification, backup, app_settings
+from . import admin, customer, helper, mechanic, auth, car, address, service, utility, bookings, payment, payment_demo, content, gst, query, notification, backup, app_settings, metrics
 
 router = APIRouter()
 router.include_router(customer.router, prefix="/customers", tags=["Customers"])
@@ -20,3 +20,4 @@ router.include_router(notification.router, prefix="/notification", tags=["Notifi
 router.include_router(backup.router, prefix="/backup", tags=["Backup & Recovery"])
 router.include_router(helper.router, prefix="/helper", tags=["Helper Functions"])
 router.include_router(app_settings.router, prefix="/settings", tags=["App Settings"])
+router.include_router(metrics.router, prefix="/metrics", tags=["Metrics"])
@@ -1,11 +1,11 @@
-from fastapi import APIRouter, Depends, Security, HTTPException
+from fastapi import APIRouter, Depends, Security, HTTPException, Query, Body
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession as Session
 from typing import List, Optional
 from app.database.dependencies import get_postgres_db
 from app.models import Area, Address
-from app.schemas import AreaCreate, AreaResponse, AreaUpdate, AddressCreate, AddressResponse, AddressUpdate
-from app.services import crud, address as address_service
+from app.schemas import AreaCreate, AreaResponse, AreaUpdate, AreaBulkUpdate, AddressCreate, AddressResponse, AddressUpdate
+from app.services import crud, address as address_service, bookings as booking_service
 from app.auth.dependencies import validate_token
 
 router = APIRouter()
@@ -40,6 +40,54 @@ async def create_area(area: AreaCreate, db: Session = Depends(get_postgres_db),
     """
     return await crud.create_record(db, area.model_dump(), Area)
 
+@router.post("/area/bulk", response_model=List[AreaResponse])
+async def bulk_create_areas(items: List[AreaCreate], db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["WRITE:AREAS"])):
+    """
+    Create many areas in one transaction.
+    
+    Args:
+        items: Area creation data, one entry per area
+        db: Database session
+        payload: Validated token payload
+        
+    Returns:
+        List[AreaResponse]: Created areas, in request order
+    """
+    return await crud.bulk_create_records(db, [item.model_dump() for item in items], Area)
+
+@router.put("/area/bulk", response_model=List[AreaResponse])
+async def bulk_update_areas(items: List[AreaBulkUpdate], db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["UPDATE:AREAS"])):
+    """
+    Update many areas in one transaction.
+    
+    Args:
+        items: Area IDs with the fields to update
+        db: Database session
+        payload: Validated token payload
+        
+    Returns:
+        List[AreaResponse]: Updated areas, in request order
+    """
+    records = await crud.bulk_update_records(db, [item.model_dump(exclude_none=True) for item in items], Area)
+    await booking_service.invalidate_booking_views(db)
+    return records
+
+@router.delete("/area/bulk", response_class=JSONResponse)
+async def bulk_delete_areas(ids: List[int] = Body(...), db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["DELETE:AREAS"])):
+    """
+    Delete many areas in one transaction.
+    
+    Args:
+        ids: Area IDs to delete
+        db: Database session
+        payload: Validated token payload
+        
+    Returns:
+        JSONResponse: Success message
+    """
+    message = await crud.bulk_delete_records(db, ids, Area)
+    return JSONResponse(content=message)
+
 @router.put("/area/{id}", response_model=AreaResponse)
 async def update_area_by_id(id: int, area: AreaUpdate, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["UPDATE:AREAS"])):
     """
@@ -54,7 +102,9 @@ async def update_area_by_id(id: int, area: AreaUpdate, db: Session = Depends(get
     Returns:
         AreaResponse: Updated area
     """
-    return await crud.update_record_by_primary_key(db, id, area.model_dump(exclude_none=True), Area)
+    record = await crud.update_row_by_primary_key(db, id, area.model_dump(exclude_none=True), Area)
+    await booking_service.invalidate_booking_views(db)
+    return record
 
 @router.delete("/area/{id}", response_class=JSONResponse)
 async def delete_area_by_id(id: int, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["DELETE:AREAS"])):
@@ -69,25 +119,27 @@ async def delete_area_by_id(id: int, db: Session = Depends(get_postgres_db), pay
     Returns:
         JSONResponse: Success message
     """
-    message = await crud.delete_record_by_primary_key(db, id, Area)
+    message = await crud.delete_row_by_primary_key(db, id, Area)
     return JSONResponse(content=message)
 
 
 # address routes
 @router.get("/", response_model=List[AddressResponse])
-async def get_customer_addresses(customer_id: Optional[str] = None, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["READ:ADDRESSES"])):
+async def get_customer_addresses(customer_id: Optional[str] = None, limit: Optional[int] = Query(None, ge=1, le=500), cursor: Optional[str] = None, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["READ:ADDRESSES"])):
     """
     Get customer addresses.
     
     Args:
         customer_id: Optional customer ID to filter by
+        limit: Optional page size; without it all records are streamed
+        cursor: Optional cursor from the previous page's X-Next-Cursor header
         db: Database session
         payload: Validated token payload
         
     Returns:
         List[AddressResponse]: List of addresses
     """
-    return await address_service.get_customer_address(db, payload, customer_id)
+    return await address_service.get_customer_address(db, payload, customer_id, limit, cursor)
 
 @router.post("/", response_model=AddressResponse)
 async def create_address(address: AddressCreate, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["WRITE:ADDRESSES"])):
@@ -118,7 +170,9 @@ async def update_address_by_id(id: int, address: AddressUpdate, db: Session = De
     Returns:
         AddressResponse: Updated address
     """
-    return await address_service.update_customer_address(db, payload, id, address.model_dump(exclude_none=True))
+    updated_address = await address_service.update_customer_address(db, payload, id, address.model_dump(exclude_none=True))
+    await booking_service.drop_customer_booking_views(db, updated_address.customer_id)
+    return updated_address
 
 @router.delete("/{id}", response_class=JSONResponse)
 async def delete_address_by_id(id: int, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["DELETE:ADDRESSES"])):
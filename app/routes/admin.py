@@ -1,28 +1,31 @@
-from fastapi import APIRouter, Depends, Security, HTTPException
+from fastapi import APIRouter, Depends, Security, HTTPException, Query
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession as Session
-from typing import List
+from typing import List, Optional
 from app.database.dependencies import get_postgres_db
 from app.models import Admin
 from app.schemas import AdminCreate, AdminResponse, AdminUpdate
 from app.services import user, crud, admin as admin_service
 from app.auth.dependencies import validate_token
+from app.utilities.listing import list_response
 
 router = APIRouter()
 
 @router.get("/", response_model=List[AdminResponse])
-async def get_all_admins(db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["READ:ADMINS"])):
+async def get_all_admins(limit: Optional[int] = Query(None, ge=1, le=500), cursor: Optional[str] = None, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["READ:ADMINS"])):
     """
     Get all admins.
     
     Args:
+        limit: Optional page size; without it all records are streamed
+        cursor: Optional cursor from the previous page's X-Next-Cursor header
         db: Database session
         payload: Validated token payload
         
     Returns:
         List[AdminResponse]: List of admins
     """
-    return await crud.get_all_records(db, Admin)
+    return await list_response(db, Admin, AdminResponse, limit, cursor)
 
 @router.post("/", response_model=AdminResponse)
 async def create_admin(admin: AdminCreate, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["WRITE:ADMINS"])):
@@ -1,3 +1,4 @@
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, Security
 from sqlalchemy.ext.asyncio import AsyncSession
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
@@ -8,6 +9,7 @@ from app.schemas.backup import (
     BackupResponse,
     BackupListResponse,
     RestoreResponse,
+    BackupProgressResponse,
     DeleteBackupResponse
 )
 
@@ -16,14 +18,31 @@ router = APIRouter()
 
 @router.post("/create", response_model=BackupResponse)
 async def create_full_backup(
+    workers: Optional[int] = Query(None, ge=1, le=16, description="Parallel PostgreSQL connections"),
+    incremental: bool = Query(False, description="Back up only PostgreSQL changes since the newest backup"),
     db: AsyncSession = Depends(get_postgres_db),
     mongo_client: AsyncIOMotorDatabase = Depends(get_mongo_db),
     payload = Security(validate_token, scopes=["WRITE:BACKUP"])
 ):
     """
     Create a backup of both PostgreSQL and MongoDB databases
+    
+    - **workers**: Number of tables dumped concurrently from one shared snapshot
+      (default: BACKUP_PARALLEL_WORKERS)
+    - **incremental**: Chain a PostgreSQL backup of the changes since the newest
+      backup; restoring it replays the chain from its base full backup
+    """
+    return await backup_service.create_full_backup(db, mongo_client, workers, incremental)
+
+
+@router.get("/progress", response_model=BackupProgressResponse)
+async def get_backup_progress(payload = Security(validate_token, scopes=["READ:BACKUP"])):
+    """
+    Progress of the PostgreSQL backup running (or last run) in this worker process
     """
-    return await backup_service.create_full_backup(db, mongo_client)
+    if backup_service.progress is None:
+        raise HTTPException(status_code=404, detail="No backup has run since startup")
+    return backup_service.progress.snapshot()
 
 
 @router.get("/list", response_model=BackupListResponse)
@@ -36,7 +55,7 @@ async def list_backups(payload = Security(validate_token, scopes=["READ:BACKUP"]
 
 @router.post("/restore", response_model=RestoreResponse)
 async def restore_full_backup(
-    postgresql_backup: str = Query(..., description="PostgreSQL backup file name"),
+    postgresql_backup: str = Query(..., description="PostgreSQL backup directory name"),
     mongodb_backup: str = Query(..., description="MongoDB backup directory name"),
     db: AsyncSession = Depends(get_postgres_db),
     mongo_client: AsyncIOMotorClient = Depends(get_mongo_client),
@@ -45,7 +64,7 @@ async def restore_full_backup(
     """
     Restore both databases from backups
     
-    - **postgresql_backup**: Name of the PostgreSQL backup file
+    - **postgresql_backup**: Name of the PostgreSQL backup directory (full or incremental)
     - **mongodb_backup**: Name of the MongoDB backup directory
     
     Warning: This will delete all existing data in both databases
@@ -1,17 +1,18 @@
-from fastapi import APIRouter, Depends, Security, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Security, BackgroundTasks, Request
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession as Session
 from typing import List, Optional
-from app.database.dependencies import get_postgres_db
+from datetime import date
+from app.database.dependencies import get_postgres_db, get_postgres_read_db
 from app.schemas import (
     BookingCreate, BookingResponse, MechanicAssignmentCreate, 
     MechanicAssignmentResponse, BookingProgressCreate, BookingProgressUpdate,
     BookingProgressResponse, BookingAnalysisCreate, BookingAnalysisUpdate,
     BookingAnalysisResponse, CustomerServiceSelection,
     AdminBookingDashboard, CustomerBookingView, BookingResponseDetailed,
-    MechanicAssignmentDetailedResponse
+    MechanicAssignmentDetailedResponse, QuoteRequest, QuoteResponse
 )
-from app.services import bookings as booking_service
+from app.services import bookings as booking_service, quote as quote_service, export as export_service
 from app.auth.dependencies import validate_token
 
 router = APIRouter()
@@ -38,9 +39,29 @@ async def create_booking(
     return await booking_service.create_booking(db, booking, payload, background_tasks)
 
 
+@router.post("/quote", response_model=QuoteResponse)
+async def get_quote(
+    quote_request: QuoteRequest,
+    db: Session = Depends(get_postgres_db),
+    payload = Security(validate_token, scopes=["READ:BOOKINGS"])
+):
+    """
+    Get estimated price, GST and days required for services on a customer car.
+    
+    Args:
+        quote_request: Customer car and services to quote
+        db: Database session
+        payload: Validated token payload
+        
+    Returns:
+        QuoteResponse: Price per service, totals with GST and days required
+    """
+    return await quote_service.get_quote(db, quote_request.customer_car_id, quote_request.service_ids, payload)
+
+
 @router.get("/customer", response_model=List[CustomerBookingView])
 async def get_customer_bookings(
-    db: Session = Depends(get_postgres_db),
+    db: Session = Depends(get_postgres_read_db),
     payload = Security(validate_token, scopes=["READ:BOOKINGS"])
 ):
     """
@@ -103,24 +124,81 @@ async def cancel_booking(
 # Admin Endpoints
 @router.get("/admin/dashboard", response_model=List[AdminBookingDashboard])
 async def get_admin_bookings_dashboard(
+    response: Response,
     status_id: Optional[int] = None,
     action_required: Optional[str] = None,
-    db: Session = Depends(get_postgres_db),
+    since: Optional[str] = None,
+    db: Session = Depends(get_postgres_read_db),
     payload = Security(validate_token, scopes=["READ:BOOKINGS", "READ:BOOKING_ASSIGNMENT"])
 ):
     """
     Get all bookings with action indicators for admin dashboard.
     
+    The X-Dashboard-Cursor response header carries the cursor to send as `since`
+    on the next refresh to get only changed bookings. X-Dashboard-Resync is
+    "true" when the body is the full list and should replace the client's copy.
+    
     Args:
+        response: Response used to set the cursor headers
         status_id: Optional status ID to filter by
         action_required: Optional action type filter
+        since: Optional change cursor from a previous response
         db: Database session
         payload: Validated token payload
         
     Returns:
         List[AdminBookingDashboard]: List of bookings with action indicators
     """
-    return await booking_service.get_admin_dashboard_bookings(db, payload, status_id, action_required)
+    bookings, cursor, resync = await booking_service.get_admin_dashboard_bookings(db, payload, status_id, action_required, since)
+    response.headers["X-Dashboard-Cursor"] = cursor
+    response.headers["X-Dashboard-Resync"] = "true" if resync else "false"
+    return bookings
+
+
+@router.get("/admin/events")
+async def get_admin_booking_events(
+    request: Request,
+    db: Session = Depends(get_postgres_db),
+    payload = Security(validate_token, scopes=["READ:BOOKINGS", "READ:BOOKING_ASSIGNMENT"])
+):
+    """
+    Server-sent events for status, progress and assignment changes of all bookings.
+    
+    Args:
+        request: Incoming request
+        db: Database session
+        payload: Validated token payload
+        
+    Returns:
+        StreamingResponse: text/event-stream of booking events
+    """
+    return await booking_service.get_admin_event_stream(db, request)
+
+
+@router.get("/admin/export")
+async def export_bookings(
+    format: str = "ndjson",
+    status_id: Optional[int] = None,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
+    db: Session = Depends(get_postgres_read_db),
+    payload = Security(validate_token, scopes=["READ:BOOKINGS"])
+):
+    """
+    Export bookings as a streamed NDJSON or CSV download.
+    
+    Args:
+        format: "ndjson" (default) or "csv"
+        status_id: Optional status ID to filter by
+        from_date: Optional first creation date to include
+        to_date: Optional last creation date to include
+        db: Database session
+        payload: Validated token payload
+        
+    Returns:
+        StreamingResponse: Bookings export
+    """
+    return await export_service.export_bookings(db, payload, format, status_id, from_date, to_date)
 
 
 @router.post("/admin/assign", response_model=MechanicAssignmentResponse)
@@ -231,7 +309,7 @@ async def validate_analysis(
 # Mechanic Endpoints
 @router.get("/mechanic/assignments", response_model=List[MechanicAssignmentDetailedResponse])
 async def get_mechanic_assignments(
-    db: Session = Depends(get_postgres_db),
+    db: Session = Depends(get_postgres_read_db),
     payload = Security(validate_token, scopes=["READ:BOOKING_ASSIGNMENT"])
 ):
     """
@@ -305,4 +383,26 @@ async def get_booking_details(
     Returns:
         BookingResponseDetailed: Detailed booking information
     """
-    return await booking_service.get_booking_by_id(db, booking_id, payload)
\ No newline at end of file
+    return await booking_service.get_booking_by_id(db, booking_id, payload)
+
+
+@router.get("/{booking_id}/events")
+async def get_booking_events(
+    booking_id: int,
+    request: Request,
+    db: Session = Depends(get_postgres_db),
+    payload = Security(validate_token, scopes=["READ:BOOKINGS"])
+):
+    """
+    Server-sent events for status, progress and assignment changes of a booking.
+    
+    Args:
+        booking_id: Booking ID
+        request: Incoming request
+        db: Database session
+        payload: Validated token payload
+        
+    Returns:
+        StreamingResponse: text/event-stream of booking events
+    """
+    return await booking_service.get_booking_event_stream(db, request, booking_id, payload)
@@ -1,29 +1,33 @@
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Security, Query, Body
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession as Session
 from typing import List, Optional
 from app.database.dependencies import get_postgres_db
 from app.models import Car, CarClass, CustomerCar, Manufacturer, FuelType
-from app.schemas import CustomerCarResponse, CustomerCarCreate, CustomerCarUpdate, CarCreate, CarResponse, CarUpdate, CarClassResponse, CarClassCreate, CarClassUpdate, FuelTypeCreate, FuelTypeResponse, FuelTypeUpdate, ManufacturerCreate, ManufacturerResponse, ManufacturerUpdate
-from app.services import crud, car as car_service
+from app.schemas import CustomerCarResponse, CustomerCarCreate, CustomerCarUpdate, CarCreate, CarResponse, CarUpdate, CarBulkUpdate, CarClassResponse, CarClassCreate, CarClassUpdate, FuelTypeCreate, FuelTypeResponse, FuelTypeUpdate, ManufacturerCreate, ManufacturerResponse, ManufacturerUpdate
+from app.services import crud, car as car_service, bookings as booking_service
 from app.auth.dependencies import validate_token
+from app.utilities.listing import list_response
+from app.core.cache import bump_catalog_version
 
 router = APIRouter()
 
 # car model routes
 @router.get("/models", response_model=List[CarResponse])
-async def get_car_models(db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["READ:CARS"])):
+async def get_car_models(limit: Optional[int] = Query(None, ge=1, le=500), cursor: Optional[str] = None, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["READ:CARS"])):
     """
     Get all car models.
     
     Args:
+        limit: Optional page size; without it all records are streamed
+        cursor: Optional cursor from the previous page's X-Next-Cursor header
         db: Database session
         payload: Validated token payload
         
     Returns:
         List[CarResponse]: List of car models
     """
-    return await crud.get_all_records(db, Car)
+    return await list_response(db, Car, CarResponse, limit, cursor)
 
 @router.post("/models", response_model=CarResponse)
 async def create_car_model(car_model: CarCreate, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["WRITE:CARS"])):
@@ -40,6 +44,54 @@ async def create_car_model(car_model: CarCreate, db: Session = Depends(get_postg
     """
     return await crud.create_record(db, car_model.model_dump(), Car)
 
+@router.post("/models/bulk", response_model=List[CarResponse])
+async def bulk_create_car_models(items: List[CarCreate], db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["WRITE:CARS"])):
+    """
+    Create many car models in one transaction.
+    
+    Args:
+        items: Car model creation data, one entry per car model
+        db: Database session
+        payload: Validated token payload
+        
+    Returns:
+        List[CarResponse]: Created car models, in request order
+    """
+    return await crud.bulk_create_records(db, [item.model_dump() for item in items], Car)
+
+@router.put("/models/bulk", response_model=List[CarResponse])
+async def bulk_update_car_models(items: List[CarBulkUpdate], db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["UPDATE:CARS"])):
+    """
+    Update many car models in one transaction.
+    
+    Args:
+        items: Car model IDs with the fields to update
+        db: Database session
+        payload: Validated token payload
+        
+    Returns:
+        List[CarResponse]: Updated car models, in request order
+    """
+    records = await crud.bulk_update_records(db, [item.model_dump(exclude_none=True) for item in items], Car)
+    await booking_service.invalidate_booking_views(db)
+    return records
+
+@router.delete("/models/bulk", response_class=JSONResponse)
+async def bulk_delete_car_models(ids: List[int] = Body(...), db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["DELETE:CARS"])):
+    """
+    Delete many car models in one transaction.
+    
+    Args:
+        ids: Car model IDs to delete
+        db: Database session
+        payload: Validated token payload
+        
+    Returns:
+        JSONResponse: Success message
+    """
+    message = await crud.bulk_delete_records(db, ids, Car)
+    return JSONResponse(content=message)
+
 @router.put("/models/{id}", response_model=CarResponse)
 async def update_car_model_by_id(id: int, car_model: CarUpdate, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["UPDATE:CARS"])):
     """
@@ -54,7 +106,9 @@ async def update_car_model_by_id(id: int, car_model: CarUpdate, db: Session = De
     Returns:
         CarResponse: Updated car model
     """
-    return await crud.update_record_by_primary_key(db, id, car_model.model_dump(exclude_none=True), Car)
+    record = await crud.update_record_by_primary_key(db, id, car_model.model_dump(exclude_none=True), Car)
+    await booking_service.invalidate_booking_views(db)
+    return record
 
 @router.delete("/models/{id}", response_class=JSONResponse)
 async def delete_car_model_by_id(id: int, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["DELETE:CARS"])):
@@ -69,7 +123,7 @@ async def delete_car_model_by_id(id: int, db: Session = Depends(get_postgres_db)
     Returns:
         JSONResponse: Success message
     """
-    message = await crud.delete_record_by_primary_key(db, id, Car)
+    message = await crud.delete_row_by_primary_key(db, id, Car)
     return JSONResponse(content=message)
 
 
@@ -117,7 +171,9 @@ async def update_car_class_by_id(id: int, car_class: CarClassUpdate, db: Session
     Returns:
         CarClassResponse: Updated car class
     """
-    return await crud.update_record_by_primary_key(db, id, car_class.model_dump(exclude_none=True), CarClass)
+    record = await crud.update_row_by_primary_key(db, id, car_class.model_dump(exclude_none=True), CarClass)
+    await bump_catalog_version()  # service listings embed car class names
+    return record
 
 @router.delete("/class/{id}", response_class=JSONResponse)
 async def delete_car_class_by_id(id: int, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["DELETE:UTILS"])):
@@ -132,7 +188,8 @@ async def delete_car_class_by_id(id: int, db: Session = Depends(get_postgres_db)
     Returns:
         JSONResponse: Success message
     """
-    message = await crud.delete_record_by_primary_key(db, id, CarClass)
+    message = await crud.delete_row_by_primary_key(db, id, CarClass)
+    await bump_catalog_version()
     return JSONResponse(content=message)
 
 
@@ -180,7 +237,9 @@ async def update_fuel_type_by_id(id: int, fuel: FuelTypeUpdate, db: Session = De
     Returns:
         FuelTypeResponse: Updated fuel type
     """
-    return await crud.update_record_by_primary_key(db, id, fuel.model_dump(exclude_none=True), FuelType)
+    record = await crud.update_row_by_primary_key(db, id, fuel.model_dump(exclude_none=True), FuelType)
+    await bump_catalog_version()  # service listings embed fuel type names
+    return record
 
 @router.delete("/fuel/{id}", response_class=JSONResponse)
 async def delete_fuel_type_by_id(id: int, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["DELETE:UTILS"])):
@@ -195,7 +254,8 @@ async def delete_fuel_type_by_id(id: int, db: Session = Depends(get_postgres_db)
     Returns:
         JSONResponse: Success message
     """
-    message = await crud.delete_record_by_primary_key(db, id, FuelType)
+    message = await crud.delete_row_by_primary_key(db, id, FuelType)
+    await bump_catalog_version()
     return JSONResponse(content=message)
 
 
@@ -243,7 +303,9 @@ async def update_manufacturer_by_id(id: int, manufacturer: ManufacturerUpdate, d
     Returns:
         ManufacturerResponse: Updated manufacturer
     """
-    return await crud.update_record_by_primary_key(db, id, manufacturer.model_dump(exclude_none=True), Manufacturer)
+    record = await crud.update_row_by_primary_key(db, id, manufacturer.model_dump(exclude_none=True), Manufacturer)
+    await booking_service.invalidate_booking_views(db)
+    return record
 
 @router.delete("/manufacturer/{id}", response_class=JSONResponse)
 async def delete_manufacturer_by_id(id: int, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["DELETE:UTILS"])):
@@ -258,25 +320,27 @@ async def delete_manufacturer_by_id(id: int, db: Session = Depends(get_postgres_
     Returns:
         JSONResponse: Success message
     """
-    message = await crud.delete_record_by_primary_key(db, id, Manufacturer)
+    message = await crud.delete_row_by_primary_key(db, id, Manufacturer)
     return JSONResponse(content=message)
 
 
 # customer car routes
 @router.get("/", response_model=List[CustomerCarResponse])
-async def get_customer_cars(customer_id: Optional[str] = None, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["READ:CUSTOMER_CARS"])):
+async def get_customer_cars(customer_id: Optional[str] = None, limit: Optional[int] = Query(None, ge=1, le=500), cursor: Optional[str] = None, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["READ:CUSTOMER_CARS"])):
     """
     Get customer cars.
     
     Args:
         customer_id: Optional customer ID to filter by
+        limit: Optional page size; without it all records are streamed
+        cursor: Optional cursor from the previous page's X-Next-Cursor header
         db: Database session
         payload: Validated token payload
         
     Returns:
         List[CustomerCarResponse]: List of customer cars
     """
-    return await car_service.get_customer_cars(db, payload, customer_id)
+    return await car_service.get_customer_cars(db, payload, customer_id, limit, cursor)
 
 @router.get("/{id}", response_model=CustomerCarResponse)
 async def get_customer_car_by_id(id: int, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["READ:CUSTOMER_CARS"])):
@@ -322,7 +386,9 @@ async def update_customer_car_by_id(id: int, customer_car: CustomerCarUpdate, db
     Returns:
         CustomerCarResponse: Updated customer car
     """
-    return await car_service.update_customer_car_by_id(id, customer_car, db, payload)
+    updated_car = await car_service.update_customer_car_by_id(id, customer_car, db, payload)
+    await booking_service.drop_customer_booking_views(db, updated_car.customer_id)
+    return updated_car
 
 @router.delete("/{id}", response_class=JSONResponse)
 async def delete_customer_car_by_id(id: int, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["DELETE:CUSTOMER_CARS"])):
@@ -1,28 +1,35 @@
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Request, Security
 from app.database.dependencies import get_mongo_db
 from app.auth.dependencies import validate_token
 from app.models.content import Content
-from app.services.content import get_content_by_content_id, update_content_bulk, get_contents
+from app.services.content import get_content_by_content_id, update_content_bulk, get_contents_serialized
 from app.schemas import ContentUpdateResponse, ContentResposne
 from typing import Dict, List
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from app.utilities.etag import etag_response
 
 router = APIRouter()
 
 @router.get("/", response_model=List[ContentResposne])
-async def get_content_by_id(
+async def get_all_content(
+    request: Request,
     db: AsyncIOMotorDatabase = Depends(get_mongo_db),
-) -> Content:
+):
     """
     Retrieve all content.
 
+    Served from the per-worker pre-serialized cache with ETag revalidation;
+    a matching If-None-Match gets 304 without querying MongoDB.
+
     Args:
+        request (Request): Incoming request.
         db (AsyncIOMotorDatabase): MongoDB database connection.
 
     Returns:
         List[Content]: The content records found.
     """
-    return await get_contents(db)
+    body, etag = await get_contents_serialized(db)
+    return etag_response(request, body, etag)
 
 
 @router.put("/", response_model=List[ContentUpdateResponse])
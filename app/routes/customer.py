@@ -1,11 +1,11 @@
-from fastapi import APIRouter, Depends, Security, HTTPException
+from fastapi import APIRouter, Depends, Security, HTTPException, Query
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession as Session
 from typing import List, Optional
 from app.database.dependencies import get_postgres_db
 from app.models import Customer, Cart, Favourite
 from app.schemas import CustomerCreate, CustomerResponse, CustomerUpdate
-from app.services import crud, user, customer as customer_service
+from app.services import crud, user, customer as customer_service, bookings as booking_service
 from app.auth.dependencies import validate_token
 
 router = APIRouter()
@@ -76,7 +76,7 @@ async def remove_from_favourite(service_id: int, db: Session = Depends(get_postg
 
 # customer data based routes
 @router.get("/", response_model=List[CustomerResponse])
-async def get_customers(customer_id: Optional[str] = None, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["READ:CUSTOMERS"])):
+async def get_customers(customer_id: Optional[str] = None, limit: Optional[int] = Query(None, ge=1, le=500), cursor: Optional[str] = None, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["READ:CUSTOMERS"])):
     """
     Get customer(s) information.
     
@@ -85,13 +85,15 @@ async def get_customers(customer_id: Optional[str] = None, db: Session = Depends
     
     Args:
         customer_id: Optional customer ID to filter by
+        limit: Optional page size; without it all records are streamed
+        cursor: Optional cursor from the previous page's X-Next-Cursor header
         db: Database session
         payload: Validated token payload
         
     Returns:
         List[CustomerResponse]: List of customer information
     """
-    return await user.get_customers(db, payload, customer_id)
+    return await user.get_customers(db, payload, customer_id, limit, cursor)
 
 @router.post("/", response_model=CustomerResponse)
 async def create_customer(customer: CustomerCreate, db: Session = Depends(get_postgres_db)):
@@ -121,7 +123,9 @@ async def update_customer(id: str, customer_data: CustomerUpdate, db: Session =
     Returns:
         CustomerResponse: Updated customer information
     """
-    return await user.update_customer(id, customer_data, db, payload)
+    customer = await user.update_customer(id, customer_data, db, payload)
+    await booking_service.drop_customer_booking_views(db, id.strip())
+    return customer
 
 @router.delete("/{id}", response_class=JSONResponse)
 async def delete_customer(id: str, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["DELETE:CUSTOMERS"])):
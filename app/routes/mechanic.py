@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Security, HTTPException
+from fastapi import APIRouter, Depends, Security, HTTPException, Query
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession as Session
 from typing import List, Optional
@@ -54,7 +54,7 @@ async def update_assignment_type_by_id(id: int, assignment_type: AssignmentTypeU
     Returns:
         AssignmentTypeResponse: Updated assignment type
     """
-    return await crud.update_record_by_primary_key(db, id, assignment_type.model_dump(exclude_none=True), AssignmentType)
+    return await crud.update_row_by_primary_key(db, id, assignment_type.model_dump(exclude_none=True), AssignmentType)
 
 @router.delete("/assignment_type/{id}", response_class=JSONResponse)
 async def delete_assignment_type_by_id(id: int, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["DELETE:UTILS"])):
@@ -69,25 +69,27 @@ async def delete_assignment_type_by_id(id: int, db: Session = Depends(get_postgr
     Returns:
         JSONResponse: Success message
     """
-    message = await crud.delete_record_by_primary_key(db, id, AssignmentType)
+    message = await crud.delete_row_by_primary_key(db, id, AssignmentType)
     return JSONResponse(content=message)
 
 
 # crud routes
 @router.get("/", response_model=List[MechanicResponse])
-async def get_all_mechanics(mechanic_id: Optional[str] = None, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["READ:MECHANICS"])):
+async def get_all_mechanics(mechanic_id: Optional[str] = None, limit: Optional[int] = Query(None, ge=1, le=500), cursor: Optional[str] = None, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["READ:MECHANICS"])):
     """
     Get all mechanics or a specific mechanic.
     
     Args:
         mechanic_id: Optional mechanic ID to filter by
+        limit: Optional page size; without it all records are streamed
+        cursor: Optional cursor from the previous page's X-Next-Cursor header
         db: Database session
         payload: Validated token payload
         
     Returns:
         List[MechanicResponse]: List of mechanics
     """
-    return await user.get_mechanics(db, payload, mechanic_id)
+    return await user.get_mechanics(db, payload, mechanic_id, limit, cursor)
 
 @router.post("/", response_model=MechanicResponse)
 async def create_mechanic(mechanic: MechanicCreate, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["WRITE:MECHANICS"])):
@@ -0,0 +1,36 @@
+from fastapi import APIRouter, Security, HTTPException
+from fastapi.responses import JSONResponse
+import os
+from app.database import engine, read_engine
+from app.database.pool import get_pool_status
+from app.database.replica import replica_monitor
+from app.auth.dependencies import validate_token
+
+router = APIRouter()
+
+
+@router.get("/db-pool", response_class=JSONResponse)
+async def get_db_pool_metrics(payload = Security(validate_token, scopes=[])):
+    """
+    Get live connection pool gauges and replica state of the worker serving the request.
+    
+    Each worker process has its own pool, so values describe one worker;
+    `pid` tells workers apart.
+    
+    Args:
+        payload: Validated token payload
+        
+    Returns:
+        JSONResponse: Per pool size, checked out and overflow connections, and checkout wait statistics
+        
+    Raises:
+        HTTPException: 403 if user is not an admin
+    """
+    if payload.get("role") in [2, 3]:
+        raise HTTPException(status_code=403, detail="Insufficient Permissions.")
+
+    pools = {"primary": get_pool_status(engine)}
+    if read_engine is not None:
+        pools["replica"] = get_pool_status(read_engine)
+
+    return JSONResponse(content={"pid": os.getpid(), "pools": pools, "replica": replica_monitor.status()})
@@ -1,14 +1,15 @@
-from fastapi import APIRouter, Depends, Security, HTTPException
+from fastapi import APIRouter, Depends, Security, HTTPException, Query
 from fastapi.responses import JSONResponse
 from sqlalchemy import select, desc
 from sqlalchemy.ext.asyncio import AsyncSession as Session
 from sqlalchemy.orm import selectinload
 from typing import List, Optional
+from datetime import date
 
-from app.database.dependencies import get_postgres_db
+from app.database.dependencies import get_postgres_read_db
 from app.models import NotificationLog
 from app.schemas import NotificationLogResponse
-from app.services import notification as notification_service
+from app.services import notification as notification_service, export as export_service
 from app.auth.dependencies import validate_token
 
 router = APIRouter()
@@ -18,8 +19,9 @@ router = APIRouter()
 @router.get("/notifications/logs", response_model=List[NotificationLogResponse])
 async def get_notification_logs(
     notification_category: Optional[int] = None,  # 'email', 'sms', 'whatsapp'
-    limit: int = 100,
-    db: Session = Depends(get_postgres_db),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_postgres_read_db),
     payload = Security(validate_token, scopes=["READ:NOTIFICATION_LOG"])
 ):
     """
@@ -30,10 +32,37 @@ async def get_notification_logs(
     Args:
         notification_category: Optional notification category ID to filter by
         limit: Maximum number of logs to return (default: 100)
+        cursor: Optional cursor from the previous page's X-Next-Cursor header
         db: Database session
         payload: Validated token payload
         
     Returns:
         List[NotificationLogResponse]: List of notification logs
     """
-    return await notification_service.get_notification_logs(db, notification_category, limit)
\ No newline at end of file
+    return await notification_service.get_notification_logs(db, notification_category, limit, cursor)
+
+
+@router.get("/notifications/logs/export")
+async def export_notification_logs(
+    format: str = "ndjson",
+    notification_category: Optional[int] = None,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
+    db: Session = Depends(get_postgres_read_db),
+    payload = Security(validate_token, scopes=["READ:NOTIFICATION_LOG"])
+):
+    """
+    Export notification logs as a streamed NDJSON or CSV download.
+    
+    Args:
+        format: "ndjson" (default) or "csv"
+        notification_category: Optional notification category ID to filter by
+        from_date: Optional first date to include
+        to_date: Optional last date to include
+        db: Database session
+        payload: Validated token payload
+        
+    Returns:
+        StreamingResponse: Notification logs export
+    """
+    return await export_service.export_notification_logs(db, format, notification_category, from_date, to_date)
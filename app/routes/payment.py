@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Form, Depends, Security, BackgroundTasks
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession as Session
-from app.database.dependencies import get_postgres_db
-from app.services import bookings as booking_service
+from typing import Optional
+from datetime import date
+from app.database.dependencies import get_postgres_db, get_postgres_read_db
+from app.services import bookings as booking_service, export as export_service
 from app.auth.dependencies import validate_token
 from app.schemas import CashOnDelivery
 
@@ -78,3 +80,27 @@ async def verify_cash_on_delivery_payment(
         JSONResponse: Payment verification result
     """
     return await booking_service.confirm_payment_webhook(db, razorpay_order_id, razorpay_payment_id, razorpay_signature, background_tasks)
+
+
+@router.get("/export")
+async def export_payments(
+    format: str = "ndjson",
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
+    db: Session = Depends(get_postgres_read_db),
+    payload = Security(validate_token, scopes=["READ:BOOKINGS"])
+):
+    """
+    Export online and cash on delivery payments as a streamed NDJSON or CSV download.
+    
+    Args:
+        format: "ndjson" (default) or "csv"
+        from_date: Optional first payment date to include
+        to_date: Optional last payment date to include
+        db: Database session
+        payload: Validated token payload
+        
+    Returns:
+        StreamingResponse: Payments export
+    """
+    return await export_service.export_payments(db, payload, format, from_date, to_date)
@@ -1,12 +1,12 @@
-from typing import List
-from fastapi import APIRouter, Depends, Security, status, BackgroundTasks
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Security, status, BackgroundTasks, Query as QueryParam, Response
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from sqlalchemy.ext.asyncio import AsyncSession as Session
 from app.auth.dependencies import validate_token
 from app.database.dependencies import get_mongo_db, get_postgres_db
 from app.models import Query
 from app.schemas import QueryCreate, QueryResponse
-from app.services.query import create_query_service, respond_to_query_service, get_all_queries_service
+from app.services.query import create_query_service, respond_to_query_service, get_queries_page, get_query_service
 
 router = APIRouter()
 
@@ -59,17 +59,54 @@ async def respond_to_query(
 # Get all queries - by admin
 @router.get("/", response_model=List[Query])
 async def get_all_queries(
+    response: Response,
+    limit: int = QueryParam(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    responded: Optional[bool] = None,
+    search: Optional[str] = QueryParam(None, min_length=1, max_length=200),
     user_payload: dict = Security(validate_token, scopes=["READ:QUERIES"]),
     db: AsyncIOMotorDatabase = Depends(get_mongo_db),
 ) -> List[Query]:
     """
-    Retrieve all customer queries.
+    Retrieve a page of customer queries, newest first.
+    
+    Response bodies are omitted; use GET /{query_id} to read one. The cursor
+    of the next page is sent in the X-Next-Cursor header.
+    
+    Args:
+        response: Response used to set the cursor header
+        limit: Maximum number of queries to return
+        cursor: Cursor from the previous page's X-Next-Cursor header
+        responded: Optional filter; True for answered, False for unanswered queries
+        search: Optional words to match against the query text
+        user_payload: Validated token payload
+        db: MongoDB database session
+        
+    Returns:
+        List[Query]: Page of customer queries
+    """
+    queries, next_cursor = await get_queries_page(db, limit, cursor, responded, search)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return queries
+
+
+# Get one query - by admin
+@router.get("/{query_id}", response_model=Query)
+async def get_query(
+    query_id: str,
+    user_payload: dict = Security(validate_token, scopes=["READ:QUERIES"]),
+    db: AsyncIOMotorDatabase = Depends(get_mongo_db),
+) -> Query:
+    """
+    Retrieve a customer query with its response.
     
     Args:
+        query_id: Query ID
         user_payload: Validated token payload
         db: MongoDB database session
         
     Returns:
-        List[Query]: List of all customer queries
+        Query: Query document
     """
-    return await get_all_queries_service(db)
+    return await get_query_service(db, query_id)
@@ -1,12 +1,14 @@
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Security, Request, Query
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession as Session
 from typing import List, Optional
-from app.database.dependencies import get_postgres_db
-from app.models import ServiceCategory, Service, ServiceReview
-from app.schemas import ServiceCategoryCreate, ServiceCategoryResponse, ServiceCategoryUpdate, ServiceCreate, ServiceResponse, ServicePageResponse, ServiceUpdateWithForeignData, ServiceReviewCreate, ServiceReviewResponse, ServiceReviewUpdate
-from app.services import crud, service as car_service
+from app.database.dependencies import get_postgres_db, get_postgres_read_db
+from app.models import ServiceCategory, Service
+from app.schemas import ServiceCategoryCreate, ServiceCategoryResponse, ServiceCategoryUpdate, ServiceCreate, ServiceResponse, ServicePageResponse, ServiceUpdateWithForeignData, ServiceReviewCreate, ServiceReviewResponse, ServiceReviewUpdate, ServiceReviewPage, ServiceReviewStats
+from app.services import crud, service as car_service, bookings as booking_service
 from app.auth.dependencies import validate_token
+from app.core.cache import bump_catalog_version
+from app.utilities.etag import etag_response
 
 router = APIRouter()
 
@@ -54,7 +56,10 @@ async def update_category_by_id(id: int, category: ServiceCategoryUpdate, db: Se
     Returns:
         ServiceCategoryResponse: Updated service category
     """
-    return await crud.update_record_by_primary_key(db, id, category.model_dump(exclude_none=True), ServiceCategory)
+    record = await crud.update_row_by_primary_key(db, id, category.model_dump(exclude_none=True), ServiceCategory)
+    await booking_service.invalidate_booking_views(db)
+    await bump_catalog_version()
+    return record
 
 @router.delete("/category/{id}", response_class=JSONResponse)
 async def delete_category_by_id(id: int, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["DELETE:SERVICE_CATEGORIES"])):
@@ -69,25 +74,42 @@ async def delete_category_by_id(id: int, db: Session = Depends(get_postgres_db),
     Returns:
         JSONResponse: Success message
     """
-    message = await crud.delete_record_by_primary_key(db, id, ServiceCategory)
+    message = await crud.delete_row_by_primary_key(db, id, ServiceCategory)
+    await booking_service.invalidate_booking_views(db)
+    await bump_catalog_version()  # services of the category are deleted by cascade
     return JSONResponse(content=message)
 
 
 # service review routes
-@router.get("/review/{service_id}", response_model=List[ServiceReviewResponse])
-async def get_reviews_for_service(service_id: int, db: Session = Depends(get_postgres_db)):
+@router.get("/review/{service_id}", response_model=ServiceReviewPage)
+async def get_reviews_for_service(service_id: int, limit: int = Query(20, ge=1, le=100), cursor: Optional[str] = None, db: Session = Depends(get_postgres_read_db)):
     """
-    Get all reviews for a service.
+    Get a page of reviews for a service, newest first.
     
     Args:
         service_id: Service ID
+        limit: Maximum number of reviews to return
+        cursor: Cursor from the previous page's next_cursor
         db: Database session
-        payload: Validated token payload
         
     Returns:
-        List[ServiceReviewResponse]: List of service reviews
+        ServiceReviewPage: Reviews and the cursor for the next page
     """
-    return await crud.get_all_records(db, ServiceReview, filters={"service_id": service_id})
+    return await car_service.get_service_reviews(db, service_id, limit, cursor)
+
+@router.get("/review/{service_id}/stats", response_model=ServiceReviewStats)
+async def get_review_stats_for_service(service_id: int, db: Session = Depends(get_postgres_read_db)):
+    """
+    Get rating aggregates for a service.
+    
+    Args:
+        service_id: Service ID
+        db: Database session
+        
+    Returns:
+        ServiceReviewStats: Review count, average rating and rating distribution
+    """
+    return await car_service.get_service_rating_stats(db, service_id)
 
 @router.post("/review", response_model=ServiceReviewResponse)
 async def create_review(review: ServiceReviewCreate, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["WRITE:SERVICE_REVIEWS"])):
@@ -153,33 +175,41 @@ async def service_recommendation(query: str, db: Session = Depends(get_postgres_
 
 # service routes
 @router.get("/categorized", response_model = List[ServicePageResponse])
-async def get_services_by_category_id(db: Session = Depends(get_postgres_db)):
+async def get_services_categorized(request: Request, db: Session = Depends(get_postgres_db)):
     """
     Get all services in categorized format.
     
+    Served from the pre-serialized catalog snapshot. Clients sending the
+    ETag back in If-None-Match get 304 when the catalog is unchanged.
+    
     Args:
+        request: Incoming request
         db: Database session
         
     Returns:
-        List[ServiceResponse]: List of services
+        List[ServicePageResponse]: List of categories with their services
     """
-    return await car_service.get_services_categorized(db)
+    body, etag = await car_service.get_services_categorized(db)
+    return etag_response(request, body, etag)
 
 
 @router.get("/", response_model=List[ServiceResponse])
-async def get_services_by_category_id(category_id: Optional[int] = None, db: Session = Depends(get_postgres_db)):
+async def get_services_by_category_id(request: Request, category_id: Optional[int] = None, db: Session = Depends(get_postgres_db)):
     """
     Get all services, optionally filtered by category.
     
+    Served from the pre-serialized catalog snapshot with ETag revalidation.
+    
     Args:
+        request: Incoming request
         category_id: Optional category ID to filter by
         db: Database session
         
     Returns:
         List[ServiceResponse]: List of services
     """
-    filters = {"category_id": category_id} if category_id else None
-    return await crud.get_all_records(db, Service, filters=filters)
+    body, etag = await car_service.get_services(db, category_id)
+    return etag_response(request, body, etag)
 
 @router.get("/{service_id}", response_model=ServiceResponse)
 async def get_services_by_service_id(service_id: int, db: Session = Depends(get_postgres_db)):
@@ -239,5 +269,5 @@ async def delete_service_by_id(id: int, db: Session = Depends(get_postgres_db),
     Returns:
         JSONResponse: Success message
     """
-    message = await crud.delete_record_by_primary_key(db, id, Service)
+    message = await car_service.delete_service(db, id)
     return JSONResponse(content=message)
@@ -1,12 +1,13 @@
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Security, Body
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession as Session
 from typing import List
 from app.database.dependencies import get_postgres_db
 from app.models import Status, Timeslot
-from app.schemas import StatusCreate, StatusResponse, StatusUpdate, TimeslotCreate, TimeslotResponse, TimeslotUpdate
-from app.services import crud
+from app.schemas import StatusCreate, StatusResponse, StatusUpdate, TimeslotCreate, TimeslotResponse, TimeslotUpdate, TimeslotBulkUpdate
+from app.services import crud, bookings as booking_service
 from app.auth.dependencies import validate_token
+from app.core.booking_state import publish_status_change
 
 router = APIRouter()
 
@@ -38,7 +39,9 @@ async def create_status(status: StatusCreate, db: Session = Depends(get_postgres
     Returns:
         StatusResponse: Created status
     """
-    return await crud.create_record(db, status.model_dump(), Status)
+    record = await crud.create_record(db, status.model_dump(), Status)
+    await publish_status_change()
+    return record
 
 @router.put("/status/{id}", response_model=StatusResponse)
 async def update_status_by_id(id: int, status: StatusUpdate, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["UPDATE:UTILS"])):
@@ -54,7 +57,10 @@ async def update_status_by_id(id: int, status: StatusUpdate, db: Session = Depen
     Returns:
         StatusResponse: Updated status
     """
-    return await crud.update_record_by_primary_key(db, id, status.model_dump(exclude_none=True), Status)
+    record = await crud.update_row_by_primary_key(db, id, status.model_dump(exclude_none=True), Status)
+    await booking_service.invalidate_booking_views(db)
+    await publish_status_change()
+    return record
 
 @router.delete("/status/{id}", response_class=JSONResponse)
 async def delete_status_by_id(id: int, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["DELETE:UTILS"])):
@@ -69,7 +75,9 @@ async def delete_status_by_id(id: int, db: Session = Depends(get_postgres_db), p
     Returns:
         JSONResponse: Success message
     """
-    message = await crud.delete_record_by_primary_key(db, id, Status)
+    message = await crud.delete_row_by_primary_key(db, id, Status)
+    await booking_service.invalidate_booking_views(db)
+    await publish_status_change()
     return JSONResponse(content=message)
 
 
@@ -103,6 +111,54 @@ async def create_timeslot(timeslot: TimeslotCreate, db: Session = Depends(get_po
     """
     return await crud.create_record(db, timeslot.model_dump(), Timeslot)
 
+@router.post("/timeslot/bulk", response_model=List[TimeslotResponse])
+async def bulk_create_timeslots(items: List[TimeslotCreate], db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["WRITE:UTILS"])):
+    """
+    Create many timeslots in one transaction.
+    
+    Args:
+        items: Timeslot creation data, one entry per timeslot
+        db: Database session
+        payload: Validated token payload
+        
+    Returns:
+        List[TimeslotResponse]: Created timeslots, in request order
+    """
+    return await crud.bulk_create_records(db, [item.model_dump() for item in items], Timeslot)
+
+@router.put("/timeslot/bulk", response_model=List[TimeslotResponse])
+async def bulk_update_timeslots(items: List[TimeslotBulkUpdate], db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["UPDATE:UTILS"])):
+    """
+    Update many timeslots in one transaction.
+    
+    Args:
+        items: Timeslot IDs with the fields to update
+        db: Database session
+        payload: Validated token payload
+        
+    Returns:
+        List[TimeslotResponse]: Updated timeslots, in request order
+    """
+    records = await crud.bulk_update_records(db, [item.model_dump(exclude_none=True) for item in items], Timeslot)
+    await booking_service.invalidate_booking_views(db)
+    return records
+
+@router.delete("/timeslot/bulk", response_class=JSONResponse)
+async def bulk_delete_timeslots(ids: List[int] = Body(...), db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["DELETE:UTILS"])):
+    """
+    Delete many timeslots in one transaction.
+    
+    Args:
+        ids: Timeslot IDs to delete
+        db: Database session
+        payload: Validated token payload
+        
+    Returns:
+        JSONResponse: Success message
+    """
+    message = await crud.bulk_delete_records(db, ids, Timeslot)
+    return JSONResponse(content=message)
+
 @router.put("/timeslot/{id}", response_model=TimeslotResponse)
 async def update_timeslot_by_id(id: int, timeslot: TimeslotUpdate, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["UPDATE:UTILS"])):
     """
@@ -117,7 +173,9 @@ async def update_timeslot_by_id(id: int, timeslot: TimeslotUpdate, db: Session =
     Returns:
         TimeslotResponse: Updated timeslot
     """
-    return await crud.update_record_by_primary_key(db, id, timeslot.model_dump(exclude_none=True), Timeslot)
+    record = await crud.update_row_by_primary_key(db, id, timeslot.model_dump(exclude_none=True), Timeslot)
+    await booking_service.invalidate_booking_views(db)
+    return record
 
 @router.delete("/timeslot/{id}", response_class=JSONResponse)
 async def delete_timeslot_by_id(id: int, db: Session = Depends(get_postgres_db), payload = Security(validate_token, scopes=["DELETE:UTILS"])):
@@ -132,5 +190,5 @@ async def delete_timeslot_by_id(id: int, db: Session = Depends(get_postgres_db),
     Returns:
         JSONResponse: Success message
     """
-    message = await crud.delete_record_by_primary_key(db, id, Timeslot)
+    message = await crud.delete_row_by_primary_key(db, id, Timeslot)
     return JSONResponse(content=message)
\ No newline at end of file
@@ -17,6 +17,7 @@ from .assignment_type import *
 from .status import *
 from .timeslot import *
 from .bookings import *
+from .quote import *
 from .content import *
 from .gst import *
 from .query import *
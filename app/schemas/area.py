@@ -45,3 +45,8 @@ class AreaUpdate(BaseModel):
         if len(v) < 2:
             raise ValueError("Area name must be at least 2 characters long")
         return v
+
+
+class AreaBulkUpdate(AreaUpdate):
+    """Schema for one area in a bulk update"""
+    id: int = Field(..., gt=0, description="ID of the area to update")
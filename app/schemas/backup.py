@@ -11,6 +11,15 @@ class PostgreSQLBackupInfo(BaseModel):
     success: bool
     backup_name: str
     backup_path: str
+    tables: Dict[str, int]
+    total_rows: int
+    backup_type: str
+    base_backup: Optional[str] = None
+    deleted_rows: int
+    schema_version: Optional[str] = None
+    compression: str
+    workers: int
+    duration_seconds: float
     size_bytes: int
     size_mb: float
     created_at: str
@@ -55,6 +64,10 @@ class BackupItem(BaseModel):
     created_at: str
     collections: Optional[Dict[str, int]] = None
     total_documents: Optional[int] = None
+    tables: Optional[Dict[str, int]] = None
+    total_rows: Optional[int] = None
+    backup_type: Optional[str] = None
+    base_backup: Optional[str] = None
 
 
 class BackupListResponse(BaseModel):
@@ -72,11 +85,23 @@ class RestoreRequest(BaseModel):
     )
 
 
+class TableRestoreInfo(BaseModel):
+    """Restore statistics of one table"""
+    rows: int
+    seconds: float
+    rows_per_second: float
+
+
 class PostgreSQLRestoreInfo(BaseModel):
     """PostgreSQL restore result"""
     success: bool
     backup_name: str
-    statements_executed: int
+    backups_applied: List[str]
+    tables_restored: Dict[str, TableRestoreInfo]
+    total_rows: int
+    sequences_reset: int
+    triggers_disabled: bool
+    duration_seconds: float
     restored_at: str
 
 
@@ -104,7 +129,7 @@ class RestoreResponse(BaseModel):
     restored_at: Optional[str] = None
     
     # For PostgreSQL
-    statements_executed: Optional[int] = None
+    tables_restored: Optional[Dict[str, TableRestoreInfo]] = None
     
     # For MongoDB
     collections_restored: Optional[Dict[str, int]] = None
@@ -115,6 +140,21 @@ class RestoreResponse(BaseModel):
     mongodb: Optional[MongoDBRestoreInfo] = None
 
 
+class BackupProgressResponse(BaseModel):
+    """Progress of the PostgreSQL backup running (or last run) in this worker"""
+    backup_name: str
+    workers: int
+    tables_total: int
+    tables_done: int
+    tables_in_progress: List[str]
+    rows_done: int
+    bytes_written: int
+    elapsed_seconds: float
+    started_at: str
+    finished: bool
+    error: Optional[str] = None
+
+
 class DeleteBackupResponse(BaseModel):
     """Response for backup deletion"""
     success: bool
@@ -23,7 +23,7 @@ class BookingCreate(BaseModel):
     drop_date: date
     pickup_timeslot_id: int
     drop_timeslot_id: int
-    service_price: Dict[int, Decimal] = Field(..., description="Dict with service_id as key and est_price as value")
+    service_price: Dict[int, Decimal] = Field(..., description="Dict with service_id as key and est_price as value. Prices are recomputed server-side from the price chart")
 
     @model_validator(mode="after")
     def validate_dates(self):
@@ -97,3 +97,8 @@ class CarUpdate(BaseModel):
         if v < 1900:
             raise ValueError("Manufacturing year must be 1900 or later")
         return v
+
+
+class CarBulkUpdate(CarUpdate):
+    """Schema for one car in a bulk update"""
+    id: int = Field(..., gt=0, description="ID of the car to update")
@@ -0,0 +1,35 @@
+from pydantic import BaseModel, Field, field_validator
+from typing import List
+from decimal import Decimal
+
+
+class QuoteRequest(BaseModel):
+    """Schema for requesting a price quote"""
+    customer_car_id: int = Field(..., gt=0, description="Customer car the services are for")
+    service_ids: List[int] = Field(..., description="Service IDs to quote")
+
+    @field_validator('service_ids')
+    def validate_service_ids(cls, v: List[int]) -> List[int]:
+        """Validate at least one service is requested"""
+        if not v:
+            raise ValueError("Quote atleast one service.")
+        return v
+
+
+class QuotedService(BaseModel):
+    """Schema for a single priced service in a quote"""
+    service_id: int = Field(..., description="Service ID")
+    price: Decimal = Field(..., description="Price for the car class")
+    time_hrs: Decimal = Field(..., description="Expected service time in hours")
+
+
+class QuoteResponse(BaseModel):
+    """Schema for price quote response"""
+    customer_car_id: int = Field(..., description="Customer car ID")
+    car_class_id: int = Field(..., description="Car class the prices are for")
+    services: List[QuotedService] = Field(..., description="Price per service")
+    total_price: Decimal = Field(..., description="Total estimated price without GST")
+    gst: Decimal = Field(..., description="GST amount")
+    total_with_gst: Decimal = Field(..., description="Total estimated price with GST")
+    hours_required: Decimal = Field(..., description="Total service time in hours")
+    days_required: int = Field(..., description="Working days required to complete all services")
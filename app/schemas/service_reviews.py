@@ -1,6 +1,6 @@
 # Pydantic Schemas
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime
 from .customer import CustomerBase
 
@@ -46,6 +46,12 @@ class ServiceReviewResponse(ServiceReviewBase):
         from_attributes = True
 
 
+class ServiceReviewPage(BaseModel):
+    """Schema for a keyset-paginated page of service reviews, newest first"""
+    reviews: List[ServiceReviewResponse] = Field(..., description="Reviews in this page")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
+
+
 class ServiceReviewUpdate(BaseModel):
     """Schema for updating a service review"""
     rating: Optional[int] = Field(None, ge=1, le=5, description="Updated rating")
@@ -69,4 +69,8 @@ class TimeslotUpdate(BaseModel):
 
         if end <= start:
             raise ValueError("end_time must be after start_time")
-        return values
\ No newline at end of file
+        return values
+
+class TimeslotBulkUpdate(TimeslotUpdate):
+    """Schema for one timeslot in a bulk update"""
+    id: int = Field(..., gt=0, description="ID of the timeslot to update")
@@ -2,9 +2,11 @@ from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession as Session
 from app.models import Address
 from app.services import crud
-from app.schemas import AddressCreate
+from app.schemas import AddressCreate, AddressResponse
+from app.utilities.listing import list_response
+from typing import Optional
 
-async def get_customer_address(db: Session, payload: dict, customer_id: str):
+async def get_customer_address(db: Session, payload: dict, customer_id: str, limit: Optional[int] = None, cursor: Optional[str] = None):
     """
     Get customer address(es) with access control.
     
@@ -15,9 +17,11 @@ async def get_customer_address(db: Session, payload: dict, customer_id: str):
         db: Async database session
         payload: Token payload containing user_id and role
         customer_id: Optional customer ID to filter by
+        limit: Optional page size; without it all records are streamed
+        cursor: Optional cursor from the previous page's X-Next-Cursor header
         
     Returns:
-        list: List of Address instances
+        Response: Page or stream of addresses
         
     Raises:
         HTTPException: 403 if customer tries to access another customer's addresses
@@ -33,7 +37,7 @@ async def get_customer_address(db: Session, payload: dict, customer_id: str):
         if user_id.startswith("CST"):
             filters = {"customer_id": user_id}
 
-    return await crud.get_all_records(db, Address, filters=filters)
+    return await list_response(db, Address, AddressResponse, limit, cursor, filters=filters)
 
 
 async def create_customer_address(db: Session, payload: dict, address: AddressCreate):
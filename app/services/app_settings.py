@@ -1,5 +1,6 @@
 from datetime import datetime
 from fastapi.responses import JSONResponse
+from app.core.settings_cache import publish_settings_change
 
 async def toggle_validation_automation_state(db, state: bool, payload: dict):
     """
@@ -23,6 +24,7 @@ async def toggle_validation_automation_state(db, state: bool, payload: dict):
         },
         upsert=True,
     )
+    await publish_settings_change()
 
     return JSONResponse(content={
         "message": f"Automation state set {state} successfully"
@@ -51,6 +53,7 @@ async def toggle_analysis_validation_automation_state(db, state: bool, payload:
         },
         upsert=True,
     )
+    await publish_settings_change()
 
     return JSONResponse(content={
         "message": f"Automation state set {state} successfully"
@@ -1,15 +1,650 @@
+import asyncio
+import hashlib
 import json
-from datetime import datetime
+import logging
+import time
+import zlib
+from collections import deque
+from datetime import datetime, timedelta
+from graphlib import CycleError, TopologicalSorter
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import shutil
 
 from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from fastapi import HTTPException
 
 from app.core.config import settings
+from app.core.cache import bump_catalog_version
+from app.core.booking_state import publish_status_change
+from app.core.events import publish_notification
+from app.core.settings_cache import publish_settings_change
+from app.services.content import content_cache, CONTENT_CHANNEL
+
+logger = logging.getLogger("uvicorn.error")
+
+PG_BACKUP_PREFIX = "postgresql_backup_"
+MANIFEST_FILE = "manifest.json"
+# written by every PostgreSQL restore; incrementals may not chain to backups older than it
+RESTORE_MARKER_FILE = "last_restore.json"
+ARCHIVE_FORMAT_VERSION = 1
+
+# COPY format -> extension of the per-table data files
+COPY_FORMATS = {"binary": ".bin", "csv": ".csv"}
+
+# compression -> extension of the chunk files
+COMPRESSIONS = {"gzip": ".gz", "zstd": ".zst"}
+
+READ_BLOCK_SIZE = 1024 * 1024
+
+# Every user table with the columns COPY can write back, largest first so
+# parallel workers finish together. Generated columns are skipped;
+# alembic_version and the change log are bookkeeping, not data.
+BACKUP_TABLES_QUERY = """
+    SELECT c.table_name, array_agg(c.column_name::text ORDER BY c.ordinal_position) AS columns
+    FROM information_schema.columns c
+    JOIN information_schema.tables t
+        ON t.table_schema = c.table_schema AND t.table_name = c.table_name
+    WHERE c.table_schema = 'public'
+        AND t.table_type = 'BASE TABLE'
+        AND c.is_generated = 'NEVER'
+        AND c.table_name NOT IN ('alembic_version', 'backup_row_changes', 'booking_views', 'idempotency_keys', 'service_ratings')
+    GROUP BY c.table_name
+    ORDER BY pg_relation_size(format('public.%I', c.table_name)::regclass) DESC, c.table_name
+"""
+
+# Tables derived from other tables or short-lived, left out of backups (see
+# BACKUP_TABLES_QUERY) and rebuilt or emptied on restore instead:
+# booking_views is rebuilt lazily on read, service_ratings is recomputed from
+# service_reviews, idempotency_keys only matter for in-flight retries.
+DERIVED_TABLES = ["booking_views", "idempotency_keys", "service_ratings"]
+
+REBUILD_SERVICE_RATINGS_QUERY = """
+    INSERT INTO public.service_ratings (service_id, review_count, rating_sum, rating_1, rating_2, rating_3, rating_4, rating_5)
+    SELECT
+        service_id,
+        count(*),
+        sum(rating),
+        count(*) FILTER (WHERE rating = 1),
+        count(*) FILTER (WHERE rating = 2),
+        count(*) FILTER (WHERE rating = 3),
+        count(*) FILTER (WHERE rating = 4),
+        count(*) FILTER (WHERE rating = 5)
+    FROM public.service_reviews
+    GROUP BY service_id
+"""
+
+# Tables backed up incrementally -> column holding the row's creation time.
+# Inserts are found by that column; updates and deletes through the
+# backup_row_changes log kept by the log_row_change trigger (keep in step with
+# TRACKED_TABLES of migration e7f1a9c2b604). Every other table is copied whole
+# in each backup.
+INCREMENTAL_TABLES = {
+    "addresses": "created_at",
+    "admins": "created_at",
+    "booked_services": "created_at",
+    "booking_analysis": "created_at",
+    "booking_progress": "created_at",
+    "booking_recommendations": "created_at",
+    "bookings": "created_at",
+    "cart": "created_at",
+    "customer_cars": "created_at",
+    "customers": "created_at",
+    "favourites": "created_at",
+    "mechanics": "created_at",
+    "notification_log": "timestamp",
+    "offline_payments": "created_at",
+    "online_payments": "created_at",
+    "refunds": "created_at",
+    "service_reviews": "created_at",
+}
+
+# archive entry holding the deletions captured by an incremental backup
+DELETIONS_ARCHIVE = "_deletions"
+
+DELETIONS_QUERY = """
+    SELECT DISTINCT table_name, row_pk
+    FROM public.backup_row_changes
+    WHERE operation = 'D' AND changed_at >= $1::timestamptz
+"""
+
+# Rows stamped by now() carry their transaction's start time, so a transaction
+# still open when the snapshot is taken may later commit rows older than it.
+# The high-water mark is held back to the start of the oldest open transaction.
+HIGH_WATER_MARK_QUERY = """
+    SELECT LEAST(now(), COALESCE(MIN(xact_start), now()))
+    FROM pg_stat_activity
+    WHERE xact_start IS NOT NULL AND pid <> pg_backend_pid()
+"""
+
+PRIMARY_KEYS_QUERY = """
+    SELECT tbl.relname AS table_name, array_agg(att.attname::text ORDER BY key.position) AS columns
+    FROM pg_index idx
+    JOIN pg_class tbl ON tbl.oid = idx.indrelid
+    CROSS JOIN LATERAL unnest(idx.indkey) WITH ORDINALITY AS key(attnum, position)
+    JOIN pg_attribute att ON att.attrelid = tbl.oid AND att.attnum = key.attnum
+    WHERE idx.indisprimary AND tbl.relnamespace = 'public'::regnamespace
+    GROUP BY tbl.relname
+"""
+
+# (table, referenced table) for every foreign key between public tables
+FOREIGN_KEYS_QUERY = """
+    SELECT child.relname AS table_name, parent.relname AS referenced_table
+    FROM pg_constraint con
+    JOIN pg_class child ON child.oid = con.conrelid
+    JOIN pg_class parent ON parent.oid = con.confrelid
+    WHERE con.contype = 'f'
+        AND child.relnamespace = 'public'::regnamespace
+        AND parent.relnamespace = 'public'::regnamespace
+"""
+
+# Every sequence feeding a column of a public table: serial and identity
+# columns (owned sequences) and plain nextval() defaults such as change_seq.
+SEQUENCE_COLUMNS_QUERY = """
+    SELECT seq.oid::regclass::text AS sequence_name, tbl.relname AS table_name, att.attname AS column_name
+    FROM pg_class seq
+    JOIN pg_depend dep ON dep.refobjid = seq.oid AND dep.classid = 'pg_attrdef'::regclass
+    JOIN pg_attrdef ad ON ad.oid = dep.objid
+    JOIN pg_class tbl ON tbl.oid = ad.adrelid
+    JOIN pg_attribute att ON att.attrelid = ad.adrelid AND att.attnum = ad.adnum
+    WHERE seq.relkind = 'S' AND tbl.relnamespace = 'public'::regnamespace
+    UNION
+    SELECT seq.oid::regclass::text, tbl.relname, att.attname
+    FROM pg_class seq
+    JOIN pg_depend dep ON dep.objid = seq.oid AND dep.classid = 'pg_class'::regclass
+        AND dep.refclassid = 'pg_class'::regclass AND dep.deptype IN ('a', 'i')
+    JOIN pg_class tbl ON tbl.oid = dep.refobjid
+    JOIN pg_attribute att ON att.attrelid = tbl.oid AND att.attnum = dep.refobjsubid
+    WHERE seq.relkind = 'S' AND tbl.relnamespace = 'public'::regnamespace
+"""
+
+
+def _zstandard():
+    # optional dependency, only needed when backup_compression is zstd
+    try:
+        import zstandard
+    except ImportError:
+        raise HTTPException(
+            status_code=400,
+            detail="zstd compression needs the zstandard package"
+        )
+    return zstandard
+
+
+def get_compressor(compression: str):
+    """New compressor writing one complete gzip or zstd stream."""
+    if compression == "zstd":
+        return _zstandard().ZstdCompressor().compressobj()
+    return zlib.compressobj(6, zlib.DEFLATED, 31)
+
+
+def get_decompressor(compression: str):
+    """New decompressor for one stream written by get_compressor."""
+    if compression == "zstd":
+        return _zstandard().ZstdDecompressor().decompressobj()
+    return zlib.decompressobj(31)
+
+
+class ArchiveTableWriter:
+    """
+    Sink for one table's COPY output.
+    
+    Output is buffered, then compressed, hashed and written from a worker
+    thread so the event loop never blocks on CPU or disk. The table is split
+    into chunk files of about settings.backup_chunk_size_mb uncompressed bytes,
+    each a complete compressed stream with its own SHA-256.
+    """
+
+    def __init__(self, backup_path: Path, file_prefix: str, compression: str, progress: "BackupProgress"):
+        self.chunks: List[Dict[str, Any]] = []
+        self.raw_bytes = 0
+        self.size_bytes = 0
+        self._backup_path = backup_path
+        self._file_prefix = file_prefix
+        self._compression = compression
+        self._progress = progress
+        self._buffer = bytearray()
+        self._chunk_limit = settings.backup_chunk_size_mb * 1024 * 1024
+        self._file = None
+
+    async def write(self, data: bytes) -> None:
+        self._buffer += data
+        if len(self._buffer) >= settings.backup_write_buffer_bytes:
+            await self._flush()
+
+    async def close(self) -> None:
+        """Write the remaining output and finish the last chunk."""
+        await self._flush()
+        if self._file is not None:
+            await self._finish_chunk()
+
+    async def abort(self) -> None:
+        if self._file is not None:
+            await asyncio.to_thread(self._file.close)
+            self._file = None
+
+    async def _flush(self) -> None:
+        if not self._buffer:
+            return
+        data, self._buffer = self._buffer, bytearray()
+
+        if self._file is None:
+            self._chunk_file = f"{self._file_prefix}.{len(self.chunks):05d}{COMPRESSIONS[self._compression]}"
+            self._file = await asyncio.to_thread(open, self._backup_path / self._chunk_file, "wb")
+            self._compressor = get_compressor(self._compression)
+            self._digest = hashlib.sha256()
+            self._chunk_raw = self._chunk_size = 0
+
+        written = await asyncio.to_thread(self._compress_and_write, data)
+        self._chunk_raw += len(data)
+        self.raw_bytes += len(data)
+        self._record_written(written)
+
+        if self._chunk_raw >= self._chunk_limit:
+            await self._finish_chunk()
+
+    async def _finish_chunk(self) -> None:
+        written = await asyncio.to_thread(self._finish_and_close)
+        self._record_written(written)
+        self._file = None
+        self.chunks.append({
+            "file": self._chunk_file,
+            "raw_bytes": self._chunk_raw,
+            "size_bytes": self._chunk_size,
+            "sha256": self._digest.hexdigest(),
+        })
+
+    def _record_written(self, written: int) -> None:
+        self._chunk_size += written
+        self.size_bytes += written
+        self._progress.record_bytes(written)
+
+    def _compress_and_write(self, data: bytearray) -> int:
+        compressed = self._compressor.compress(bytes(data))
+        self._digest.update(compressed)
+        self._file.write(compressed)
+        return len(compressed)
+
+    def _finish_and_close(self) -> int:
+        tail = self._compressor.flush()
+        self._digest.update(tail)
+        self._file.write(tail)
+        self._file.close()
+        return len(tail)
+
+
+def _read_chunk_block(file, digest, decompressor) -> Optional[bytes]:
+    block = file.read(READ_BLOCK_SIZE)
+    if not block:
+        return None
+    digest.update(block)
+    return decompressor.decompress(block)
+
+
+async def read_table_chunks(backup_path: Path, table: Dict[str, Any], compression: str):
+    """
+    Stream a table's chunks back as COPY data, verifying each chunk's SHA-256.
+    
+    Reading, hashing and decompression run in a worker thread. A checksum
+    mismatch raises, which aborts the COPY and with it the restore transaction.
+    
+    Args:
+        backup_path: Backup directory
+        table: Table entry of the manifest
+        compression: Compression of the chunks
+        
+    Yields:
+        bytes: Decompressed COPY data
+        
+    Raises:
+        ValueError: If a chunk does not match its checksum
+    """
+    for chunk in table["chunks"]:
+        digest = hashlib.sha256()
+        decompressor = get_decompressor(compression)
+        file = await asyncio.to_thread(open, backup_path / chunk["file"], "rb")
+        try:
+            while True:
+                data = await asyncio.to_thread(_read_chunk_block, file, digest, decompressor)
+                if data is None:
+                    break
+                if data:
+                    yield data
+        finally:
+            await asyncio.to_thread(file.close)
+
+        if digest.hexdigest() != chunk["sha256"]:
+            raise ValueError(f"Checksum mismatch in {chunk['file']}")
+
+
+async def copy_archive_in(
+    conn,
+    backup_path: Path,
+    manifest: Dict[str, Any],
+    entry: Dict[str, Any],
+    table_name: str,
+    schema_name: Optional[str] = "public"
+) -> int:
+    """
+    Load an archive entry into a table with COPY FROM STDIN.
+    
+    Args:
+        conn: asyncpg connection
+        backup_path: Backup directory
+        manifest: Manifest of the backup
+        entry: Archive entry (a table of the manifest, or its deletions)
+        table_name: Table to load into
+        schema_name: Schema of the table; None for temporary tables
+        
+    Returns:
+        int: Rows loaded
+    """
+    if not entry["chunks"]:
+        return 0
+    status = await conn.copy_to_table(
+        table_name,
+        schema_name=schema_name,
+        columns=entry["columns"],
+        source=read_table_chunks(backup_path, entry, manifest["compression"]),
+        format=manifest["format"],
+    )
+    return copy_row_count(status)
+
+
+async def get_driver_connection(db_session: AsyncSession):
+    """
+    Get the asyncpg connection behind a session, for COPY.
+
+    Args:
+        db_session: Async database session
+
+    Returns:
+        asyncpg.Connection: Driver connection in the session's transaction
+    """
+    connection = await db_session.connection()
+    raw_connection = await connection.get_raw_connection()
+    return raw_connection.driver_connection
+
+
+def copy_row_count(status: str) -> int:
+    """Row count from a COPY command status such as 'COPY 42'."""
+    return int(status.split()[-1])
+
+
+async def get_schema_version(conn) -> Optional[str]:
+    """Alembic revision the database is at, None if it is not managed by Alembic."""
+    if not await conn.fetchval("SELECT to_regclass('public.alembic_version')"):
+        return None
+    return await conn.fetchval("SELECT version_num FROM public.alembic_version")
+
+
+class BackupProgress:
+    """Progress of the PostgreSQL backup running in this worker process."""
+
+    def __init__(self, backup_name: str, tables_total: int, workers: int, max_bytes: int):
+        self.backup_name = backup_name
+        self.max_bytes = max_bytes
+        self.tables_total = tables_total
+        self.workers = workers
+        self.tables_done = 0
+        self.rows_done = 0
+        self.bytes_written = 0
+        self.in_progress: set = set()
+        self.started_at = datetime.now().isoformat()
+        self.finished = False
+        self.error: Optional[str] = None
+        self._started = time.perf_counter()
+
+    def start_table(self, table_name: str) -> None:
+        self.in_progress.add(table_name)
+
+    def record_bytes(self, written: int) -> None:
+        """Count archive bytes written, failing the backup past settings.max_backup_size_mb."""
+        self.bytes_written += written
+        if self.bytes_written > self.max_bytes:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Backup exceeds the maximum size of {settings.max_backup_size_mb} MB"
+            )
+
+    def finish_table(self, table_name: str, rows: int) -> None:
+        self.in_progress.discard(table_name)
+        self.tables_done += 1
+        self.rows_done += rows
+        logger.info(f"Backup {self.backup_name}: [{self.tables_done}/{self.tables_total}] {table_name} {rows} rows")
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "backup_name": self.backup_name,
+            "workers": self.workers,
+            "tables_total": self.tables_total,
+            "tables_done": self.tables_done,
+            "tables_in_progress": sorted(self.in_progress),
+            "rows_done": self.rows_done,
+            "bytes_written": self.bytes_written,
+            "elapsed_seconds": round(time.perf_counter() - self._started, 3),
+            "started_at": self.started_at,
+            "finished": self.finished,
+            "error": self.error,
+        }
+
+
+async def dump_table(
+    conn,
+    job: Dict[str, Any],
+    backup_path: Path,
+    copy_format: str,
+    compression: str,
+    progress: BackupProgress
+) -> Dict[str, Any]:
+    """
+    Stream one table (or query, see incremental_query) into compressed chunk
+    files with COPY TO STDOUT.
+
+    Args:
+        conn: asyncpg connection, inside the backup's snapshot
+        job: Archive name, columns, mode, and optional query with its arguments
+        backup_path: Backup directory
+        copy_format: COPY format (see COPY_FORMATS)
+        compression: Chunk compression (see COMPRESSIONS)
+        progress: Progress of the running backup
+
+    Returns:
+        dict: Manifest entry of the table (mode, columns, rows, sizes, chunks)
+    """
+    name = job["name"]
+    progress.start_table(name)
+
+    writer = ArchiveTableWriter(backup_path, f"{name}{COPY_FORMATS[copy_format]}", compression, progress)
+    try:
+        if job["query"]:
+            status = await conn.copy_from_query(job["query"], *job["args"], output=writer.write, format=copy_format)
+        else:
+            status = await conn.copy_from_table(
+                name,
+                schema_name="public",
+                columns=job["columns"],
+                output=writer.write,
+                format=copy_format,
+            )
+        await writer.close()
+    except BaseException:
+        await writer.abort()
+        raise
+
+    rows = copy_row_count(status)
+    progress.finish_table(name, rows)
+    return {
+        "mode": job["mode"],
+        "columns": job["columns"],
+        "rows": rows,
+        "raw_bytes": writer.raw_bytes,
+        "size_bytes": writer.size_bytes,
+        "chunks": writer.chunks,
+    }
+
+
+async def dump_tables_in_snapshot(
+    engine,
+    snapshot_id: str,
+    pending: deque,
+    backup_path: Path,
+    copy_format: str,
+    compression: str,
+    table_info: Dict[str, Any],
+    progress: BackupProgress
+) -> None:
+    """
+    Backup worker: import the coordinator's snapshot on a connection of its own
+    and dump tables from the shared queue until it is empty.
+
+    Args:
+        engine: Async engine to take the worker connection from
+        snapshot_id: Snapshot exported by the coordinator with pg_export_snapshot()
+        pending: Queue of dump jobs (see dump_table)
+        backup_path: Backup directory
+        copy_format: COPY format (see COPY_FORMATS)
+        compression: Chunk compression (see COMPRESSIONS)
+        table_info: Table manifest entries collected by all workers
+        progress: Progress of the running backup
+    """
+    async with engine.connect() as connection:
+        raw_connection = await connection.get_raw_connection()
+        conn = raw_connection.driver_connection
+        async with conn.transaction(isolation="repeatable_read", readonly=True):
+            # the id comes from the server; SET does not take parameters
+            await conn.execute(f"SET TRANSACTION SNAPSHOT '{snapshot_id}'")
+            while pending:
+                job = pending.popleft()
+                table_info[job["name"]] = await dump_table(conn, job, backup_path, copy_format, compression, progress)
+
+
+def quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def match_columns(left: str, right: str, columns: List[str]) -> str:
+    """SQL condition equating the given columns of two aliases."""
+    return " AND ".join(f"{left}.{quote_ident(column)} = {right}.{quote_ident(column)}" for column in columns)
+
+
+def incremental_query(table_name: str, columns: List[str], created_column: str, primary_key: List[str]) -> str:
+    """
+    Query for the rows of a table created or updated since the high-water mark
+    passed as $1 (the table name is $2).
+
+    Created rows are found by created_column, updated ones by joining the
+    update entries of backup_row_changes on the primary key.
+
+    Args:
+        table_name: Table name
+        columns: Columns to select
+        created_column: Column holding the row's creation time
+        primary_key: Primary key columns
+
+    Returns:
+        str: SQL query
+    """
+    table = f"public.{quote_ident(table_name)}"
+    select_list = ", ".join(f"r.{quote_ident(column)}" for column in columns)
+    created = f"r.{quote_ident(created_column)}"
+    return f"""
+        SELECT {select_list} FROM {table} r
+        WHERE {created} >= $1::timestamptz
+        UNION ALL
+        SELECT {select_list}
+        FROM (
+            SELECT DISTINCT row_pk FROM public.backup_row_changes
+            WHERE table_name = $2 AND operation = 'U' AND changed_at >= $1::timestamptz
+        ) c
+        CROSS JOIN LATERAL jsonb_populate_record(NULL::{table}, c.row_pk) p
+        JOIN {table} r ON {match_columns("r", "p", primary_key)}
+        WHERE ({created} >= $1::timestamptz) IS NOT TRUE
+    """
+
+
+def fk_safe_order(tables: List[str], foreign_keys: List[Any]) -> List[str]:
+    """
+    Order tables so every table comes after the tables it references.
+
+    Self references are ignored. If the foreign keys form a cycle the tables are
+    returned in name order; the restore then relies on deferred checks.
+
+    Args:
+        tables: Table names to order
+        foreign_keys: (table_name, referenced_table) pairs
+
+    Returns:
+        list: Table names, referenced tables first
+    """
+    included = set(tables)
+    graph = {table: set() for table in tables}
+    for table_name, referenced_table in foreign_keys:
+        if table_name in included and referenced_table in included and table_name != referenced_table:
+            graph[table_name].add(referenced_table)
+
+    try:
+        return list(TopologicalSorter(graph).static_order())
+    except CycleError:
+        return sorted(tables)
+
+
+async def reset_sequences(conn, tables: List[str]) -> Dict[str, Optional[int]]:
+    """
+    Move every sequence feeding the given tables past the highest restored value.
+
+    Args:
+        conn: asyncpg connection
+        tables: Restored table names
+
+    Returns:
+        dict: Sequence name -> last value set (None when its tables are empty)
+    """
+    included = set(tables)
+    maximums: Dict[str, Optional[int]] = {}
+    for row in await conn.fetch(SEQUENCE_COLUMNS_QUERY):
+        if row["table_name"] not in included:
+            continue
+        column_max = await conn.fetchval(
+            f"SELECT MAX({quote_ident(row['column_name'])}) FROM public.{quote_ident(row['table_name'])}"
+        )
+        current = maximums.get(row["sequence_name"])
+        maximums[row["sequence_name"]] = column_max if current is None else max(current, column_max or current)
+
+    for sequence_name, last_value in maximums.items():
+        if last_value is None:
+            await conn.execute("SELECT setval($1::regclass, 1, false)", sequence_name)
+        else:
+            await conn.execute("SELECT setval($1::regclass, $2, true)", sequence_name, last_value)
+    return maximums
+
+
+async def get_derived_tables(conn) -> List[str]:
+    """Derived tables that exist in the database, see DERIVED_TABLES."""
+    return [
+        table_name for table_name in DERIVED_TABLES
+        if await conn.fetchval("SELECT to_regclass($1)", f"public.{table_name}")
+    ]
+
+
+async def rebuild_derived_tables(conn, derived_tables: List[str]) -> None:
+    """
+    Empty the derived tables after a restore and recompute service_ratings.
+
+    Also drops the copies restored from backups taken before these tables
+    were left out.
+
+    Args:
+        conn: asyncpg connection
+        derived_tables: Existing derived tables, from get_derived_tables()
+    """
+    if derived_tables:
+        await conn.execute("TRUNCATE " + ", ".join(f"public.{quote_ident(table_name)}" for table_name in derived_tables))
+    if "service_ratings" in derived_tables:
+        await conn.execute(REBUILD_SERVICE_RATINGS_QUERY)
 
 
 class BackupService:
@@ -29,6 +664,7 @@ class BackupService:
         """
         self.backup_dir = Path(backup_dir)
         self.backup_dir.mkdir(exist_ok=True, parents=True)
+        self.progress: Optional[BackupProgress] = None
         
     def _get_backup_path(self, backup_name: str) -> Path:
         """
@@ -45,114 +681,281 @@ class BackupService:
     async def create_postgresql_backup(
         self, 
         db_session: AsyncSession,
-        backup_name: Optional[str] = None
+        backup_name: Optional[str] = None,
+        workers: Optional[int] = None,
+        incremental: bool = False
     ) -> Dict[str, Any]:
         """
-        Create PostgreSQL backup using SQLAlchemy.
+        Create PostgreSQL backup with COPY.
+        
+        Streams every table with COPY TO STDOUT (format from
+        settings.backup_copy_format) into compressed chunk files (see
+        ArchiveTableWriter) so memory stays flat. A manifest.json records the
+        schema version (Alembic head), compression, and each table's columns,
+        row count and chunks with their SHA-256. The backup fails once it grows
+        past settings.max_backup_size_mb.
+        Creates a timestamped backup directory if backup_name is not provided.
         
-        Exports all tables from the database as SQL INSERT statements.
-        Creates a timestamped backup file if backup_name is not provided.
+        All tables are read from one REPEATABLE READ snapshot, so the backup is
+        consistent even under write traffic. With more than one worker the
+        session exports that snapshot and each worker dumps tables on its own
+        connection after importing it. Progress is available from self.progress.
+        
+        Every backup records a high-water mark. An incremental backup chains to
+        the newest backup and holds only what changed since its high-water
+        mark: rows of INCREMENTAL_TABLES created or updated since then, plus
+        the deletions from backup_row_changes; other tables are copied whole.
+        A full backup prunes change log entries older than
+        settings.backup_change_log_retention_days.
         
         Args:
             db_session: Async database session
-            backup_name: Optional backup file name (default: auto-generated with timestamp)
+            backup_name: Optional backup directory name (default: auto-generated with timestamp)
+            workers: Optional number of parallel connections (default: settings.backup_parallel_workers)
+            incremental: If True, back up only the changes since the newest backup
             
         Returns:
-            dict: Backup information including name, path, size, and creation time
+            dict: Backup information including name, path, tables, row counts, size, and creation time
             
         Raises:
-            HTTPException: 500 if backup creation fails
+            HTTPException: 
+                - 400 if the configured COPY format or compression is not supported,
+                  or an incremental backup has no usable parent backup
+                - 413 if the backup exceeds settings.max_backup_size_mb
+                - 500 if backup creation fails
         """
+        copy_format = settings.backup_copy_format
+        if copy_format not in COPY_FORMATS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unsupported backup format: {copy_format}"
+            )
+        compression = settings.backup_compression
+        if compression not in COMPRESSIONS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unsupported backup compression: {compression}"
+            )
+        get_compressor(compression)  # fail early if zstandard is missing
+
         if not backup_name:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_name = f"postgresql_backup_{timestamp}.sql"
+            backup_name = f"{PG_BACKUP_PREFIX}{timestamp}{'_incremental' if incremental else ''}"
         
+        parent_name, parent = self._get_latest_postgresql_backup() if incremental else (None, None)
+        if incremental and parent is None:
+            raise HTTPException(
+                status_code=400,
+                detail="No backup to base an incremental backup on; take a full backup first"
+            )
+
         backup_path = self._get_backup_path(backup_name)
+        backup_path.mkdir(exist_ok=True)
         
         try:
-            # Get all table names
-            result = await db_session.execute(
-                text("""
-                    SELECT tablename 
-                    FROM pg_tables 
-                    WHERE schemaname = 'public'
-                """)
-            )
-            tables = [row[0] for row in result.fetchall()]
+            # must be the first statement of the session's transaction
+            await db_session.execute(text("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY"))
+            conn = await get_driver_connection(db_session)
+            schema_version = await get_schema_version(conn)
+            high_water_mark = await conn.fetchval(HIGH_WATER_MARK_QUERY)
+            since = self._check_incremental_parent(parent_name, parent, schema_version, high_water_mark) if incremental else None
+            tables = await conn.fetch(BACKUP_TABLES_QUERY)
+            primary_keys = {row["table_name"]: list(row["columns"]) for row in await conn.fetch(PRIMARY_KEYS_QUERY)}
+
+            pending = deque()
+            for table in tables:
+                table_name, columns = table["table_name"], list(table["columns"])
+                created_column = INCREMENTAL_TABLES.get(table_name)
+                if since is not None and created_column in columns and table_name in primary_keys:
+                    query = incremental_query(table_name, columns, created_column, primary_keys[table_name])
+                    pending.append({"name": table_name, "mode": "incremental", "columns": columns, "query": query, "args": (since, table_name)})
+                else:
+                    pending.append({"name": table_name, "mode": "full", "columns": columns, "query": None, "args": ()})
+            if since is not None:
+                pending.append({"name": DELETIONS_ARCHIVE, "mode": "incremental", "columns": ["table_name", "row_pk"], "query": DELETIONS_QUERY, "args": (since,)})
+
+            workers = max(1, min(workers or settings.backup_parallel_workers, len(pending)))
+            progress = BackupProgress(backup_name, len(pending), workers, settings.max_backup_size_mb * 1024 * 1024)
+            self.progress = progress
+
+            table_info: Dict[str, Any] = {}
+            if workers == 1:
+                while pending:
+                    job = pending.popleft()
+                    table_info[job["name"]] = await dump_table(conn, job, backup_path, copy_format, compression, progress)
+            else:
+                # the coordinator keeps its transaction open until every worker is done
+                snapshot_id = await conn.fetchval("SELECT pg_export_snapshot()")
+                async with asyncio.TaskGroup() as group:
+                    for _ in range(workers):
+                        group.create_task(dump_tables_in_snapshot(
+                            db_session.bind, snapshot_id, pending, backup_path, copy_format, compression, table_info, progress
+                        ))
+
+            await db_session.rollback()
+            progress.finished = True
+            deletions = table_info.pop(DELETIONS_ARCHIVE, None)
+
+            manifest = {
+                "archive_version": ARCHIVE_FORMAT_VERSION,
+                "backup_name": backup_name,
+                "backup_type": "incremental" if incremental else "full",
+                "base_backup": (parent.get("base_backup") or parent_name) if incremental else None,
+                "parent_backup": parent_name,
+                "since": since.isoformat() if since else None,
+                "high_water_mark": high_water_mark.isoformat(),
+                "created_at": datetime.now().isoformat(),
+                "schema_version": schema_version,
+                "format": copy_format,
+                "compression": compression,
+                "chunk_size_mb": settings.backup_chunk_size_mb,
+                "workers": workers,
+                "tables": dict(sorted(table_info.items())),
+                "deletions": deletions,
+                "total_rows": sum(info["rows"] for info in table_info.values()),
+            }
+            with open(backup_path / MANIFEST_FILE, 'w') as f:
+                json.dump(manifest, f, indent=2)
+
+            if not incremental:
+                await self._prune_change_log(db_session)
             
-            with open(backup_path, 'w') as f:
-                f.write("-- PostgreSQL Backup\n")
-                f.write(f"-- Created at: {datetime.now().isoformat()}\n")
-                f.write("-- ===================================\n\n")
-                
-                # Backup each table
-                for table in tables:
-                    f.write(f"\n-- Table: {table}\n")
-                    f.write(f"DELETE FROM {table};\n")
-                    
-                    # Get column names
-                    col_result = await db_session.execute(
-                        text(f"""
-                            SELECT column_name 
-                            FROM information_schema.columns 
-                            WHERE table_name = '{table}' 
-                            ORDER BY ordinal_position
-                        """)
-                    )
-                    columns = [row[0] for row in col_result.fetchall()]
-                    
-                    if not columns:
-                        continue
-                    
-                    # Get data
-                    data_result = await db_session.execute(
-                        text(f"SELECT * FROM {table}")
-                    )
-                    rows = data_result.fetchall()
-                    
-                    if rows:
-                        for row in rows:
-                            values = []
-                            for val in row:
-                                if val is None:
-                                    values.append('NULL')
-                                elif isinstance(val, str):
-                                    # Escape single quotes
-                                    escaped = val.replace("'", "''")
-                                    values.append(f"'{escaped}'")
-                                elif isinstance(val, (int, float)):
-                                    values.append(str(val))
-                                elif isinstance(val, datetime):
-                                    values.append(f"'{val.isoformat()}'")
-                                else:
-                                    values.append(f"'{str(val)}'")
-                            
-                            values_str = ', '.join(values)
-                            columns_str = ', '.join(columns)
-                            f.write(
-                                f"INSERT INTO {table} ({columns_str}) "
-                                f"VALUES ({values_str});\n"
-                            )
-            
-            file_size = backup_path.stat().st_size
+            total_size = sum(
+                f.stat().st_size 
+                for f in backup_path.rglob('*') 
+                if f.is_file()
+            )
             
             return {
                 "success": True,
                 "backup_name": backup_name,
                 "backup_path": str(backup_path),
-                "size_bytes": file_size,
-                "size_mb": round(file_size / (1024 * 1024), 2),
-                "created_at": datetime.now().isoformat()
+                "tables": {name: info["rows"] for name, info in manifest["tables"].items()},
+                "total_rows": manifest["total_rows"],
+                "backup_type": manifest["backup_type"],
+                "base_backup": manifest["base_backup"],
+                "deleted_rows": deletions["rows"] if deletions else 0,
+                "schema_version": schema_version,
+                "compression": compression,
+                "workers": workers,
+                "duration_seconds": progress.snapshot()["elapsed_seconds"],
+                "size_bytes": total_size,
+                "size_mb": round(total_size / (1024 * 1024), 2),
+                "created_at": manifest["created_at"]
             }
             
         except Exception as e:
+            await db_session.rollback()
+            if isinstance(e, ExceptionGroup):
+                e = e.exceptions[0]
+            if self.progress is not None and self.progress.backup_name == backup_name:
+                self.progress.error = str(e)
             if backup_path.exists():
-                backup_path.unlink()
+                shutil.rmtree(backup_path)
+            if isinstance(e, HTTPException):
+                raise e
             raise HTTPException(
                 status_code=500,
                 detail=f"PostgreSQL backup failed: {str(e)}"
             )
     
+    def _read_manifest(self, backup_path: Path) -> Optional[Dict[str, Any]]:
+        manifest_file = backup_path / MANIFEST_FILE
+        if not backup_path.is_dir() or not manifest_file.exists():
+            return None
+        with open(manifest_file, 'r') as f:
+            return json.load(f)
+
+    def _get_postgresql_manifests(self) -> Dict[str, Dict[str, Any]]:
+        manifests = {}
+        for item in self.backup_dir.iterdir():
+            if item.name.startswith(PG_BACKUP_PREFIX):
+                manifest = self._read_manifest(item)
+                if manifest is not None:
+                    manifests[item.name] = manifest
+        return manifests
+
+    def _get_latest_postgresql_backup(self):
+        """Name and manifest of the newest PostgreSQL backup, (None, None) if there is none."""
+        manifests = self._get_postgresql_manifests()
+        if not manifests:
+            return None, None
+        name = max(manifests, key=lambda backup: manifests[backup]["created_at"])
+        return name, manifests[name]
+
+    def _check_incremental_parent(
+        self,
+        parent_name: str,
+        parent: Dict[str, Any],
+        schema_version: Optional[str],
+        high_water_mark: datetime
+    ) -> datetime:
+        """
+        Check that an incremental backup can chain to the given parent.
+        
+        Args:
+            parent_name: Name of the parent backup
+            parent: Manifest of the parent backup
+            schema_version: Current schema version of the database
+            high_water_mark: High-water mark of the new backup
+            
+        Returns:
+            datetime: High-water mark of the parent, where the increment starts
+            
+        Raises:
+            HTTPException: 400 if the parent is at another schema version, has
+                no high-water mark, is older than the change log retention, or
+                was taken before the last restore
+        """
+        restore = self._read_restore_marker()
+        if restore is not None and datetime.fromisoformat(parent["created_at"]) < datetime.fromisoformat(restore["restored_at"]):
+            raise HTTPException(
+                status_code=400,
+                detail=f"The database was restored from {restore['backup_name']} after the latest backup {parent_name}; take a full backup"
+            )
+        if parent.get("schema_version") != schema_version:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Latest backup {parent_name} is at another schema version; take a full backup"
+            )
+        if not parent.get("high_water_mark"):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Latest backup {parent_name} has no high-water mark; take a full backup"
+            )
+
+        since = datetime.fromisoformat(parent["high_water_mark"])
+        if high_water_mark - since > timedelta(days=settings.backup_change_log_retention_days):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Latest backup {parent_name} is older than the change log retention; take a full backup"
+            )
+        return since
+
+    def _read_restore_marker(self) -> Optional[Dict[str, Any]]:
+        marker_file = self.backup_dir / RESTORE_MARKER_FILE
+        if not marker_file.exists():
+            return None
+        with open(marker_file, 'r') as f:
+            return json.load(f)
+
+    def _write_restore_marker(self, backup_name: str) -> None:
+        with open(self.backup_dir / RESTORE_MARKER_FILE, 'w') as f:
+            json.dump({"backup_name": backup_name, "restored_at": datetime.now().isoformat()}, f, indent=2)
+
+    async def _prune_change_log(self, db_session: AsyncSession) -> None:
+        """Drop change log entries no incremental backup can need any more."""
+        try:
+            if await db_session.scalar(text("SELECT to_regclass('public.backup_row_changes')")):
+                await db_session.execute(
+                    text("DELETE FROM public.backup_row_changes WHERE changed_at < now() - make_interval(days => :days)"),
+                    {"days": settings.backup_change_log_retention_days}
+                )
+            await db_session.commit()
+        except Exception as e:
+            await db_session.rollback()
+            logger.error(f"Failed to prune the backup change log: {e}")
+
     async def create_mongodb_backup(
         self,
         mongo_client: AsyncIOMotorClient,
@@ -260,16 +1063,21 @@ class BackupService:
     async def create_full_backup(
         self,
         db_session: AsyncSession,
-        mongo_client: AsyncIOMotorDatabase
+        mongo_client: AsyncIOMotorDatabase,
+        workers: Optional[int] = None,
+        incremental: bool = False
     ) -> Dict[str, Any]:
         """
         Create backup for both PostgreSQL and MongoDB databases.
         
-        Creates backups for both databases with the same timestamp.
+        Creates backups for both databases with the same timestamp. The
+        MongoDB backup is always full.
         
         Args:
             db_session: Async database session for PostgreSQL
             mongo_client: MongoDB client or database instance
+            workers: Optional number of parallel PostgreSQL connections
+            incremental: If True, the PostgreSQL backup holds only the changes since the newest backup
             
         Returns:
             dict: Combined backup information for both databases
@@ -282,7 +1090,9 @@ class BackupService:
         # Create PostgreSQL backup
         pg_backup = await self.create_postgresql_backup(
             db_session,
-            f"postgresql_backup_{timestamp}.sql"
+            f"{PG_BACKUP_PREFIX}{timestamp}{'_incremental' if incremental else ''}",
+            workers,
+            incremental
         )
         
         # Create MongoDB backup
@@ -313,7 +1123,27 @@ class BackupService:
         mongodb_backups = []
         
         for item in self.backup_dir.iterdir():
-            if item.is_file() and item.suffix == '.sql':
+            if item.is_dir() and item.name.startswith(PG_BACKUP_PREFIX):
+                manifest = self._read_manifest(item)
+                if manifest is not None:
+                    total_size = sum(
+                        f.stat().st_size 
+                        for f in item.rglob('*') 
+                        if f.is_file()
+                    )
+
+                    postgresql_backups.append({
+                        "name": item.name,
+                        "path": str(item),
+                        "size_mb": round(total_size / (1024 * 1024), 2),
+                        "tables": {name: info["rows"] for name, info in manifest.get("tables", {}).items()},
+                        "total_rows": manifest.get("total_rows", 0),
+                        "backup_type": manifest.get("backup_type", "full"),
+                        "base_backup": manifest.get("base_backup"),
+                        "created_at": manifest.get("created_at")
+                    })
+            elif item.is_file() and item.suffix == '.sql':
+                # backups taken before the COPY format
                 postgresql_backups.append({
                     "name": item.name,
                     "path": str(item),
@@ -356,6 +1186,62 @@ class BackupService:
             )
         }
     
+    def _load_backup_chain(self, backup_name: str) -> List[Any]:
+        """
+        Resolve a backup into the chain to replay: its base full backup first,
+        then every incremental up to and including the backup itself.
+        
+        Args:
+            backup_name: Name of the backup directory
+            
+        Returns:
+            list: (backup path, manifest) pairs, base first
+            
+        Raises:
+            HTTPException: 
+                - 404 if the backup is not found
+                - 400 if it or a backup it builds on is missing or invalid
+        """
+        backup_path = self._get_backup_path(backup_name)
+        
+        if not backup_path.exists():
+            raise HTTPException(
+                status_code=404,
+                detail=f"Backup not found: {backup_name}"
+            )
+        
+        if backup_path.is_file():
+            # statements of the old INSERT format cannot be split safely on ';'
+            raise HTTPException(
+                status_code=400,
+                detail="Legacy .sql backups cannot be restored here; replay them with psql"
+            )
+
+        chain = []
+        name = backup_name
+        while name is not None:
+            path = self._get_backup_path(name)
+            manifest = self._read_manifest(path)
+            if manifest is None:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Invalid backup: manifest.json of {name} not found"
+                )
+            if manifest.get("archive_version") != ARCHIVE_FORMAT_VERSION:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Unsupported backup archive version: {manifest.get('archive_version')}"
+                )
+            if any(chained_name == name for chained_name, _, _ in chain):
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Invalid backup chain: {name} builds on itself"
+                )
+            chain.append((name, path, manifest))
+            name = manifest.get("parent_backup") if manifest.get("backup_type") == "incremental" else None
+
+        return [(path, manifest) for _, path, manifest in reversed(chain)]
+
     async def restore_postgresql_backup(
         self,
         db_session: AsyncSession,
@@ -364,66 +1250,201 @@ class BackupService:
         """
         Restore PostgreSQL database from backup.
         
-        Restores database by executing SQL statements from the backup file.
-        WARNING: This will delete all existing data in the database.
+        Truncates the backed up tables and streams their chunks back with COPY in
+        foreign key order, verifying every chunk's SHA-256 on the way. For an
+        incremental backup the base full backup is loaded first and every
+        incremental of the chain is then replayed (see _apply_incremental).
+        Everything runs in one transaction: any failure (including a checksum
+        mismatch) leaves the database untouched. Triggers are disabled for the
+        load when the role may set session_replication_role, deferrable
+        constraints are deferred, and sequences are moved past the restored
+        values afterwards. Derived tables (DERIVED_TABLES) are emptied and
+        service_ratings recomputed. The incremental change log is cleared and the
+        restore is recorded, so the next incremental backup is refused until a
+        full backup of the restored data is taken.
+        WARNING: This will delete all existing data in the backed up tables.
         
         Args:
             db_session: Async database session
-            backup_name: Name of the backup file to restore from
+            backup_name: Name of the backup directory to restore from
             
         Returns:
-            dict: Restore information including backup name and statements executed
+            dict: Restore information including rows, duration and rows/second per table
             
         Raises:
             HTTPException: 
-                - 404 if backup file is not found
+                - 404 if backup is not found
+                - 400 if backup is invalid (legacy .sql file, manifest.json not found,
+                  a missing backup in its chain, or taken at a different schema version)
                 - 500 if restore fails
         """
-        backup_path = self._get_backup_path(backup_name)
-        
-        if not backup_path.exists():
-            raise HTTPException(
-                status_code=404,
-                detail=f"Backup file not found: {backup_name}"
-            )
-        
+        chain = self._load_backup_chain(backup_name)
+        started = time.perf_counter()
+
+        conn = await get_driver_connection(db_session)
+        schema_version = await get_schema_version(conn)
+        for _, manifest in chain:
+            if schema_version != manifest["schema_version"]:
+                await db_session.rollback()
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Backup {manifest['backup_name']} is at schema version {manifest['schema_version']} but the database is at {schema_version}"
+                )
+
         try:
-            with open(backup_path, 'r') as f:
-                sql_content = f.read()
-            
-            # Split by statement and execute
-            statements = [
-                stmt.strip() 
-                for stmt in sql_content.split(';') 
-                if stmt.strip() and not stmt.strip().startswith('--')
-            ]
-            
-            executed = 0
-            for statement in statements:
-                if statement:
-                    try:
-                        await db_session.execute(text(statement))
-                    except Exception as e:
-                        if 'UndefinedColumn' in str(e):
-                            continue
-                        
-                    executed += 1
-            
+            # Skip triggers (change_seq bookkeeping, change log) and foreign key
+            # checks for the load; needs superuser or the SET privilege on the setting.
+            try:
+                async with db_session.begin_nested():
+                    await db_session.execute(text("SET LOCAL session_replication_role = replica"))
+                triggers_disabled = True
+            except DBAPIError:
+                triggers_disabled = False
+            await db_session.execute(text("SET CONSTRAINTS ALL DEFERRED"))
+
+            base_path, base = chain[0]
+            order = fk_safe_order(list(base["tables"]), await conn.fetch(FOREIGN_KEYS_QUERY))
+            primary_keys = {row["table_name"]: list(row["columns"]) for row in await conn.fetch(PRIMARY_KEYS_QUERY)}
+
+            stats: Dict[str, Dict[str, float]] = {}
+
+            def record(table_name: str, rows: int, seconds: float) -> None:
+                table_stats = stats.setdefault(table_name, {"rows": 0, "seconds": 0.0})
+                table_stats["rows"] += rows
+                table_stats["seconds"] += seconds
+
+            # derived tables reference restored ones and must be truncated with them
+            derived_tables = await get_derived_tables(conn)
+            truncated = order + [table_name for table_name in derived_tables if table_name not in order]
+            await conn.execute(
+                "TRUNCATE " + ", ".join(f"public.{quote_ident(table_name)}" for table_name in truncated)
+            )
+            for table_name in order:
+                table_started = time.perf_counter()
+                rows = await copy_archive_in(conn, base_path, base, base["tables"][table_name], table_name)
+                record(table_name, rows, time.perf_counter() - table_started)
+
+            for backup_path, manifest in chain[1:]:
+                await self._apply_incremental(conn, backup_path, manifest, order, primary_keys, record)
+
+            await rebuild_derived_tables(conn, derived_tables)
+            sequences = await reset_sequences(conn, order)
+
+            # The change log describes the replaced data. Incrementals must
+            # restart from a full backup of the restored data. The marker is
+            # written before the commit: if the commit fails it only forces an
+            # unneeded full backup.
+            if await conn.fetchval("SELECT to_regclass('public.backup_row_changes')"):
+                await conn.execute("TRUNCATE public.backup_row_changes")
+            self._write_restore_marker(backup_name)
             await db_session.commit()
-            
+
+            restored_tables = {
+                table_name: {
+                    "rows": int(table_stats["rows"]),
+                    "seconds": round(table_stats["seconds"], 3),
+                    "rows_per_second": round(table_stats["rows"] / table_stats["seconds"], 1) if table_stats["seconds"] > 0 else 0.0,
+                }
+                for table_name, table_stats in stats.items()
+            }
             return {
                 "success": True,
                 "backup_name": backup_name,
-                "statements_executed": executed,
+                "backups_applied": [manifest["backup_name"] for _, manifest in chain],
+                "tables_restored": restored_tables,
+                "total_rows": sum(info["rows"] for info in restored_tables.values()),
+                "sequences_reset": len(sequences),
+                "triggers_disabled": triggers_disabled,
+                "duration_seconds": round(time.perf_counter() - started, 3),
                 "restored_at": datetime.now().isoformat()
             }
-            
+
         except Exception as e:
             await db_session.rollback()
             raise HTTPException(
                 status_code=500,
                 detail=f"PostgreSQL restore failed: {str(e)}"
             )
+
+    async def _apply_incremental(
+        self,
+        conn,
+        backup_path: Path,
+        manifest: Dict[str, Any],
+        order: List[str],
+        primary_keys: Dict[str, List[str]],
+        record
+    ) -> None:
+        """
+        Replay one incremental backup on top of the restored data.
+        
+        Deletions are applied first, children before parents. Each table is
+        then loaded into a staging table and upserted on its primary key,
+        parents first; tables copied whole also lose the rows missing from the
+        copy. Rows captured again by overlapping increments are harmless.
+        
+        Args:
+            conn: asyncpg connection in the restore transaction
+            backup_path: Backup directory
+            manifest: Manifest of the incremental backup
+            order: Tables in foreign key order
+            primary_keys: Primary key columns per table
+            record: Callback collecting (table_name, rows, seconds) statistics
+        """
+        tables = manifest["tables"]
+
+        deletions = manifest.get("deletions")
+        if deletions and deletions["chunks"]:
+            await conn.execute("CREATE TEMP TABLE _restore_deletions (table_name varchar, row_pk jsonb) ON COMMIT DROP")
+            await copy_archive_in(conn, backup_path, manifest, deletions, "_restore_deletions", schema_name=None)
+            for table_name in reversed(order):
+                if tables.get(table_name, {}).get("mode") != "incremental":
+                    continue
+                table = f"public.{quote_ident(table_name)}"
+                await conn.execute(
+                    f"""
+                    DELETE FROM {table} r
+                    USING _restore_deletions d, jsonb_populate_record(NULL::{table}, d.row_pk) p
+                    WHERE d.table_name = $1 AND {match_columns("r", "p", primary_keys[table_name])}
+                    """,
+                    table_name
+                )
+            await conn.execute("DROP TABLE _restore_deletions")
+
+        for table_name in order:
+            info = tables.get(table_name)
+            if info is None:
+                continue
+
+            table_started = time.perf_counter()
+            table = f"public.{quote_ident(table_name)}"
+            columns = info["columns"]
+            column_list = ", ".join(quote_ident(column) for column in columns)
+            primary_key = primary_keys.get(table_name)
+
+            await conn.execute(f"CREATE TEMP TABLE _restore_rows ON COMMIT DROP AS SELECT {column_list} FROM {table} WITH NO DATA")
+            rows = await copy_archive_in(conn, backup_path, manifest, info, "_restore_rows", schema_name=None)
+
+            if info["mode"] == "full":
+                if primary_key:
+                    await conn.execute(
+                        f"DELETE FROM {table} r WHERE NOT EXISTS (SELECT 1 FROM _restore_rows s WHERE {match_columns('s', 'r', primary_key)})"
+                    )
+                else:
+                    await conn.execute(f"DELETE FROM {table}")
+
+            insert = f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM _restore_rows"
+            if primary_key:
+                updates = ", ".join(
+                    f"{quote_ident(column)} = EXCLUDED.{quote_ident(column)}"
+                    for column in columns if column not in primary_key
+                )
+                conflict_target = ", ".join(quote_ident(column) for column in primary_key)
+                insert += f" ON CONFLICT ({conflict_target}) " + (f"DO UPDATE SET {updates}" if updates else "DO NOTHING")
+            await conn.execute(insert)
+            await conn.execute("DROP TABLE _restore_rows")
+
+            record(table_name, rows, time.perf_counter() - table_started)
     
     async def restore_mongodb_backup(
         self,
@@ -538,7 +1559,7 @@ class BackupService:
         Args:
             db_session: Async database session for PostgreSQL
             mongo_client: MongoDB client or database instance
-            postgresql_backup: Name of the PostgreSQL backup file
+            postgresql_backup: Name of the PostgreSQL backup directory
             mongodb_backup: Name of the MongoDB backup directory
             
         Returns:
@@ -547,18 +1568,21 @@ class BackupService:
         Raises:
             HTTPException: 500 if restore fails for either database
         """
-        
-        # Restore PostgreSQL
-        pg_result = await self.restore_postgresql_backup(
-            db_session,
-            postgresql_backup
-        )
-        
-        # Restore MongoDB
-        mongo_result = await self.restore_mongodb_backup(
-            mongo_client,
-            mongodb_backup
-        )
+        try:
+            # Restore PostgreSQL
+            pg_result = await self.restore_postgresql_backup(
+                db_session,
+                postgresql_backup
+            )
+
+            # Restore MongoDB
+            mongo_result = await self.restore_mongodb_backup(
+                mongo_client,
+                mongodb_backup
+            )
+        finally:
+            # also after a failed MongoDB restore - PostgreSQL is already replaced
+            await self._invalidate_caches()
         
         return {
             "success": True,
@@ -567,6 +1591,14 @@ class BackupService:
             "restored_at": datetime.now().isoformat()
         }
     
+    async def _invalidate_caches(self) -> None:
+        """Drop the caches of restored data in this and every other worker."""
+        await bump_catalog_version()        # recommendations, catalog snapshot, price matrix
+        await publish_status_change()
+        await publish_settings_change()
+        content_cache.invalidate()
+        await publish_notification(CONTENT_CHANNEL)
+    
     def delete_backup(self, backup_name: str, backup_type: str) -> Dict[str, Any]:
         """
         Delete a backup file or directory.
@@ -581,6 +1613,7 @@ class BackupService:
         Raises:
             HTTPException: 
                 - 404 if backup is not found
+                - 400 if an incremental backup builds on it
                 - 500 if deletion fails
         """
         backup_path = self._get_backup_path(backup_name)
@@ -590,6 +1623,17 @@ class BackupService:
                 status_code=404,
                 detail=f"Backup not found: {backup_name}"
             )
+
+        if backup_type == "postgresql":
+            dependents = sorted(
+                name for name, manifest in self._get_postgresql_manifests().items()
+                if manifest.get("parent_backup") == backup_name
+            )
+            if dependents:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Incremental backups build on {backup_name}: {', '.join(dependents)}"
+                )
         
         try:
             if backup_path.is_dir():
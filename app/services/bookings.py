@@ -1,35 +1,39 @@
-from fastapi import HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
-from sqlalchemy import select, and_, desc, update, case
+from fastapi import HTTPException, BackgroundTasks, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from sqlalchemy import select, insert, and_, desc, update, delete, case, func, literal, literal_column, cast, Integer, BigInteger, Text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession as Session
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, aliased
 from sqlalchemy.exc import IntegrityError
-from typing import Dict, Set, Optional, List
-from datetime import datetime
+from pydantic import TypeAdapter
+from typing import Set, Optional, List
 from decimal import Decimal
-import math
+import asyncio
+import json
 
 from app.models import (
     Booking, BookedService, BookingRecommendation, BookingAssignment, Car,
     BookingProgress, BookingAnalysis, Address, Status, CustomerCar, AssignmentType,
     Mechanic, PaymentMethod, OnlinePayment, OfflinePayment, ServiceSelectionStage,
-    Service, Refund
+    Refund, Customer, Manufacturer, Area, Timeslot, BookingView
 )
 from app.schemas import (
     BookingCreate, MechanicAssignmentCreate, BookingProgressCreate,
     BookingAnalysisCreate, CustomerServiceSelection, BookingProgressUpdate,
-    BookingAnalysisUpdate, CashOnDelivery
+    BookingAnalysisUpdate, CashOnDelivery, BookingResponseDetailed
 )
-from app.services import crud, payment as payment_service, notification as notification_service, llm as llm_service
-from app.utilities.data_utils import get_gst_percent, get_validation_automation_status, get_analysis_validation_automation_status
-from app.core.config import settings
+from app.services import payment as payment_service, notification as notification_service, llm as llm_service, quote as quote_service
+from app.utilities.data_utils import get_gst_percent, get_gst_rate, get_validation_automation_status, get_analysis_validation_automation_status
 from app.core.assigment import select_mechanic_for_service, select_mechanic_for_pickup_drop_analysis
+from app.core.booking_state import BOOKING_TRANSITIONS, load_statuses, get_status_name, next_booking_status, transition_booking
+from app.core.events import booking_events, publish_booking_event
+from app.utilities.pagination import encode_cursor, decode_cursor
 
 
 # Helper Functions
 async def get_status_id_by_name(db: Session, status_name: str) -> int:
     """
-    Get status ID by status name.
+    Get status ID by status name from the cached status map.
     
     Args:
         db: Async database session
@@ -41,11 +45,11 @@ async def get_status_id_by_name(db: Session, status_name: str) -> int:
     Raises:
         HTTPException: 404 if status name is not found
     """
-    result = await db.execute(select(Status).where(Status.name == status_name))
-    status = result.scalar_one_or_none()
-    if not status:
+    status_ids = await load_statuses(db)
+    status_id = status_ids.get(status_name.lower())
+    if not status_id:
         raise HTTPException(status_code=404, detail=f"Status '{status_name}' not found")
-    return status.id
+    return status_id
 
 
 async def get_assignment_id_by_name(db: Session, assignment_name: str) -> int:
@@ -69,69 +73,100 @@ async def get_assignment_id_by_name(db: Session, assignment_name: str) -> int:
     return assignment.id
 
 
-async def get_or_create_address(db: Session, customer_id: str, address_id: Optional[int], address_data: Optional[Dict]) -> int:
+async def get_booking_context(db: Session, booking_data: BookingCreate):
     """
-    Get existing address or create a new one.
+    Fetch everything needed to validate and respond to a new booking in one query.
     
-    If address_id is provided, verifies it belongs to the customer and returns it.
-    If address_data is provided, creates a new address and returns its ID.
+    Joins the customer car (with owner, model, manufacturer and car class), the
+    existing pickup/drop addresses scoped to the car's owner, the areas of the
+    existing or new addresses, both timeslots and the 'booked' status id.
     
     Args:
         db: Async database session
-        customer_id: Customer ID to associate address with
-        address_id: Optional existing address ID
-        address_data: Optional dictionary with address data to create new address
+        booking_data: Booking creation data
         
     Returns:
-        int: Address ID
-        
-    Raises:
-        HTTPException: 
-            - 404 if address_id is provided but not found or doesn't belong to customer
-            - 400 if neither address_id nor address_data is provided
+        Row: Booking context row, or None if the customer car does not exist
     """
-    if address_id:
-        # Verify address belongs to customer
-        result = await db.execute(
-            select(Address).where(
-                and_(Address.id == address_id, Address.customer_id == customer_id)
-            )
+    PickupAddress, DropAddress = aliased(Address), aliased(Address)
+    PickupArea, DropArea = aliased(Area), aliased(Area)
+    PickupSlot, DropSlot = aliased(Timeslot), aliased(Timeslot)
+
+    pickup_area_id = booking_data.pickup_address.area_id if booking_data.pickup_address else None
+    drop_area_id = booking_data.drop_address.area_id if booking_data.drop_address else None
+
+    stmt = (
+        select(
+            CustomerCar.customer_id,
+            CustomerCar.reg_number,
+            Car.car_class_id,
+            Car.model,
+            Manufacturer.name.label("manufacturer"),
+            Customer.name.label("customer_name"),
+            Customer.phone.label("customer_phone"),
+            Customer.email.label("customer_email"),
+            PickupAddress.id.label("pickup_address_id"),
+            PickupAddress.line1.label("pickup_line1"),
+            PickupAddress.line2.label("pickup_line2"),
+            PickupArea.name.label("pickup_area"),
+            PickupArea.pincode.label("pickup_pincode"),
+            PickupSlot.name.label("pickup_timeslot"),
+            DropAddress.id.label("drop_address_id"),
+            DropAddress.line1.label("drop_line1"),
+            DropAddress.line2.label("drop_line2"),
+            DropArea.name.label("drop_area"),
+            DropArea.pincode.label("drop_pincode"),
+            DropSlot.name.label("drop_timeslot"),
+            select(Status.id).where(Status.name == "booked").scalar_subquery().label("booked_status_id"),
         )
-        address = result.scalar_one_or_none()
-        if not address:
-            raise HTTPException(status_code=404, detail="Address not found or doesn't belong to customer")
-        return address_id
-    
-    if address_data:
-        # Create new address
-        new_address = Address(customer_id=customer_id, **address_data)
-        db.add(new_address)
-        await db.flush()
-        await db.refresh(new_address)
-        return new_address.id
-    
-    raise HTTPException(status_code=400, detail="Either address_id or address data must be provided")
+        .join(Car, CustomerCar.car_model_id == Car.id)
+        .join(Manufacturer, Car.manufacturer_id == Manufacturer.id)
+        .join(Customer, CustomerCar.customer_id == Customer.id)
+        .outerjoin(PickupAddress, and_(
+            PickupAddress.id == literal(booking_data.pickup_address_id, Integer),
+            PickupAddress.customer_id == CustomerCar.customer_id,
+        ))
+        .outerjoin(PickupArea, PickupArea.id == func.coalesce(PickupAddress.area_id, literal(pickup_area_id, Integer)))
+        .outerjoin(PickupSlot, PickupSlot.id == literal(booking_data.pickup_timeslot_id, Integer))
+        .outerjoin(DropAddress, and_(
+            DropAddress.id == literal(booking_data.drop_address_id, Integer),
+            DropAddress.customer_id == CustomerCar.customer_id,
+        ))
+        .outerjoin(DropArea, DropArea.id == func.coalesce(DropAddress.area_id, literal(drop_area_id, Integer)))
+        .outerjoin(DropSlot, DropSlot.id == literal(booking_data.drop_timeslot_id, Integer))
+        .where(CustomerCar.id == booking_data.customer_car_id)
+    )
+    result = await db.execute(stmt)
+    return result.one_or_none()
 
 
-async def update_booking_status(db: Session, booking: Booking, status_name: str):
+def validate_booking_address(address_id: Optional[int], address_data, found_address_id: Optional[int], area_name: Optional[str]):
     """
-    Update booking status and set completion time if delivered.
+    Validate a pickup or drop address against the booking context.
     
     Args:
-        db: Async database session
-        booking: Booking instance to update
-        status_name: Name of the new status
+        address_id: Existing address ID from the request
+        address_data: New address data from the request
+        found_address_id: Address ID found for the customer, if any
+        area_name: Area name of the existing or new address, if the area exists
         
     Raises:
-        HTTPException: 400 if status name is invalid
+        HTTPException: 
+            - 404 if address_id is provided but not found or doesn't belong to customer
+            - 400 if the new address has an invalid area
+            - 400 if neither address_id nor address_data is provided
     """
-    status_id = await get_status_id_by_name(db, status_name)
-    if not status_id:
-        raise HTTPException(status_code=400, detail="Invalid booking status update.")
-    booking.status_id = status_id
-    if status_name == "delivered":
-        booking.completed_at = datetime.now()
-    await db.flush()
+    if address_id:
+        if found_address_id is None:
+            raise HTTPException(status_code=404, detail="Address not found or doesn't belong to customer")
+        return
+
+    if address_data:
+        if area_name is None:
+            raise HTTPException(status_code=400, detail="Invalid area for address")
+        return
+
+    raise HTTPException(status_code=400, detail="Either address_id or address data must be provided")
 
 
 async def get_booking_progress_history(db: Session, booking: Booking):
@@ -277,7 +312,7 @@ def get_customer_status_mapping(booking: Booking):
         "in-progress": "in-progress",
         "completed": "completed",
         "out for delivery": "completed",
-        "delivered": "delivered" if latest_update.validated else "completed",
+        "delivered": "delivered" if latest_update and latest_update.validated else "completed",
         "cancelled": "cancelled"
     }
 
@@ -353,7 +388,7 @@ async def add_cancellation_fee(db: Session, booking: Booking, cancellation_fee:
     result = await db.execute(select(PaymentMethod).where(PaymentMethod.name.ilike("offline")))
     payment_method_obj = result.scalar_one_or_none()
 
-    gst_rate = await get_gst_percent() * 0.01
+    gst_rate = float(await get_gst_rate())
     gst = cancellation_fee * gst_rate
 
     payment = OfflinePayment(
@@ -451,32 +486,35 @@ async def automated_progress_validation(db: Session, id: int, description: str,
 
 
 
-# common functions
-async def get_booking_by_id(db: Session, booking_id: int, payload: dict):
+# Booking read model
+booking_detail_adapter = TypeAdapter(BookingResponseDetailed)
+
+# current reference data epoch, bumped by invalidate_booking_views
+BOOKING_VIEW_EPOCH = literal_column("(SELECT last_value FROM booking_view_epoch)")
+
+
+async def build_booking_document(db: Session, booking_id: int, gst_percent):
     """
-    Get detailed booking information by ID with access control.
+    Build the booking detail document served by the booking detail endpoint.
     
-    Retrieves booking with all related entities (customer, car, addresses, progress, etc.)
-    and calculates pricing including GST. Returns customer-friendly status for customers.
+    Loads the booking with all related entities (customer, car, addresses, progress, etc.)
+    fresh from the database and calculates pricing including GST.
     
     Args:
         db: Async database session
-        booking_id: Booking ID to retrieve
-        payload: Token payload containing user_id and role
+        booking_id: Booking ID to build the document for
+        gst_percent: GST percent to compute totals with
         
     Returns:
-        dict: Detailed booking information with all related data
+        tuple: (booking, JSON-ready document, customer-facing status)
         
     Raises:
-        HTTPException: 
-            - 404 if booking is not found
-            - 403 if customer tries to access another customer's booking
+        HTTPException: 404 if booking is not found
     """
-    booking: Booking = await crud.get_one_record(
-        db=db,
-        model=Booking,
-        filters={"id": booking_id},
-        options=[
+    result = await db.execute(
+        select(Booking)
+        .where(Booking.id == booking_id)
+        .options(
             selectinload(Booking.customer),
             selectinload(Booking.customer_car).selectinload(CustomerCar.car).selectinload(Car.manufacturer),
             selectinload(Booking.status),
@@ -486,22 +524,20 @@ async def get_booking_by_id(db: Session, booking_id: int, payload: dict):
             selectinload(Booking.booking_progress).selectinload(BookingProgress.mechanic),
             selectinload(Booking.booking_progress).selectinload(BookingProgress.status),
             selectinload(Booking.booking_analysis).selectinload(BookingAnalysis.mechanic)
-        ]
+        )
+        .execution_options(populate_existing=True)
     )
-
+    booking = result.scalar_one_or_none()
     if not booking:
         raise HTTPException(status_code=404, detail="Booking not found.")
 
-    if payload.get("role") == 3 and (booking.customer_id != payload.get("user_id")):
-        raise HTTPException(status_code=403, detail="Operation not permitted. Trying to access data of other customers.")
-
     confirmed_status_id = await get_status_id_by_name(db, "confirmed")
 
     booked_services = [bs.service for bs in booking.booked_services if bs.status.name != "rejected"]
     total_est = sum(bs.est_price for bs in booking.booked_services)
     total_final = sum(bs.price for bs in booking.booked_services if bs.price and bs.status_id == confirmed_status_id) or None
     
-    gst_rate = Decimal(str(await get_gst_percent() * 0.01)) # 18% GST
+    gst_rate = Decimal(str(gst_percent * 0.01)) # 18% GST
     if total_final is not None:
         gst_amount = total_final * gst_rate
         total_final += gst_amount
@@ -513,7 +549,7 @@ async def get_booking_by_id(db: Session, booking_id: int, payload: dict):
 
     response = {
         "id": booking.id,
-        "status": get_customer_status_mapping(booking).get(booking.status.name.lower()) if payload.get("role") == 3 else booking.status.name,
+        "status": booking.status.name,
         "customer": booking.customer,
         "car": {
             "manufacturer": booking.customer_car.car.manufacturer.name,
@@ -551,7 +587,256 @@ async def get_booking_by_id(db: Session, booking_id: int, payload: dict):
         "payment_method": booking.payment_method.name if booking.payment_method else None
     }
 
-    return response
+    document = booking_detail_adapter.dump_python(
+        booking_detail_adapter.validate_python(response, from_attributes=True),
+        mode="json",
+    )
+    customer_status = get_customer_status_mapping(booking).get(booking.status.name.lower())
+
+    return booking, document, customer_status
+
+
+async def refresh_booking_view(db: Session, booking_id: int, gst_percent=None, notify: bool = True):
+    """
+    Rebuild the read model row of a booking within the caller's transaction.
+    
+    Called by booking write paths before they commit, so the detail endpoint
+    never serves a document older than the last committed write. Also
+    publishes a booking event to push subscribers, delivered on commit.
+    
+    Args:
+        db: Async database session
+        booking_id: Booking ID to rebuild
+        gst_percent: GST percent to compute totals with, fetched if not given
+        notify: Whether to publish a booking event
+        
+    Returns:
+        tuple: (customer_id, document, customer-facing status)
+    """
+    if gst_percent is None:
+        gst_percent = await get_gst_percent()
+
+    # read before the document's data, see invalidate_booking_views
+    ref_epoch = (await db.execute(select(BOOKING_VIEW_EPOCH))).scalar_one()
+    booking, document, customer_status = await build_booking_document(db, booking_id, gst_percent)
+
+    stmt = pg_insert(BookingView).values(
+        booking_id=booking.id,
+        customer_id=booking.customer_id,
+        document=document,
+        customer_status=customer_status,
+        gst_percent=str(gst_percent),
+        ref_epoch=ref_epoch,
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[BookingView.booking_id],
+            set_={
+                "customer_id": stmt.excluded.customer_id,
+                "document": stmt.excluded.document,
+                "customer_status": stmt.excluded.customer_status,
+                "gst_percent": stmt.excluded.gst_percent,
+                "ref_epoch": stmt.excluded.ref_epoch,
+                "updated_at": func.now(),
+            },
+        )
+    )
+
+    if notify:
+        await publish_booking_event(db, {
+            "booking_id": booking.id,
+            "customer_id": booking.customer_id,
+            "status": document["status"],
+            "customer_status": customer_status,
+            "updated_at": document["updated_at"],
+        })
+
+    return booking.customer_id, document, customer_status
+
+
+async def drop_customer_booking_views(db: Session, customer_id: str):
+    """
+    Drop the read model rows of a customer's bookings after customer-owned data
+    shown in them (profile, addresses, cars) changed. Rows are rebuilt on next read.
+    
+    Args:
+        db: Async database session
+        customer_id: Customer ID
+    """
+    await db.execute(delete(BookingView).where(BookingView.customer_id == customer_id))
+    await db.commit()
+
+
+async def invalidate_booking_views(db: Session):
+    """
+    Mark every booking read model row as stale after a committed write to
+    reference data shown in them (services, categories, mechanics, car
+    models, manufacturers, areas, timeslots, statuses).
+    
+    Bumps booking_view_epoch. Documents are stamped with the epoch read
+    before they were built, and get_booking_by_id rebuilds any row whose
+    stamp is not the current epoch, so a document built from data read
+    before this write's commit can never be served afterwards. Must be
+    called after the commit; nextval is not rolled back with the caller's
+    transaction.
+    
+    Args:
+        db: Async database session
+    """
+    await db.execute(select(func.nextval("booking_view_epoch")))
+
+
+# common functions
+async def get_booking_by_id(db: Session, booking_id: int, payload: dict):
+    """
+    Get detailed booking information by ID with access control.
+    
+    Served from the booking read model with a single primary key lookup; the
+    document is rebuilt only when missing, computed with an outdated GST or
+    built before the last reference data write. Ownership is checked before
+    any rebuild. Returns customer-friendly status for customers.
+    
+    Args:
+        db: Async database session
+        booking_id: Booking ID to retrieve
+        payload: Token payload containing user_id and role
+        
+    Returns:
+        Response: Pre-serialized detailed booking information
+        
+    Raises:
+        HTTPException: 
+            - 404 if booking is not found
+            - 403 if customer tries to access another customer's booking
+    """
+    as_customer = payload.get("role") == 3
+    gst_percent = await get_gst_percent()
+
+    document = BookingView.document
+    if as_customer:
+        document = document.op("||")(func.jsonb_build_object(literal_column("'status'"), BookingView.customer_status))
+
+    result = await db.execute(
+        select(
+            BookingView.customer_id,
+            BookingView.gst_percent,
+            (BookingView.ref_epoch == BOOKING_VIEW_EPOCH).label("current"),
+            cast(document, Text).label("body"),
+        )
+        .where(BookingView.booking_id == booking_id)
+    )
+    view = result.one_or_none()
+
+    if view is not None:
+        customer_id = view.customer_id
+    else:
+        customer_id = (await db.execute(select(Booking.customer_id).where(Booking.id == booking_id))).scalar_one_or_none()
+        if customer_id is None:
+            raise HTTPException(status_code=404, detail="Booking not found.")
+
+    if as_customer and (customer_id != payload.get("user_id")):
+        raise HTTPException(status_code=403, detail="Operation not permitted. Trying to access data of other customers.")
+
+    if view is not None and view.gst_percent == str(gst_percent) and view.current:
+        body = view.body
+    else:
+        _, document, customer_status = await refresh_booking_view(db, booking_id, gst_percent, notify=False)
+        await db.commit()
+        if as_customer:
+            document = {**document, "status": customer_status}
+        body = json.dumps(document)
+
+    return Response(content=body, media_type="application/json")
+
+
+# Booking event push
+SSE_HEARTBEAT_SECONDS = 15
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+async def booking_event_stream(request: Request, booking_id: Optional[int] = None, as_customer: bool = False):
+    """
+    Server-sent event stream of booking events for one booking or all bookings.
+    
+    Sends a comment line as heartbeat when idle so proxies keep the connection open.
+    Customers only receive their condensed status.
+    
+    Args:
+        request: Incoming request, used to detect client disconnects
+        booking_id: Booking ID to follow, or None for all bookings
+        as_customer: Whether to send the customer-facing event form
+        
+    Yields:
+        str: SSE formatted messages
+    """
+    queue = booking_events.subscribe(booking_id)
+    try:
+        yield "retry: 5000\n\n"
+        while not await request.is_disconnected():
+            try:
+                payload = await asyncio.wait_for(queue.get(), timeout=SSE_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"
+                continue
+
+            if as_customer:
+                event = json.loads(payload)
+                payload = json.dumps({
+                    "booking_id": event["booking_id"],
+                    "status": event["customer_status"],
+                    "updated_at": event["updated_at"],
+                })
+            yield f"event: booking\ndata: {payload}\n\n"
+    finally:
+        booking_events.unsubscribe(queue, booking_id)
+
+
+async def get_booking_event_stream(db: Session, request: Request, booking_id: int, payload: dict):
+    """
+    Open a push channel for status, progress and assignment changes of a booking.
+    
+    Args:
+        db: Async database session
+        request: Incoming request
+        booking_id: Booking ID to follow
+        payload: Token payload containing user_id and role
+        
+    Returns:
+        StreamingResponse: text/event-stream response
+        
+    Raises:
+        HTTPException: 
+            - 404 if booking is not found
+            - 403 if customer tries to follow another customer's booking
+    """
+    result = await db.execute(select(Booking.customer_id).where(Booking.id == booking_id))
+    customer_id = result.scalar_one_or_none()
+    if customer_id is None:
+        raise HTTPException(status_code=404, detail="Booking not found.")
+
+    as_customer = payload.get("role") == 3
+    if as_customer and customer_id != payload.get("user_id"):
+        raise HTTPException(status_code=403, detail="Operation not permitted. Trying to access data of other customers.")
+
+    # don't hold a pooled connection for the lifetime of the stream
+    await db.close()
+
+    return StreamingResponse(booking_event_stream(request, booking_id, as_customer), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
+async def get_admin_event_stream(db: Session, request: Request):
+    """
+    Open a push channel for changes of all bookings, for the admin dashboard.
+    
+    Args:
+        db: Async database session
+        request: Incoming request
+        
+    Returns:
+        StreamingResponse: text/event-stream response
+    """
+    await db.close()
+    return StreamingResponse(booking_event_stream(request), media_type="text/event-stream", headers=SSE_HEADERS)
 
 
 
@@ -560,9 +845,11 @@ async def create_booking(db: Session, booking_data: BookingCreate, payload: dict
     """
     Create a new booking for a customer.
     
-    Validates customer ownership of car, calculates required service time,
-    creates or uses existing addresses, and creates booking with booked services.
-    Sends booking confirmation notification.
+    Validates customer ownership of car, addresses and timeslots with a single
+    query, prices the services and calculates required service time from the
+    quote engine's price matrix, then writes new addresses, the booking and its
+    booked services with one bulk statement each. The response is built from
+    data already in hand. Sends booking confirmation notification.
     
     Args:
         db: Async database session
@@ -575,7 +862,8 @@ async def create_booking(db: Session, booking_data: BookingCreate, payload: dict
     Raises:
         HTTPException: 
             - 403 if user is not a customer or doesn't own the car
-            - 404 if service or car is not found
+            - 404 if service or address is not found
+            - 400 if a service is not priced for the car's class
             - 403 if insufficient time between pickup and drop dates
             - 400 if there's invalid data or foreign key constraint
     """
@@ -583,113 +871,133 @@ async def create_booking(db: Session, booking_data: BookingCreate, payload: dict
     if not customer_id or not customer_id.startswith("CST"):
         raise HTTPException(status_code=403, detail="Only customers can create bookings.")
     
-    # Verify customer owns the car
-    car = await db.get(CustomerCar, booking_data.customer_car_id)
-    if not car or car.customer_id != customer_id:
+    # Verify customer owns the car, addresses and timeslots in one round trip
+    context = await get_booking_context(db, booking_data)
+    if not context or context.customer_id != customer_id:
         raise HTTPException(status_code=403, detail="Car not found or doesn't belong to customer.")
     
+    # price services server-side from the price matrix, client supplied prices are not trusted
+    price_matrix = await quote_service.get_price_matrix(db)
+    quote = quote_service.compute_quote(price_matrix, context.car_class_id, booking_data.service_price.keys())
+
     # drop date pickup date proper time gap check to complete all services
-    hours_required = 0
-    for service_id, _ in booking_data.service_price.items():
-        service = await db.get(Service, service_id)
-        if not service:
-            raise HTTPException(status_code=404, detail="Service not found.")
-        hours_required += service.time_hrs
-    
-    working_hours = settings.working_hrs
-    days_required = math.ceil(hours_required / working_hours)
+    days_required = quote["days_required"]
     customer_booked_days = (booking_data.drop_date - booking_data.pickup_date).days
 
     if customer_booked_days < days_required:
         raise HTTPException(status_code=403, detail=f"{days_required} day(s) are required to complete all the booked services.")
 
-    
-    # Get or create addresses
-    pickup_address_id = await get_or_create_address(
-        db, customer_id, booking_data.pickup_address_id, 
-        booking_data.pickup_address.model_dump() if booking_data.pickup_address else None
-    )
-    drop_address_id = await get_or_create_address(
-        db, customer_id, booking_data.drop_address_id,
-        booking_data.drop_address.model_dump() if booking_data.drop_address else None
-    )
-    
-    # Get 'booked' status
-    booked_status_id = await get_status_id_by_name(db, "booked")
-    
-    # Create booking
-    booking = Booking(
-        customer_id=customer_id,
-        car_reg_number=car.reg_number,
-        status_id=booked_status_id,
-        pickup_address_id=pickup_address_id,
-        pickup_date=booking_data.pickup_date,
-        pickup_timeslot_id=booking_data.pickup_timeslot_id,
-        drop_address_id=drop_address_id,
-        drop_date=booking_data.drop_date,
-        drop_timeslot_id=booking_data.drop_timeslot_id
-    )
-    db.add(booking)
-    
+    validate_booking_address(booking_data.pickup_address_id, booking_data.pickup_address, context.pickup_address_id, context.pickup_area)
+    validate_booking_address(booking_data.drop_address_id, booking_data.drop_address, context.drop_address_id, context.drop_area)
+
+    if context.pickup_timeslot is None or context.drop_timeslot is None:
+        raise HTTPException(status_code=400, detail="Invalid timeslot")
+
+    if context.booked_status_id is None:
+        raise HTTPException(status_code=404, detail="Status 'booked' not found")
+
+    pickup_address = {"line1": context.pickup_line1, "line2": context.pickup_line2}
+    drop_address = {"line1": context.drop_line1, "line2": context.drop_line2}
+    pickup_address_id = booking_data.pickup_address_id
+    drop_address_id = booking_data.drop_address_id
+
     try:
-        await db.flush()
-        await db.refresh(booking)
+        # Create new addresses with a single INSERT ... RETURNING
+        new_addresses = []
+        if not pickup_address_id:
+            new_addresses.append(booking_data.pickup_address.model_dump())
+        if not drop_address_id:
+            new_addresses.append(booking_data.drop_address.model_dump())
+
+        if new_addresses:
+            result = await db.execute(
+                insert(Address).returning(Address.id, sort_by_parameter_order=True),
+                [{"customer_id": customer_id, **address} for address in new_addresses],
+            )
+            new_address_ids = iter(result.scalars().all())
+            if not pickup_address_id:
+                pickup_address_id = next(new_address_ids)
+                pickup_address = {"line1": booking_data.pickup_address.line1, "line2": booking_data.pickup_address.line2}
+            if not drop_address_id:
+                drop_address_id = next(new_address_ids)
+                drop_address = {"line1": booking_data.drop_address.line1, "line2": booking_data.drop_address.line2}
+
+        # Create booking
+        result = await db.execute(
+            insert(Booking)
+            .values(
+                customer_id=customer_id,
+                car_reg_number=context.reg_number,
+                status_id=context.booked_status_id,
+                pickup_address_id=pickup_address_id,
+                pickup_date=booking_data.pickup_date,
+                pickup_timeslot_id=booking_data.pickup_timeslot_id,
+                drop_address_id=drop_address_id,
+                drop_date=booking_data.drop_date,
+                drop_timeslot_id=booking_data.drop_timeslot_id
+            )
+            .returning(Booking.id, Booking.created_at)
+        )
+        booking_id, created_at = result.one()
+
+        # Create booked services with a single executemany
+        await db.execute(
+            insert(BookedService),
+            [
+                {
+                    "booking_id": booking_id,
+                    "service_id": quoted["service_id"],
+                    "status_id": context.booked_status_id,
+                    "est_price": quoted["price"],
+                    "price": None,
+                    "completed": False,
+                }
+                for quoted in quote["services"]
+            ],
+        )
+
+        await db.commit()
     except IntegrityError:
-        import traceback
-        traceback.print_exc()
         await db.rollback()
         raise HTTPException(status_code=400, detail="Invalid data or foreign key constraint")
-    
-    # Create booked services
-    booked_services = []
-    for service_id, est_price in booking_data.service_price.items():
-        booked_services.append(BookedService(
-            booking_id=booking.id,
-            service_id=service_id,
-            status_id=booked_status_id,
-            est_price=est_price,
-            price=None,
-            completed=False
-        ))
-    db.add_all(booked_services)
-    
-    await db.commit()
-    await db.refresh(booking)
 
     response = {
-        "id": booking.id,
-        "customer": booking.customer,
+        "id": booking_id,
+        "customer": {
+            "id": customer_id,
+            "name": context.customer_name,
+            "phone": context.customer_phone,
+            "email": context.customer_email,
+        },
         "car": {
-            "manufacturer": booking.customer_car.car.manufacturer.name,
-            "model": booking.customer_car.car.model,
-            "reg_no": booking.car_reg_number
+            "manufacturer": context.manufacturer,
+            "model": context.model,
+            "reg_no": context.reg_number
         },
         "pickup": {
-            "date": booking.pickup_date,
-            "timeslot": booking.pickup_timeslot.name,
+            "date": booking_data.pickup_date,
+            "timeslot": context.pickup_timeslot,
             "address": {
-                "line1": booking.pickup_address.line1,
-                "line2": booking.pickup_address.line2,
-                "area": booking.pickup_address.area.name,
-                "pincode": booking.pickup_address.area.pincode,
+                **pickup_address,
+                "area": context.pickup_area,
+                "pincode": context.pickup_pincode,
             }
         },
         "drop": {
-            "date": booking.drop_date,
-            "timeslot": booking.drop_timeslot.name,
+            "date": booking_data.drop_date,
+            "timeslot": context.drop_timeslot,
             "address": {
-                "line1": booking.drop_address.line1,
-                "line2": booking.drop_address.line2,
-                "area": booking.drop_address.area.name,
-                "pincode": booking.drop_address.area.pincode,
+                **drop_address,
+                "area": context.drop_area,
+                "pincode": context.drop_pincode,
             }
         },
-        "created_at": booking.created_at
+        "created_at": created_at
     }
 
     # Mechanic assignment and notification
-    background_tasks.add_task(automated_mechanic_assignment, db, booking.id, "pickup")
-    background_tasks.add_task(notification_service.send_booking_confirmation, db, booking.id)
+    background_tasks.add_task(automated_mechanic_assignment, db, booking_id, "pickup")
+    background_tasks.add_task(notification_service.send_booking_confirmation, db, booking_id)
 
     return response
 
@@ -783,7 +1091,7 @@ async def customer_confirm_services(db: Session, booking_id: int, selection: Cus
         raise HTTPException(status_code=403, detail="Booking not found or access denied.")
     
     # Check if booking is in 'analysed' status
-    valid_state = booking.status.name == "analysed"
+    valid_state = await get_status_name(db, booking.status_id) == "analysed"
     if valid_state:
         valid_state = booking.booking_analysis.validated
 
@@ -822,13 +1130,16 @@ async def customer_confirm_services(db: Session, booking_id: int, selection: Cus
         total_price += float(price)
 
     # Add GST
-    gst_rate = await get_gst_percent() * 0.01
+    gst_rate = float(await get_gst_rate())
     gst_amount = total_price * gst_rate
     total_with_gst = total_price + gst_amount
 
 
     # separate online and offline payments
     if payment_method == "online":
+        # claim the booking first so a concurrent confirmation can't create a second order
+        await transition_booking(db, booking, "select_services")
+
         # create razorpay order
         razorpay_order = await payment_service.create_razorpay_order(total_with_gst)
 
@@ -853,6 +1164,7 @@ async def customer_confirm_services(db: Session, booking_id: int, selection: Cus
         # update payment method
         booking.payment_method_id = selection.payment_method_id
 
+        await refresh_booking_view(db, booking.id)
         await db.commit()
 
         response = {
@@ -879,11 +1191,12 @@ async def customer_confirm_services(db: Session, booking_id: int, selection: Cus
         
         # Update booking status to 'in-progress'
         booking.payment_method_id = selection.payment_method_id
-        await update_booking_status(db, booking, "in-progress")
+        await transition_booking(db, booking, "confirm_services")
 
         # automated mechanic assignment
         background_tasks.add_task(automated_mechanic_assignment, db, booking.id, "service")
         
+        await refresh_booking_view(db, booking.id)
         await db.commit()
         
         return JSONResponse(content={"message": "Services confirmed successfully"})
@@ -917,7 +1230,7 @@ async def cancel_booking(db: Session, booking_id: int, payload: dict, background
         raise HTTPException(status_code=403, detail="Booking not found or access denied.")
     
 
-    current_booking_status = booking.status.name.lower()
+    current_booking_status = await get_status_name(db, booking.status_id)
     if current_booking_status == "cancelled":
         raise HTTPException(status_code=403, detail="Attempting invalid state transition.")
 
@@ -942,7 +1255,7 @@ async def cancel_booking(db: Session, booking_id: int, payload: dict, background
         if cancellation_fee < 100:
             cancellation_fee = 100
 
-        gst_rate = await get_gst_percent() * 0.01
+        gst_rate = float(await get_gst_rate())
         gst = cancellation_fee * gst_rate
         cancellation_fee_with_gst = cancellation_fee + gst
 
@@ -972,11 +1285,12 @@ async def cancel_booking(db: Session, booking_id: int, payload: dict, background
         cancellation_fee = 100
         cancellation_fee_with_gst = await add_cancellation_fee(db, booking, cancellation_fee)
 
-    await update_booking_status(db, booking, "cancelled")
+    await transition_booking(db, booking, "cancel")
 
     # automated mechanic assignment
     background_tasks.add_task(automated_mechanic_assignment, db, booking.id, "drop")
 
+    await refresh_booking_view(db, booking.id)
     await db.commit()
     
     return JSONResponse(content={
@@ -987,7 +1301,7 @@ async def cancel_booking(db: Session, booking_id: int, payload: dict, background
 
 
 # Admin Functions
-async def get_admin_dashboard_bookings(db: Session, payload: dict, status_id: Optional[int] = None, action_required_filter: Optional[str] = None):
+async def get_admin_dashboard_bookings(db: Session, payload: dict, status_id: Optional[int] = None, action_required_filter: Optional[str] = None, since: Optional[str] = None):
     """
     Get all bookings with action indicators for admin dashboard.
     
@@ -995,14 +1309,21 @@ async def get_admin_dashboard_bookings(db: Session, payload: dict, status_id: Op
     and determines what actions are required (assign mechanic, validate progress, etc.).
     Can filter by status and action_required type.
     
+    With a since cursor only bookings whose status, progress, analysis, assignments
+    or booked services changed after the cursor are returned, unfiltered so clients
+    can drop rows that no longer match their filters. An invalid or outdated cursor
+    falls back to a full resync.
+    
     Args:
         db: Async database session
         payload: Token payload containing role
         status_id: Optional status ID to filter bookings
         action_required_filter: Optional filter for action type ("assign", "validate", "none")
+        since: Optional change cursor from a previous response
         
     Returns:
-        list: List of booking summaries with action indicators
+        tuple: (list of booking summaries with action indicators, next change cursor,
+                True if the list is a full resync rather than changes since the cursor)
         
     Raises:
         HTTPException: 403 if user is not an admin
@@ -1011,6 +1332,26 @@ async def get_admin_dashboard_bookings(db: Session, payload: dict, status_id: Op
     if user_role in [2, 3]:
         raise HTTPException(status_code=403, detail="Insufficient Permissions.")
 
+    # The cursor holds the xmin of a snapshot taken before the read: every
+    # transaction not committed yet at that point has an ID >= xmin, so its
+    # rows are returned by the next refresh even when it commits after rows
+    # with a higher change_seq were already served. Rows may be sent twice.
+    result = await db.execute(select(
+        cast(cast(func.pg_snapshot_xmin(func.pg_current_snapshot()), Text), BigInteger),
+        func.max(Booking.change_seq),
+    ))
+    snapshot_xmin, latest_seq = result.one()
+    latest_seq = latest_seq or 0
+
+    since_xid = since_seq = None
+    if since is not None:
+        try:
+            since_xid, since_seq = (int(value) for value in decode_cursor(since, 2))
+        except (HTTPException, TypeError, ValueError):
+            since_xid = since_seq = None
+        if since_xid is not None and (since_xid > snapshot_xmin or since_seq > latest_seq):
+            since_xid = since_seq = None    # cursor from before a restore or sequence reset
+
     query = select(Booking).options(
         selectinload(Booking.customer),
         selectinload(Booking.customer_car).selectinload(CustomerCar.car).selectinload(Car.manufacturer),
@@ -1020,11 +1361,14 @@ async def get_admin_dashboard_bookings(db: Session, payload: dict, status_id: Op
         selectinload(Booking.booking_assignments).selectinload(BookingAssignment.mechanic)
     ).order_by(desc(Booking.created_at))
     
-    if status_id is not None:
+    if since_xid is not None:
+        query = query.where(Booking.change_xid >= since_xid)
+    elif status_id is not None:
         query = query.where(Booking.status_id == status_id)
     
     result = await db.execute(query)
     bookings = result.scalars().all()
+    next_seq = max([latest_seq] + [booking.change_seq for booking in bookings])
     
     dashboard_data = []
     for booking in bookings:
@@ -1141,11 +1485,11 @@ async def get_admin_dashboard_bookings(db: Session, payload: dict, status_id: Op
             "latest_assignment": latest_assignment
         })
         
-    if action_required_filter is not None:
+    if action_required_filter is not None and since_seq is None:
         action_required_filter = action_required_filter.lower()
         dashboard_data = [data for data in dashboard_data if data.get("action_required") == action_required_filter]
     
-    return dashboard_data
+    return dashboard_data, encode_cursor([snapshot_xmin, next_seq]), since_xid is None
 
 
 async def assign_mechanic(db: Session, assignment_data: MechanicAssignmentCreate):
@@ -1187,7 +1531,7 @@ async def assign_mechanic(db: Session, assignment_data: MechanicAssignmentCreate
 
     # fetch assignment type name
     assignment_type = await db.get(AssignmentType, assignment_data.assignment_type_id)
-    current_booking_status = await db.get(Status, booking.status_id)
+    current_booking_status = await get_status_name(db, booking.status_id)
 
     if not assignment_type or not current_booking_status:
         raise HTTPException(status_code=404, detail="Assignment type not found or Booking is in invalid state.")
@@ -1213,25 +1557,16 @@ async def assign_mechanic(db: Session, assignment_data: MechanicAssignmentCreate
         raise HTTPException(status_code=404, detail="Mechanic is not qualified for pickup or drop.")
     
     # check valid status transition
-    current_booking_status_name = current_booking_status.name.lower()
-    
-    if assignment_type_name == "pickup" and current_booking_status_name == 'booked':
-        await update_booking_status(db, booking, "pickup")
-
-    elif assignment_type_name == "analysis" and current_booking_status_name == 'received':
-        await update_booking_status(db, booking, "analysis")
-    
-    elif assignment_type_name == "service" and current_booking_status_name == 'in-progress':
-        pass
-
-    elif assignment_type_name == "drop" and current_booking_status_name == 'completed':
-        await update_booking_status(db, booking, "out for delivery")
+    action = f"assign_{assignment_type_name}"
+    if action not in BOOKING_TRANSITIONS:
+        raise HTTPException(status_code=400, detail="Attempting invalid state transition")
 
-    elif assignment_type_name == "drop" and current_booking_status_name == 'cancelled' and booking.payment_method_id is not None and not await cancelled_drop_assigned(db, booking.id):
-        pass
+    # returning the car of a cancelled booking - only if it was received and not already assigned
+    if action == "assign_drop" and current_booking_status == "cancelled":
+        if booking.payment_method_id is None or await cancelled_drop_assigned(db, booking.id):
+            raise HTTPException(status_code=400, detail="Attempting invalid state transition")
 
-    else:
-        raise HTTPException(status_code=400, detail="Attempting invalid state transition")
+    await transition_booking(db, booking, action)
     
     assigned_status_id = await get_status_id_by_name(db, "assigned")
     
@@ -1247,6 +1582,7 @@ async def assign_mechanic(db: Session, assignment_data: MechanicAssignmentCreate
 
     mechanic.assigned = True
     
+    await refresh_booking_view(db, assignment_data.booking_id)
     await db.commit()
     await db.refresh(assignment)
     
@@ -1349,11 +1685,8 @@ async def create_progress_update(db: Session, progress_data: BookingProgressCrea
         if not latest_progress.validated:
             raise HTTPException(status_code=404, detail="Already updated progress.")
     
-    current_booking_status = booking.status.name.lower()
-    valid_states = ["pickup", "in-progress", "out for delivery", "cancelled"]
-
-    if current_booking_status not in valid_states:
-        raise HTTPException(status_code=400, detail="Attempting invalid state transition.")
+    current_booking_status = await get_status_name(db, booking.status_id)
+    next_booking_status("progress", current_booking_status)
     
 
     # Mark services as completed
@@ -1391,11 +1724,7 @@ async def create_progress_update(db: Session, progress_data: BookingProgressCrea
     db.add(progress)
 
     # Update booking status based on current status
-    if current_booking_status == "pickup":
-        await update_booking_status(db, booking, "received")
-
-    elif current_booking_status == "out for delivery":
-        await update_booking_status(db, booking, "delivered")
+    await transition_booking(db, booking, "progress")
     
     # Update assignment status to completed
     result = await db.execute(
@@ -1416,6 +1745,7 @@ async def create_progress_update(db: Session, progress_data: BookingProgressCrea
     mechanic = await db.get(Mechanic, mechanic_id)
     mechanic.assigned = False
     
+    await refresh_booking_view(db, progress_data.booking_id)
     await db.commit()
     await db.refresh(progress)
 
@@ -1463,9 +1793,7 @@ async def create_analysis(db: Session, analysis_data: BookingAnalysisCreate, pay
         if sorted_assignments[0].mechanic_id != mechanic_id:
             raise HTTPException(status_code=403, detail="Trying to access other mechanic assignments.")
     
-    current_booking_status = booking.status.name.lower()
-    if current_booking_status != "analysis":
-        raise HTTPException(status_code=400, detail="Attempting invalid state transition")
+    next_booking_status("analyse", await get_status_name(db, booking.status_id))
     
     # check price quote given for all booked services
     given_service_ids = set(analysis_data.price_quote.keys())
@@ -1531,7 +1859,7 @@ async def create_analysis(db: Session, analysis_data: BookingAnalysisCreate, pay
         db.add_all(recommendations)
     
     # Update booking status to 'analysed'
-    await update_booking_status(db, booking, "analysed")
+    await transition_booking(db, booking, "analyse")
     
     # Update assignment to completed
     result = await db.execute(
@@ -1552,6 +1880,7 @@ async def create_analysis(db: Session, analysis_data: BookingAnalysisCreate, pay
     mechanic = await db.get(Mechanic, mechanic_id)
     mechanic.assigned = False
 
+    await refresh_booking_view(db, analysis_data.booking_id)
     await db.commit()
     await db.refresh(analysis)
 
@@ -1772,7 +2101,7 @@ async def validate_progress(db: Session, progress_id: int, background_tasks: Bac
         # if all services are completed, change booking to completed state
         confirmed_status_id = await get_status_id_by_name(db, "confirmed")
         if check_all_booked_services_completed(booked_services, confirmed_status_id):
-            await update_booking_status(db, progress.booking, "completed")
+            await transition_booking(db, progress.booking, "complete_services")
 
             # automated mechanic assignment
             next_assignment = "drop"
@@ -1794,6 +2123,7 @@ async def validate_progress(db: Session, progress_id: int, background_tasks: Bac
     if next_assignment:
         background_tasks.add_task(automated_mechanic_assignment, db, progress.booking.id, next_assignment)
     
+    await refresh_booking_view(db, progress.booking_id)
     await db.commit()
 
     background_tasks.add_task(notification_service.send_progress_update, db, progress.booking_id, progress)
@@ -1870,6 +2200,7 @@ async def validate_analysis(db: Session, booking_id: int):
     
     analysis.validated = True
     
+    await refresh_booking_view(db, booking_id)
     await db.commit()
     
     return JSONResponse(content={"message": "Analysis validated and sent to customer"})
@@ -1952,11 +2283,12 @@ async def confirm_booking_webhook(db: Session, order_id: str, payment_id: str, s
     await confirm_selected_services(db, booking, set(selection.selected_services), confirmed_status_id, rejected_status_id)
     
     # Update booking status to 'in-progress'
-    await update_booking_status(db, booking, "in-progress")
+    await transition_booking(db, booking, "confirm_services")
     
     # automated mechanic assignment
     background_tasks.add_task(automated_mechanic_assignment, db, booking.id, "service")
        
+    await refresh_booking_view(db, booking.id)
     await db.commit()
 
     background_tasks.add_task(notification_service.send_invoice, db, booking.id)
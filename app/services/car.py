@@ -3,9 +3,11 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession as Session
 from app.models import CustomerCar
 from app.services import crud
-from app.schemas import CustomerCarUpdate, CustomerCarCreate
+from app.schemas import CustomerCarUpdate, CustomerCarCreate, CustomerCarResponse
+from app.utilities.listing import list_response
+from typing import Optional
 
-async def get_customer_cars(db: Session, payload: dict, customer_id: str):
+async def get_customer_cars(db: Session, payload: dict, customer_id: str, limit: Optional[int] = None, cursor: Optional[str] = None):
     """
     Get customer car(s) with access control.
     
@@ -16,9 +18,11 @@ async def get_customer_cars(db: Session, payload: dict, customer_id: str):
         db: Async database session
         payload: Token payload containing user_id and role
         customer_id: Optional customer ID to filter by
+        limit: Optional page size; without it all records are streamed
+        cursor: Optional cursor from the previous page's X-Next-Cursor header
         
     Returns:
-        list: List of CustomerCar instances
+        Response: Page or stream of customer cars
         
     Raises:
         HTTPException: 403 if customer tries to access another customer's cars
@@ -34,7 +38,7 @@ async def get_customer_cars(db: Session, payload: dict, customer_id: str):
         if user_id.startswith("CST"):
             filters = {"customer_id": user_id}
 
-    return await crud.get_all_records(db, CustomerCar, filters=filters)
+    return await list_response(db, CustomerCar, CustomerCarResponse, limit, cursor, filters=filters)
 
 
 async def get_customer_car_by_id(customer_car_id: int, db: Session, payload: dict):
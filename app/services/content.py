@@ -1,6 +1,79 @@
+import asyncio
 from datetime import datetime
-from app.models import Content
+from typing import List, Optional, Tuple
 from fastapi import HTTPException
+from pydantic import TypeAdapter
+from pymongo import UpdateOne
+from app.core.events import publish_notification
+from app.models import Content
+from app.schemas import ContentResposne
+from app.utilities.etag import make_etag
+
+# Postgres channel announcing that content was changed; every worker drops its
+# cached content listing when it is notified.
+CONTENT_CHANNEL = "content"
+
+contents_adapter = TypeAdapter(List[ContentResposne])
+
+
+class ContentSnapshot:
+    """Immutable, pre-serialized content listing with its ETag."""
+    __slots__ = ("version", "body", "etag")
+
+    def __init__(self, version: int, body: bytes):
+        self.version = version
+        self.body = body
+        self.etag = make_etag(body)
+
+
+class ContentCache:
+    """
+    Per-worker cache of the serialized content listing.
+
+    Every content write bumps the version (locally and, through NOTIFY on
+    CONTENT_CHANNEL, in every other worker) so the next read rebuilds it.
+    """
+
+    def __init__(self):
+        self._snapshot: Optional[ContentSnapshot] = None
+        self._version = 0
+        self._lock = asyncio.Lock()
+
+    def invalidate(self, payload: Optional[str] = None) -> None:
+        """Drop the cached listing; also used as the notification callback."""
+        self._version += 1
+        self._snapshot = None
+
+    async def get(self, db) -> ContentSnapshot:
+        """
+        Get the cached listing, building it on first use or after a change.
+
+        Concurrent requests after a write wait for a single rebuild.
+
+        Args:
+            db: MongoDB database session
+
+        Returns:
+            ContentSnapshot: Pre-serialized content listing
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+
+        async with self._lock:
+            if self._snapshot is not None:
+                return self._snapshot
+
+            version = self._version
+            contents = contents_adapter.validate_python(await get_contents(db))
+            snapshot = ContentSnapshot(version, contents_adapter.dump_json(contents))
+            # an invalidation during the load means the result may already be stale
+            if version == self._version:
+                self._snapshot = snapshot
+            return snapshot
+
+
+content_cache = ContentCache()
 
 async def get_content_by_content_id(db, content_id: str):
     """
@@ -33,7 +106,7 @@ async def get_contents(db):
         List[Content]: List of all Content document
         
     """
-    contents = db.content.find()
+    contents = db.content.find({}, {"_id": 0, "content_id": 1, "data": 1}).sort("content_id", 1)
     return [
         {
             "content_id": item["content_id"],
@@ -43,12 +116,27 @@ async def get_contents(db):
     ]
 
 
+async def get_contents_serialized(db) -> Tuple[bytes, str]:
+    """
+    Get all content documents, pre-serialized from the per-worker cache.
+
+    Args:
+        db: MongoDB database session
+
+    Returns:
+        tuple: (body, etag)
+    """
+    snapshot = await content_cache.get(db)
+    return snapshot.body, snapshot.etag
+
+
 async def update_content_bulk(db, updates: dict, payload: dict):
     """
     Update multiple content items by content_id.
     
-    Updates or creates content items based on content_id. Creates new items
-    if they don't exist (upsert).
+    Updates or creates content items based on content_id in a single
+    bulk_write. Creates new items if they don't exist (upsert). The cached
+    content listing is invalidated in every worker.
     
     Args:
         db: MongoDB database session
@@ -59,24 +147,37 @@ async def update_content_bulk(db, updates: dict, payload: dict):
     Returns:
         list: List of update results with content_id and status
     """
-    results = []
-
-    for content_id, new_data in updates.items():
-        result = await db.content.update_one(
-            {"content_id": content_id},
-            {
-                "$set": {
-                    "data": new_data,
-                    "updated_by": payload.get("user_id"),
-                    "updated_at": datetime.utcnow(),
-                }
-            },
-            upsert=True,
-        )
-
-        results.append({
-            "content_id": content_id,
-            "status": "updated" if result.modified_count else "created"
-        })
+    if not updates:
+        return []
+
+    content_ids = list(updates)
+    now = datetime.utcnow()
+    result = await db.content.bulk_write(
+        [
+            UpdateOne(
+                {"content_id": content_id},
+                {
+                    "$set": {
+                        "data": updates[content_id],
+                        "updated_by": payload.get("user_id"),
+                        "updated_at": now,
+                    }
+                },
+                upsert=True,
+            )
+            for content_id in content_ids
+        ],
+        ordered=False,
+    )
 
-    return results
+    content_cache.invalidate()
+    await publish_notification(CONTENT_CHANNEL)
+
+    # upserted_ids is keyed by the index of the operation that inserted
+    return [
+        {
+            "content_id": content_id,
+            "status": "created" if index in result.upserted_ids else "updated"
+        }
+        for index, content_id in enumerate(content_ids)
+    ]
@@ -1,10 +1,65 @@
 from fastapi import HTTPException
-from sqlalchemy import select, and_
+from sqlalchemy import select, insert, update, delete, and_, tuple_, inspect
 from sqlalchemy.orm import InstrumentedAttribute
 from sqlalchemy.ext.asyncio import AsyncSession as Session
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm.strategy_options import _AbstractLoad
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, AsyncIterator, Callable, Awaitable
+from app.utilities.pagination import encode_cursor, decode_cursor
+
+# Maximum number of rows accepted by one bulk call
+MAX_BULK_ROWS = 1000
+
+def apply_filters(query, model: Any, filters: Optional[Dict[str, Any]] = None):
+    """
+    Apply field:value filters to a select; list values become IN filters.
+    
+    Args:
+        query: Select statement
+        model: SQLAlchemy model class
+        filters: Optional dictionary of field:value pairs to filter by
+        
+    Returns:
+        Select: Filtered select statement
+    """
+    if filters:
+        for field_name, value in filters.items():
+            if hasattr(model, field_name):
+                field = getattr(model, field_name)
+                if isinstance(value, (list, tuple, set)):
+                    query = query.where(field.in_(value))
+                else:
+                    query = query.where(field == value)
+    return query
+
+def get_primary_key(model: Any) -> List[InstrumentedAttribute]:
+    """
+    Get the primary key attributes of a model.
+    
+    Args:
+        model: SQLAlchemy model class
+        
+    Returns:
+        list: Model attributes of the primary key, in column order
+    """
+    mapper = inspect(model)
+    return [getattr(model, mapper.get_property_by_column(column).key) for column in mapper.primary_key]
+
+def get_sort_key(model: Any, order_by: Optional[InstrumentedAttribute] = None) -> List[InstrumentedAttribute]:
+    """
+    Get a unique sort key for a model: the order_by attribute followed by the primary key.
+    
+    Args:
+        model: SQLAlchemy model class
+        order_by: Optional model attribute to order by first
+        
+    Returns:
+        list: Model attributes forming a unique sort key
+    """
+    key = get_primary_key(model)
+    if order_by is not None and not any(order_by is attr for attr in key):
+        key.insert(0, order_by)
+    return key
 
 async def get_all_records(
         db: Session,
@@ -39,14 +94,7 @@ async def get_all_records(
         query = query.options(*options)
 
     # Apply filters dynamically
-    if filters:
-        for field_name, value in filters.items():
-            if hasattr(model, field_name):
-                field = getattr(model, field_name)
-                if isinstance(value, (list, tuple, set)):
-                    query = query.where(field.in_(value))
-                else:
-                    query = query.where(field == value)
+    query = apply_filters(query, model, filters)
 
     # Apply sorting
     if order_by is not None:
@@ -61,6 +109,127 @@ async def get_all_records(
     result = await db.execute(query)
     return result.scalars().all()
 
+async def get_page(
+        db: Session,
+        model: Any,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        order_by: Optional[InstrumentedAttribute] = None,
+        desc: bool = False,
+        options: Optional[List[_AbstractLoad]] = None,
+    ) -> Tuple[List[Any], Optional[str]]:
+    """
+    Retrieve one page of records using keyset (seek) pagination.
+    
+    Rows are ordered by order_by and then the primary key, and each page starts
+    right after the sort key of the previous page's last row, so deep pages
+    cost the same as the first one. order_by should be a non-nullable column.
+    
+    Args:
+        db: Async database session
+        model: SQLAlchemy model class
+        filters: Optional dictionary of field:value pairs to filter by
+        limit: Maximum number of records to return
+        cursor: Optional cursor returned with the previous page
+        order_by: Optional model attribute to order by (defaults to primary key order)
+        desc: If True, order descending; if False, order ascending
+        options: Optional list of SQLAlchemy loading options (selectinload, joinedload, etc.)
+        
+    Returns:
+        tuple: (list of model instances, cursor of the next page or None on the last page)
+        
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    sort_key = get_sort_key(model, order_by)
+
+    query = apply_filters(select(model), model, filters)
+    if options:
+        query = query.options(*options)
+
+    if cursor is not None:
+        values = decode_cursor(cursor, len(sort_key))
+        row = tuple_(*sort_key)
+        query = query.where(row < tuple_(*values) if desc else row > tuple_(*values))
+
+    query = query.order_by(*[attr.desc() if desc else attr.asc() for attr in sort_key]).limit(limit + 1)
+
+    result = await db.execute(query)
+    records = result.scalars().all()
+
+    next_cursor = None
+    if len(records) > limit:
+        records = records[:limit]
+        next_cursor = encode_cursor([getattr(records[-1], attr.key) for attr in sort_key])
+
+    return records, next_cursor
+
+async def stream_records(
+        db: Session,
+        model: Any,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[InstrumentedAttribute] = None,
+        desc: bool = False,
+        options: Optional[List[_AbstractLoad]] = None,
+        chunk_size: int = 500,
+    ) -> AsyncIterator[List[Any]]:
+    """
+    Stream all matching records in chunks from a server-side cursor.
+    
+    Only one chunk is held in memory at a time; eager loads run per chunk.
+    
+    Args:
+        db: Async database session
+        model: SQLAlchemy model class
+        filters: Optional dictionary of field:value pairs to filter by
+        order_by: Optional model attribute to order by (defaults to primary key order)
+        desc: If True, order descending; if False, order ascending
+        options: Optional list of SQLAlchemy loading options (selectinload, joinedload, etc.)
+        chunk_size: Number of records per chunk
+        
+    Yields:
+        list: Chunk of model instances
+    """
+    sort_key = get_sort_key(model, order_by)
+
+    query = apply_filters(select(model), model, filters)
+    if options:
+        query = query.options(*options)
+    query = query.order_by(*[attr.desc() if desc else attr.asc() for attr in sort_key])
+
+    result = await db.stream_scalars(query.execution_options(yield_per=chunk_size))
+    try:
+        async for chunk in result.partitions():
+            yield chunk
+            # drop the chunk from the identity map so memory stays flat
+            for record in chunk:
+                db.expunge(record)
+    finally:
+        await result.close()
+
+async def stream_rows(db: Session, query, chunk_size: int = 1000) -> AsyncIterator[List[Any]]:
+    """
+    Stream the rows of a column select in chunks from a server-side cursor.
+
+    Unlike stream_records no ORM instances or relationship loads are involved,
+    which makes it the cheaper choice for flat exports.
+
+    Args:
+        db: Async database session
+        query: Select statement of plain columns
+        chunk_size: Number of rows per chunk
+
+    Yields:
+        list: Chunk of Row objects
+    """
+    result = await db.stream(query.execution_options(yield_per=chunk_size))
+    try:
+        async for chunk in result.partitions():
+            yield chunk
+    finally:
+        await result.close()
+
 async def get_one_record(
     db: Session,
     model: Any,
@@ -189,6 +358,80 @@ async def delete_record_by_primary_key(db: Session, pk, model):
 
     return {"detail": f"{model.__name__} deleted successfully."}
 
+def get_column_attributes(model: Any) -> List[InstrumentedAttribute]:
+    """Get the column-mapped attributes of a model (no relationships)."""
+    return [getattr(model, prop.key) for prop in inspect(model).column_attrs]
+
+async def update_row_by_primary_key(db: Session, pk, new_data: dict, model) -> dict:
+    """
+    Update a record by its primary key with a single UPDATE ... RETURNING.
+
+    Fast path for flat reference data: nothing is loaded into the session and
+    the returned row is handed to the response schema as a dictionary, so
+    relationships are not available on the result.
+
+    Args:
+        db: Async database session
+        pk: Primary key value
+        new_data: Dictionary of field:value pairs to update
+        model: SQLAlchemy model class
+
+    Returns:
+        dict: Updated record's columns, keyed by attribute name
+
+    Raises:
+        HTTPException:
+            - 404 if record is not found
+            - 400 if the update violates a constraint
+    """
+    pk_attr = get_primary_key(model)[0]
+    attrs = get_column_attributes(model)
+    values = {key: value for key, value in new_data.items() if hasattr(model, key)}
+
+    if values:
+        query = update(model).where(pk_attr == pk).values(**values).returning(*attrs).execution_options(synchronize_session=False)
+    else:
+        query = select(*attrs).where(pk_attr == pk)
+
+    try:
+        result = await db.execute(query)
+        row = result.one_or_none()
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=integrity_error_detail(e))
+
+    if row is None:
+        raise HTTPException(status_code=404, detail=f"{model.__name__} not found.")
+    return {attr.key: value for attr, value in zip(attrs, row)}
+
+async def delete_row_by_primary_key(db: Session, pk, model) -> dict:
+    """
+    Delete a record by its primary key with a single DELETE ... RETURNING.
+
+    Fast path for reference data: the record is not loaded first, so only
+    database ON DELETE rules apply, not ORM-side relationship cascades.
+
+    Args:
+        db: Async database session
+        pk: Primary key value
+        model: SQLAlchemy model class
+
+    Returns:
+        dict: Success message
+
+    Raises:
+        HTTPException: 404 if record is not found
+    """
+    pk_attr = get_primary_key(model)[0]
+    result = await db.execute(delete(model).where(pk_attr == pk).returning(pk_attr).execution_options(synchronize_session=False))
+    if result.scalar_one_or_none() is None:
+        await db.rollback()
+        raise HTTPException(status_code=404, detail=f"{model.__name__} not found.")
+
+    await db.commit()
+    return {"detail": f"{model.__name__} deleted successfully."}
+
 async def update_record_by_composite_key(db: Session, pk: dict, new_data: dict, model):
     """
     Update a record by its composite primary key.
@@ -250,3 +493,214 @@ async def delete_record_by_composite_key(db: Session, pk: dict, model):
     await db.commit()
 
     return {"detail": f"{model.__name__} deleted successfully."}
+
+
+def check_bulk_size(rows: List[Any]) -> None:
+    if len(rows) > MAX_BULK_ROWS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_ROWS} rows can be sent in one bulk request.")
+
+def primary_key_clause(pk_attrs: List[InstrumentedAttribute], pks: List[tuple]):
+    """Build a `pk IN (...)` clause; composite keys compare as row values."""
+    if len(pk_attrs) == 1:
+        return pk_attrs[0].in_([pk[0] for pk in pks])
+    return tuple_(*pk_attrs).in_(pks)
+
+def integrity_error_detail(error: IntegrityError) -> str:
+    """Get the database's explanation of an integrity error, e.g. which key is missing or duplicated."""
+    cause = getattr(error.orig, "__cause__", None)
+    return getattr(cause, "detail", None) or "Integrity constraint violated."
+
+async def find_failing_rows(db: Session, rows: List[Any], execute_row: Callable[[Any], Awaitable[Any]]) -> List[dict]:
+    """
+    Re-run a failed bulk write row by row, each in a savepoint, to report which rows fail.
+    
+    The whole transaction is rolled back afterwards; nothing is written.
+    
+    Args:
+        db: Async database session, after the failed bulk statement was rolled back
+        rows: Rows of the bulk call
+        execute_row: Coroutine function executing the write of one row
+        
+    Returns:
+        list: {"index", "detail"} for every failing row
+    """
+    errors = []
+    try:
+        for index, row in enumerate(rows):
+            try:
+                async with db.begin_nested():
+                    await execute_row(row)
+            except IntegrityError as e:
+                errors.append({"index": index, "detail": integrity_error_detail(e)})
+    finally:
+        await db.rollback()
+
+    # the conflicting row may have been changed concurrently since the bulk attempt
+    return errors or [{"index": None, "detail": "Integrity constraint violated, please retry."}]
+
+async def get_records_by_primary_keys(db: Session, model: Any, pks: List[tuple]) -> List[Any]:
+    """
+    Retrieve records by primary key, in the order of the keys given.
+    
+    Args:
+        db: Async database session
+        model: SQLAlchemy model class
+        pks: Primary key tuples
+        
+    Returns:
+        list: Model instances
+    """
+    if not pks:
+        return []
+
+    pk_attrs = get_primary_key(model)
+    result = await db.execute(select(model).where(primary_key_clause(pk_attrs, pks)))
+    records = {tuple(getattr(record, attr.key) for attr in pk_attrs): record for record in result.scalars().all()}
+    return [records[pk] for pk in pks if pk in records]
+
+async def bulk_create_records(db: Session, rows: List[dict], model) -> List[Any]:
+    """
+    Create many records with a single multi-row INSERT ... RETURNING in one transaction.
+    
+    Either all rows are created or none are; when the insert fails every
+    offending row is reported with its index in the request.
+    
+    Args:
+        db: Async database session
+        rows: Dictionaries of field:value pairs, one per new record
+        model: SQLAlchemy model class
+        
+    Returns:
+        list: Created model instances, in request order
+        
+    Raises:
+        HTTPException:
+            - 400 if too many rows are sent
+            - 400 with a list of {"index", "detail"} if any row violates a constraint
+    """
+    check_bulk_size(rows)
+    if not rows:
+        return []
+
+    pk_attrs = get_primary_key(model)
+    try:
+        result = await db.execute(insert(model).returning(*pk_attrs, sort_by_parameter_order=True), rows)
+        pks = [tuple(row) for row in result.all()]
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        errors = await find_failing_rows(db, rows, lambda row: db.execute(insert(model).values(**row)))
+        raise HTTPException(status_code=400, detail=errors)
+
+    return await get_records_by_primary_keys(db, model, pks)
+
+async def bulk_update_records(db: Session, rows: List[dict], model) -> List[Any]:
+    """
+    Update many records by primary key in one transaction.
+    
+    Each row carries the primary key fields plus the fields to change. The
+    target rows are locked and checked with one SELECT, then written with a
+    single executemany UPDATE bound per row.
+    
+    Args:
+        db: Async database session
+        rows: Dictionaries of primary key and field:value pairs, one per record
+        model: SQLAlchemy model class
+        
+    Returns:
+        list: Updated model instances, in request order
+        
+    Raises:
+        HTTPException:
+            - 400 if too many rows are sent, or a row lacks its primary key
+            - 404 with a list of {"index", "detail"} for rows that do not exist
+            - 400 with a list of {"index", "detail"} if any row violates a constraint
+    """
+    check_bulk_size(rows)
+    if not rows:
+        return []
+
+    pk_attrs = get_primary_key(model)
+    pk_keys = [attr.key for attr in pk_attrs]
+
+    missing_keys = [{"index": index, "detail": "Primary key is required."} for index, row in enumerate(rows) if any(row.get(key) is None for key in pk_keys)]
+    if missing_keys:
+        raise HTTPException(status_code=400, detail=missing_keys)
+
+    # drop fields the model does not have, like the single-row update does
+    rows = [{key: value for key, value in row.items() if hasattr(model, key)} for row in rows]
+    pks = [tuple(row[key] for key in pk_keys) for row in rows]
+
+    result = await db.execute(select(*pk_attrs).where(primary_key_clause(pk_attrs, pks)).with_for_update())
+    found = {tuple(row) for row in result.all()}
+    not_found = [{"index": index, "detail": f"{model.__name__} not found."} for index, pk in enumerate(pks) if pk not in found]
+    if not_found:
+        await db.rollback()
+        raise HTTPException(status_code=404, detail=not_found)
+
+    def update_row(row: dict):
+        values = {key: value for key, value in row.items() if key not in pk_keys}
+        return db.execute(update(model).where(*[attr == row[attr.key] for attr in pk_attrs]).values(**values))
+
+    try:
+        # ORM bulk UPDATE by primary key: one executemany per distinct set of fields
+        await db.execute(update(model), rows)
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        errors = await find_failing_rows(db, rows, update_row)
+        raise HTTPException(status_code=400, detail=errors)
+
+    return await get_records_by_primary_keys(db, model, pks)
+
+async def bulk_delete_records(db: Session, pks: List[Any], model):
+    """
+    Delete many records with a single DELETE ... WHERE pk IN (...) in one transaction.
+    
+    Either all records are deleted or none are. Relationship cascades defined
+    only on the ORM side are not run; database ON DELETE rules apply.
+    
+    Args:
+        db: Async database session
+        pks: Primary key values; dictionaries of primary key fields for composite keys
+        model: SQLAlchemy model class
+        
+    Returns:
+        dict: Success message
+        
+    Raises:
+        HTTPException:
+            - 400 if too many keys are sent
+            - 404 with a list of {"index", "detail"} for records that do not exist
+            - 400 with a list of {"index", "detail"} if a record is still referenced
+    """
+    check_bulk_size(pks)
+    if not pks:
+        return {"detail": f"No {model.__name__} records deleted."}
+
+    pk_attrs = get_primary_key(model)
+    pks = [tuple(pk[attr.key] for attr in pk_attrs) if isinstance(pk, dict) else (pk,) for pk in pks]
+
+    def delete_row(pk: tuple):
+        return db.execute(delete(model).where(*[attr == value for attr, value in zip(pk_attrs, pk)]))
+
+    try:
+        result = await db.execute(
+            delete(model)
+            .where(primary_key_clause(pk_attrs, pks))
+            .returning(*pk_attrs)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = {tuple(row) for row in result.all()}
+    except IntegrityError:
+        await db.rollback()
+        errors = await find_failing_rows(db, pks, delete_row)
+        raise HTTPException(status_code=400, detail=errors)
+
+    not_found = [{"index": index, "detail": f"{model.__name__} not found."} for index, pk in enumerate(pks) if pk not in deleted]
+    if not_found:
+        await db.rollback()
+        raise HTTPException(status_code=404, detail=not_found)
+
+    await db.commit()
+    return {"detail": f"{len(deleted)} {model.__name__} records deleted successfully."}
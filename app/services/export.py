@@ -0,0 +1,180 @@
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from datetime import date, timedelta
+from sqlalchemy import select, literal, null, union_all
+from sqlalchemy.ext.asyncio import AsyncSession as Session
+from typing import Optional
+
+from app.models import Booking, Customer, Status, PaymentMethod, OnlinePayment, OfflinePayment, NotificationLog, NotificationCategory
+from app.utilities.export import export_response
+
+
+def check_admin(payload: dict) -> None:
+    if payload.get("role") in [2, 3]:
+        raise HTTPException(status_code=403, detail="Insufficient Permissions.")
+
+
+def apply_date_range(query, column, from_date: Optional[date], to_date: Optional[date]):
+    """Restrict a query to rows whose column falls within [from_date, to_date] (whole days)."""
+    if from_date is not None:
+        query = query.where(column >= from_date)
+    if to_date is not None:
+        query = query.where(column < to_date + timedelta(days=1))
+    return query
+
+
+async def export_bookings(
+        db: Session,
+        payload: dict,
+        format: str = "ndjson",
+        status_id: Optional[int] = None,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+    ) -> StreamingResponse:
+    """
+    Export bookings as NDJSON or CSV, one flat row per booking.
+
+    Args:
+        db: Async database session
+        payload: Token payload containing role
+        format: "ndjson" or "csv"
+        status_id: Optional status ID to filter by
+        from_date: Optional first creation date to include
+        to_date: Optional last creation date to include
+
+    Returns:
+        StreamingResponse: Streamed export
+
+    Raises:
+        HTTPException: 403 if user is not an admin
+    """
+    check_admin(payload)
+
+    query = (
+        select(
+            Booking.id,
+            Booking.customer_id,
+            Customer.name.label("customer_name"),
+            Customer.email.label("customer_email"),
+            Booking.car_reg_number,
+            Status.name.label("status"),
+            Booking.pickup_date,
+            Booking.pickup_timeslot_id,
+            Booking.drop_date,
+            Booking.drop_timeslot_id,
+            PaymentMethod.name.label("payment_method"),
+            Booking.created_at,
+            Booking.completed_at,
+            Booking.updated_at,
+        )
+        .join(Customer, Customer.id == Booking.customer_id)
+        .join(Status, Status.id == Booking.status_id)
+        .outerjoin(PaymentMethod, PaymentMethod.id == Booking.payment_method_id)
+        .order_by(Booking.id)
+    )
+    if status_id:
+        query = query.where(Booking.status_id == status_id)
+    query = apply_date_range(query, Booking.created_at, from_date, to_date)
+
+    return export_response(db, query, format, "bookings")
+
+
+async def export_payments(
+        db: Session,
+        payload: dict,
+        format: str = "ndjson",
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+    ) -> StreamingResponse:
+    """
+    Export online (Razorpay) and offline (cash on delivery) payments as NDJSON or CSV.
+
+    Args:
+        db: Async database session
+        payload: Token payload containing role
+        format: "ndjson" or "csv"
+        from_date: Optional first payment date to include
+        to_date: Optional last payment date to include
+
+    Returns:
+        StreamingResponse: Streamed export
+
+    Raises:
+        HTTPException: 403 if user is not an admin
+    """
+    check_admin(payload)
+
+    online = apply_date_range(
+        select(
+            literal("online").label("payment_type"),
+            OnlinePayment.id,
+            OnlinePayment.booking_id,
+            Status.name.label("status"),
+            OnlinePayment.amount,
+            OnlinePayment.gst,
+            OnlinePayment.razorpay_order_id,
+            OnlinePayment.razorpay_payment_id,
+            literal(True).label("paid_online"),
+            OnlinePayment.created_at,
+        ).join(Status, Status.id == OnlinePayment.status_id),
+        OnlinePayment.created_at, from_date, to_date,
+    )
+    offline = apply_date_range(
+        select(
+            literal("offline").label("payment_type"),
+            OfflinePayment.id,
+            OfflinePayment.booking_id,
+            Status.name.label("status"),
+            OfflinePayment.amount,
+            OfflinePayment.gst,
+            null().label("razorpay_order_id"),
+            null().label("razorpay_payment_id"),
+            OfflinePayment.paid_online,
+            OfflinePayment.created_at,
+        ).join(Status, Status.id == OfflinePayment.status_id),
+        OfflinePayment.created_at, from_date, to_date,
+    )
+
+    payments = union_all(online, offline).subquery()
+    query = select(payments).order_by(payments.c.created_at, payments.c.payment_type, payments.c.id)
+
+    return export_response(db, query, format, "payments")
+
+
+async def export_notification_logs(
+        db: Session,
+        format: str = "ndjson",
+        notification_category: Optional[int] = None,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+    ) -> StreamingResponse:
+    """
+    Export notification logs as NDJSON or CSV, oldest first.
+
+    Args:
+        db: Async database session
+        format: "ndjson" or "csv"
+        notification_category: Optional notification category ID to filter by
+        from_date: Optional first date to include
+        to_date: Optional last date to include
+
+    Returns:
+        StreamingResponse: Streamed export
+    """
+    query = (
+        select(
+            NotificationLog.id,
+            NotificationCategory.name.label("category"),
+            NotificationLog.recipient_email,
+            NotificationLog.subject,
+            NotificationLog.attachments,
+            NotificationLog.timestamp,
+        )
+        .join(NotificationCategory, NotificationCategory.id == NotificationLog.notification_category_id)
+        .order_by(NotificationLog.id)
+    )
+    if notification_category:
+        query = query.where(NotificationLog.notification_category_id == notification_category)
+    query = apply_date_range(query, NotificationLog.timestamp, from_date, to_date)
+
+    return export_response(db, query, format, "notification_logs")
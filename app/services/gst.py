@@ -1,6 +1,6 @@
 from datetime import datetime
 from fastapi import HTTPException
-from datetime import datetime
+from app.core.settings_cache import publish_settings_change
 
 async def update_gst(db, new_percent: str, payload: dict):
     """
@@ -26,6 +26,8 @@ async def update_gst(db, new_percent: str, payload: dict):
         upsert=True,
     )
 
+    await publish_settings_change()
+
     status = "updated" if result.matched_count else "created"
 
     return {
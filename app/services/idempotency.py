@@ -0,0 +1,221 @@
+import asyncio
+import hashlib
+from datetime import timedelta
+from fastapi import HTTPException
+from sqlalchemy import select, delete, update, or_, and_, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession as Session
+from typing import Dict, Optional, Tuple
+
+from app.models import IdempotencyKey
+from app.core.config import settings
+from app.database.dependencies import db_session
+
+# Requests in this worker waiting on a key another request is executing.
+# Duplicates served by other workers fall back to polling the table.
+_waiters: Dict[Tuple[str, str], asyncio.Event] = {}
+
+
+def hash_request(method: str, path: str, query: str, body: bytes) -> str:
+    """
+    Fingerprint a request so a key reused with a different payload can be rejected.
+
+    Args:
+        method: HTTP method
+        path: Request path
+        query: Raw query string
+        body: Raw request body
+
+    Returns:
+        str: Hex sha256 digest
+    """
+    digest = hashlib.sha256()
+    for part in (method.encode(), path.encode(), query.encode()):
+        digest.update(part)
+        digest.update(b"\0")
+    digest.update(body)
+    return digest.hexdigest()
+
+
+async def acquire_key(db: Session, user_id: str, key: str, request_hash: str) -> bool:
+    """
+    Claim an idempotency key for execution.
+
+    Expired records and in-progress records older than the lock timeout
+    (left behind by a crashed worker) are cleared before claiming.
+
+    Args:
+        db: Async database session
+        user_id: ID of the user sending the request
+        key: Idempotency-Key header value
+        request_hash: Fingerprint of the request
+
+    Returns:
+        bool: True if this request owns the key and must execute
+    """
+    await db.execute(
+        delete(IdempotencyKey)
+        .where(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key)
+        .where(or_(
+            IdempotencyKey.expires_at < func.now(),
+            and_(
+                IdempotencyKey.status_code.is_(None),
+                IdempotencyKey.created_at < func.now() - timedelta(seconds=settings.idempotency_lock_timeout_seconds),
+            ),
+        ))
+    )
+    result = await db.execute(
+        pg_insert(IdempotencyKey)
+        .values(
+            user_id=user_id,
+            key=key,
+            request_hash=request_hash,
+            expires_at=func.now() + timedelta(hours=settings.idempotency_key_ttl_hours),
+        )
+        .on_conflict_do_nothing(index_elements=[IdempotencyKey.user_id, IdempotencyKey.key])
+        .returning(IdempotencyKey.key)
+    )
+    acquired = result.scalar_one_or_none() is not None
+    await db.commit()
+
+    if acquired:
+        _waiters[(user_id, key)] = asyncio.Event()
+    return acquired
+
+
+async def get_key_record(db: Session, user_id: str, key: str):
+    """
+    Get the stored state of an idempotency key.
+
+    Args:
+        db: Async database session
+        user_id: ID of the user sending the request
+        key: Idempotency-Key header value
+
+    Returns:
+        Row | None: (request_hash, status_code, media_type, response_body) or None
+    """
+    result = await db.execute(
+        select(
+            IdempotencyKey.request_hash,
+            IdempotencyKey.status_code,
+            IdempotencyKey.media_type,
+            IdempotencyKey.response_body,
+        )
+        .where(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key)
+    )
+    return result.one_or_none()
+
+
+def _notify(user_id: str, key: str) -> None:
+    event = _waiters.pop((user_id, key), None)
+    if event is not None:
+        event.set()
+
+
+async def complete_key(db: Session, user_id: str, key: str, status_code: int, media_type: Optional[str], body: bytes) -> None:
+    """
+    Store the response of a finished request for replay.
+
+    Args:
+        db: Async database session
+        user_id: ID of the user sending the request
+        key: Idempotency-Key header value
+        status_code: Response status code
+        media_type: Response content type
+        body: Raw response body
+    """
+    try:
+        await db.execute(
+            update(IdempotencyKey)
+            .where(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key)
+            .values(status_code=status_code, media_type=media_type, response_body=body)
+        )
+        await db.commit()
+    finally:
+        _notify(user_id, key)
+
+
+async def release_key(db: Session, user_id: str, key: str) -> None:
+    """
+    Drop a claimed key so the request can be retried, e.g. after a server error.
+
+    Args:
+        db: Async database session
+        user_id: ID of the user sending the request
+        key: Idempotency-Key header value
+    """
+    try:
+        await db.execute(
+            delete(IdempotencyKey)
+            .where(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key, IdempotencyKey.status_code.is_(None))
+        )
+        await db.commit()
+    finally:
+        _notify(user_id, key)
+
+
+async def wait_for_key(user_id: str, key: str, request_hash: str):
+    """
+    Wait for the request that owns a key to finish and return its stored response.
+
+    Waiters in the same worker are woken as soon as the owner finishes; the
+    table is also polled with exponential backoff for owners in other workers.
+    Each poll uses its own short session so no connection is held while waiting.
+
+    Args:
+        user_id: ID of the user sending the request
+        key: Idempotency-Key header value
+        request_hash: Fingerprint of the request
+
+    Returns:
+        Row | None: Completed record, or None if the owner released the key
+
+    Raises:
+        HTTPException:
+            - 422 if the key was used with a different request
+            - 409 if the original request is still in progress after the wait timeout
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.idempotency_wait_timeout_seconds
+    delay = 0.05
+
+    while True:
+        async with db_session() as db:
+            record = await get_key_record(db, user_id, key)
+        if record is None:
+            return None
+        if record.request_hash != request_hash:
+            raise HTTPException(status_code=422, detail="Idempotency-Key was already used with a different request.")
+        if record.status_code is not None:
+            return record
+
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            raise HTTPException(status_code=409, detail="A request with this Idempotency-Key is still in progress.")
+
+        event = _waiters.get((user_id, key))
+        timeout = min(delay, remaining)
+        if event is not None:
+            try:
+                await asyncio.wait_for(event.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+        else:
+            await asyncio.sleep(timeout)
+        delay = min(delay * 2, 1.0)
+
+
+async def purge_expired_keys(db: Session) -> int:
+    """
+    Delete expired idempotency records.
+
+    Args:
+        db: Async database session
+
+    Returns:
+        int: Number of records deleted
+    """
+    result = await db.execute(delete(IdempotencyKey).where(IdempotencyKey.expires_at < func.now()))
+    await db.commit()
+    return result.rowcount
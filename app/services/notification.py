@@ -1,6 +1,6 @@
 from fastapi import HTTPException
 from fastapi_mail import FastMail, MessageSchema, MessageType
-from sqlalchemy import select, desc
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession as Session
 from sqlalchemy.orm import selectinload
 from app.models import Booking, CustomerCar, Car, BookedService, Address
@@ -9,6 +9,8 @@ from datetime import datetime
 from decimal import Decimal
 
 from app.core.config import email_conf
+from app.schemas import NotificationLogResponse
+from app.utilities.listing import list_response
 from app.models import (
     Booking, NotificationLog, NotificationCategory, BookingProgress
 )
@@ -463,26 +465,25 @@ async def send_query_response(db: Session, query_email: str, query_text: str, re
     )
 
 
-async def get_notification_logs(db: Session, notification_category: Optional[int] = None, limit: int = 100):
+async def get_notification_logs(db: Session, notification_category: Optional[int] = None, limit: int = 100, cursor: Optional[str] = None):
     """
-    Get notification logs with optional filtering.
+    Get notification logs with optional filtering, newest first.
     
     Args:
         db: Async database session
         notification_category: Optional notification category ID to filter by
         limit: Maximum number of logs to return (default: 100)
+        cursor: Optional cursor from the previous page's X-Next-Cursor header
         
     Returns:
-        list: List of NotificationLog instances
+        Response: Page of notification logs
     """
-    query = select(NotificationLog).options(
-        selectinload(NotificationLog.category),
-    ).order_by(desc(NotificationLog.timestamp))
-    
-    if notification_category:
-        query = query.where(NotificationLog.notification_category_id == notification_category)
-    
-    query = query.limit(limit)
-    
-    result = await db.execute(query)
-    return result.scalars().all()
+    filters = {"notification_category_id": notification_category} if notification_category else None
+
+    return await list_response(
+        db, NotificationLog, NotificationLogResponse, limit, cursor,
+        filters=filters,
+        order_by=NotificationLog.timestamp,
+        desc=True,
+        options=[selectinload(NotificationLog.category)],
+    )
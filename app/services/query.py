@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import List, Optional, Tuple
 from bson import ObjectId
 from fastapi import HTTPException, BackgroundTasks
 from motor.motor_asyncio import AsyncIOMotorDatabase
@@ -6,6 +7,13 @@ from sqlalchemy.ext.asyncio import AsyncSession as Session
 from app.models import Query
 from app.schemas import QueryCreate, QueryResponse
 from app.services import notification as notification_service
+from app.utilities.pagination import encode_cursor, decode_cursor
+
+# newest first; _id breaks ties between queries created in the same instant
+QUERY_SORT = [("created_at", -1), ("_id", -1)]
+
+# list views skip the response body; fetch a single query to read it
+QUERY_LIST_PROJECTION = {"response": 0}
 
 async def create_query_service(db: AsyncIOMotorDatabase, data: QueryCreate) -> Query:
     """
@@ -74,18 +82,85 @@ async def respond_to_query_service(
     return updated
 
 
-async def get_all_queries_service(db: AsyncIOMotorDatabase):
+async def get_queries_page(
+    db: AsyncIOMotorDatabase,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    responded: Optional[bool] = None,
+    search: Optional[str] = None,
+) -> Tuple[List[dict], Optional[str]]:
     """
-    Fetch all queries (admin access).
+    Fetch a page of queries (admin access), newest first.
     
-    Retrieves all customer queries sorted by creation date (newest first).
+    Pages are keyset-paginated on (created_at, _id) so every page is an index
+    range scan regardless of depth. Response bodies are left out.
     
     Args:
         db: MongoDB database session
+        limit: Maximum number of queries to return
+        cursor: Optional cursor returned with the previous page
+        responded: Optional filter; True for answered, False for unanswered queries
+        search: Optional words to match against the query text
         
     Returns:
-        list: List of all query documents
+        tuple: (queries, cursor of the next page or None)
+        
+    Raises:
+        HTTPException: 400 if the cursor is invalid
+    """
+    conditions = []
+    if responded is not None:
+        conditions.append({"response": {"$ne": None}} if responded else {"response": None})
+    if search:
+        conditions.append({"$text": {"$search": search}})
+    if cursor:
+        created_at, query_id = decode_cursor(cursor, 2)
+        if not isinstance(created_at, datetime) or not ObjectId.is_valid(query_id):
+            raise HTTPException(status_code=400, detail="Invalid pagination cursor.")
+        conditions.append({
+            "$or": [
+                {"created_at": {"$lt": created_at}},
+                {"created_at": created_at, "_id": {"$lt": ObjectId(query_id)}},
+            ]
+        })
+
+    query_filter = {"$and": conditions} if conditions else {}
+    queries = await (
+        db.queries.find(query_filter, QUERY_LIST_PROJECTION)
+        .sort(QUERY_SORT)
+        .limit(limit + 1)
+        .to_list(length=limit + 1)
+    )
+
+    next_cursor = None
+    if len(queries) > limit:
+        queries = queries[:limit]
+        last = queries[-1]
+        next_cursor = encode_cursor([last["created_at"], str(last["_id"])])
+
+    return queries, next_cursor
+
+
+async def get_query_service(db: AsyncIOMotorDatabase, query_id: str):
     """
-    cursor = db.queries.find().sort("created_at", -1)
-    queries = await cursor.to_list(None)
-    return queries
+    Fetch a single query with its response (admin access).
+    
+    Args:
+        db: MongoDB database session
+        query_id: Query ID
+        
+    Returns:
+        dict: Query document
+        
+    Raises:
+        HTTPException: 
+            - 400 if query_id is invalid
+            - 404 if query is not found
+    """
+    if not ObjectId.is_valid(query_id):
+        raise HTTPException(status_code=400, detail="Invalid query ID")
+
+    query = await db.queries.find_one({"_id": ObjectId(query_id)})
+    if not query:
+        raise HTTPException(status_code=404, detail="Query not found")
+    return query
@@ -0,0 +1,179 @@
+import asyncio
+import math
+from decimal import Decimal
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession as Session
+from typing import Dict, Iterable, Optional, Tuple
+
+from app.models import Service, PriceChart, CustomerCar, Car
+from app.core.cache import get_catalog_version
+from app.core.config import settings
+from app.utilities.data_utils import get_gst_rate
+
+
+class PriceMatrix:
+    """
+    In-memory car class x service price matrix with service durations.
+
+    Built from two flat queries and keyed by catalog version, so any write
+    to services or price charts through the service layer invalidates it.
+    """
+    __slots__ = ("version", "prices", "time_hrs")
+
+    def __init__(self, version: int, prices: Dict[Tuple[int, int], Decimal], time_hrs: Dict[int, Decimal]):
+        self.version = version
+        self.prices = prices
+        self.time_hrs = time_hrs
+
+
+_price_matrix: Optional[PriceMatrix] = None
+_price_matrix_lock = asyncio.Lock()
+
+
+async def build_price_matrix(db: Session, version: int) -> PriceMatrix:
+    """
+    Load all prices and service durations into a price matrix.
+
+    Args:
+        db: Async database session
+        version: Catalog version the matrix is built at
+
+    Returns:
+        PriceMatrix: Price matrix
+    """
+    result = await db.execute(select(Service.id, Service.time_hrs))
+    time_hrs = {service_id: hours for service_id, hours in result.all()}
+
+    result = await db.execute(select(PriceChart.car_class_id, PriceChart.service_id, PriceChart.price))
+    prices = {(car_class_id, service_id): price for car_class_id, service_id, price in result.all()}
+
+    return PriceMatrix(version, prices, time_hrs)
+
+
+async def get_price_matrix(db: Session) -> PriceMatrix:
+    """
+    Get the price matrix for the current catalog version, rebuilding it if stale.
+
+    Args:
+        db: Async database session
+
+    Returns:
+        PriceMatrix: Price matrix
+    """
+    global _price_matrix
+
+    matrix = _price_matrix
+    if matrix is not None and matrix.version == get_catalog_version():
+        return matrix
+
+    async with _price_matrix_lock:
+        version = get_catalog_version()
+        matrix = _price_matrix
+        if matrix is None or matrix.version != version:
+            matrix = await build_price_matrix(db, version)
+            _price_matrix = matrix
+
+    return matrix
+
+
+async def get_customer_car(db: Session, customer_car_id: int):
+    """
+    Get a customer car's owner, registration number and car class in one query.
+
+    Args:
+        db: Async database session
+        customer_car_id: Customer car ID
+
+    Returns:
+        Row: (customer_id, reg_number, car_class_id)
+
+    Raises:
+        HTTPException: 404 if the car is not found
+    """
+    result = await db.execute(
+        select(CustomerCar.customer_id, CustomerCar.reg_number, Car.car_class_id)
+        .join(Car, CustomerCar.car_model_id == Car.id)
+        .where(CustomerCar.id == customer_car_id)
+    )
+    car = result.one_or_none()
+    if not car:
+        raise HTTPException(status_code=404, detail="Car not found.")
+    return car
+
+
+def compute_quote(matrix: PriceMatrix, car_class_id: int, service_ids: Iterable[int], gst_rate: Decimal = Decimal(0)):
+    """
+    Price a set of services for a car class from the price matrix.
+
+    Args:
+        matrix: Price matrix
+        car_class_id: Car class of the customer car
+        service_ids: Service IDs to price
+        gst_rate: GST rate as a fraction (e.g. 0.18)
+
+    Returns:
+        dict: Per-service prices, totals with GST and days required
+
+    Raises:
+        HTTPException:
+            - 404 if a service is not found
+            - 400 if a service has no price for the car class
+    """
+    services = []
+    total_price = Decimal(0)
+    hours_required = Decimal(0)
+
+    for service_id in dict.fromkeys(service_ids):
+        hours = matrix.time_hrs.get(service_id)
+        if hours is None:
+            raise HTTPException(status_code=404, detail="Service not found.")
+
+        price = matrix.prices.get((car_class_id, service_id))
+        if price is None:
+            raise HTTPException(status_code=400, detail=f"Service {service_id} is not available for this car class.")
+
+        services.append({"service_id": service_id, "price": price, "time_hrs": hours})
+        total_price += price
+        hours_required += hours
+
+    gst = (total_price * gst_rate).quantize(Decimal("0.01"))
+
+    return {
+        "car_class_id": car_class_id,
+        "services": services,
+        "total_price": total_price,
+        "gst": gst,
+        "total_with_gst": total_price + gst,
+        "hours_required": hours_required,
+        "days_required": math.ceil(hours_required / settings.working_hrs),
+    }
+
+
+async def get_quote(db: Session, customer_car_id: int, service_ids: Iterable[int], payload: dict):
+    """
+    Quote estimated price, GST and days required for services on a customer car.
+
+    Args:
+        db: Async database session
+        customer_car_id: Customer car ID
+        service_ids: Service IDs to quote
+        payload: Token payload containing user_id
+
+    Returns:
+        dict: Quote with per-service prices, totals and days required
+
+    Raises:
+        HTTPException: 403 if a customer requests a quote for another customer's car
+    """
+    car = await get_customer_car(db, customer_car_id)
+    customer_id = payload.get("user_id")
+    if customer_id and customer_id.startswith("CST") and car.customer_id != customer_id:
+        raise HTTPException(status_code=403, detail="Car not found or doesn't belong to customer.")
+
+    matrix = await get_price_matrix(db)
+    gst_rate = await get_gst_rate()
+
+    quote = compute_quote(matrix, car.car_class_id, service_ids, gst_rate)
+    quote["customer_car_id"] = customer_car_id
+    return quote
@@ -1,10 +1,42 @@
 import asyncio
 from functools import partial
 from sentence_transformers import SentenceTransformer
+from app.core.cache import VersionedLRUCache
 
 model = SentenceTransformer("BAAI/bge-base-en")
 
+# query embeddings do not depend on the catalog, so they are cached at a fixed version
+embedding_cache = VersionedLRUCache(max_size=1024)
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a free text query so equivalent queries share cache entries.
+
+    Args:
+        query: Raw user query
+
+    Returns:
+        str: Lower-cased query with collapsed whitespace
+    """
+    return " ".join(query.lower().split())
+
 async def generate_embedding(text: str):
     loop = asyncio.get_running_loop()
     vector = await loop.run_in_executor(None, partial(model.encode, text, normalize_embeddings=True))
     return vector.tolist()
+
+async def generate_query_embedding(query: str):
+    """
+    Generate the embedding for an already normalized search query, reusing cached vectors.
+
+    Args:
+        query: Normalized query text
+
+    Returns:
+        list: Embedding vector
+    """
+    embedding = embedding_cache.get(query, 0)
+    if embedding is None:
+        embedding = await generate_embedding(query)
+        embedding_cache.set(query, 0, embedding)
+    return embedding
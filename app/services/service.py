@@ -1,15 +1,24 @@
+import asyncio
 from fastapi import HTTPException
 from fastapi.responses import JSONResponse
-from sqlalchemy import select, delete, func, cast
+from sqlalchemy import select, update, delete, func, cast, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession as Session
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, noload
 from sqlalchemy.exc import IntegrityError
 from pgvector.sqlalchemy import Vector
-from typing import List
-from app.models import Service, PriceChart, FuelType, ServiceReview
-from app.schemas import ServiceUpdate, ServiceUpdateWithForeignData, ServiceReviewCreate, ServiceReviewUpdate
+from pydantic import TypeAdapter
+from typing import List, Dict, Optional
+from app.models import Service, ServiceCategory, PriceChart, FuelType, ServiceReview, ServiceRating, Customer
+from app.schemas import ServiceUpdate, ServiceUpdateWithForeignData, ServiceReviewCreate, ServiceReviewUpdate, ServiceResponse, ServicePageResponse
 from app.utilities.data_utils import filter_data_for_model
-from app.services import crud, recommendation
+from app.utilities.etag import make_etag
+from app.utilities.pagination import encode_cursor, decode_cursor
+from app.services import crud, recommendation, bookings as booking_service
+from app.core.cache import VersionedLRUCache, get_catalog_version, bump_catalog_version
+
+# recommendation results keyed by (normalized query, limit), stamped with the catalog version
+recommendation_cache = VersionedLRUCache(max_size=512)
 
 # utils
 async def update_service_price_chart(db: Session, service_id: int, new_price_chart_data: list):
@@ -83,6 +92,71 @@ async def get_fuel_type_models(db: Session, fuel_ids: List[int]):
     )
     return result.scalars().all()
 
+async def apply_rating_change(db: Session, service_id: int, added_rating: Optional[int] = None, removed_rating: Optional[int] = None):
+    """
+    Apply a review rating change to the service's aggregate row.
+    
+    Issues a single upsert that increments the count, sum and histogram
+    buckets, so concurrent review writes never lose updates.
+    Caller function should commit the transaction.
+    
+    Args:
+        db: Async database session
+        service_id: Service ID the review belongs to
+        added_rating: Rating added by the write (new or updated review)
+        removed_rating: Rating removed by the write (deleted or updated review)
+    """
+    deltas = {
+        "review_count": (added_rating is not None) - (removed_rating is not None),
+        "rating_sum": (added_rating or 0) - (removed_rating or 0),
+    }
+    for rating in range(1, 6):
+        deltas[f"rating_{rating}"] = (added_rating == rating) - (removed_rating == rating)
+
+    stmt = pg_insert(ServiceRating).values(service_id=service_id, **deltas)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ServiceRating.service_id],
+        set_={
+            **{column: getattr(ServiceRating, column) + stmt.excluded[column] for column in deltas},
+            "updated_at": func.now(),
+        },
+    )
+    await db.execute(stmt)
+
+async def remove_customer_ratings(db: Session, customer_id: str):
+    """
+    Take all reviews of a customer out of the service aggregates.
+    
+    Used before deleting a customer: their reviews are then removed by the
+    database's ON DELETE CASCADE, which bypasses apply_rating_change.
+    Caller function should commit the transaction.
+    
+    Args:
+        db: Async database session
+        customer_id: Customer ID whose reviews are about to be deleted
+    """
+    reviews = (
+        select(
+            ServiceReview.service_id,
+            func.count().label("review_count"),
+            func.sum(ServiceReview.rating).label("rating_sum"),
+            *[func.count().filter(ServiceReview.rating == rating).label(f"rating_{rating}") for rating in range(1, 6)],
+        )
+        .where(ServiceReview.customer_id == customer_id)
+        .group_by(ServiceReview.service_id)
+        .subquery()
+    )
+    columns = ["review_count", "rating_sum"] + [f"rating_{rating}" for rating in range(1, 6)]
+    await db.execute(
+        update(ServiceRating)
+        .where(ServiceRating.service_id == reviews.c.service_id)
+        .values(
+            **{column: getattr(ServiceRating, column) - reviews.c[column] for column in columns},
+            updated_at=func.now(),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
 def serialize_price_chart(price_charts: List[PriceChart]):
     result = {}
     for price_chart in price_charts:
@@ -162,6 +236,7 @@ async def create_service(db: Session, data: dict):
         db.add_all(price_chart_models)
 
     await db.commit()
+    await bump_catalog_version()
 
     # re fetch from db with eager loading
     service = await crud.get_one_record(
@@ -220,6 +295,7 @@ async def update_service(db: Session, service_id: int, update_schema: ServiceUpd
             new_data["embedding"] = embedding
             
         await crud.update_record_by_primary_key(db, service_id, new_data, Service)
+        await booking_service.invalidate_booking_views(db)
 
     if update_schema.price_chart is not None:
         flag = True
@@ -239,15 +315,36 @@ async def update_service(db: Session, service_id: int, update_schema: ServiceUpd
         except IntegrityError:
             await db.rollback()
             raise HTTPException(status_code=400, detail="Duplicate or invalid data detected.")
+        await bump_catalog_version()
 
     await db.refresh(service)
 
     return 
 
 
+async def delete_service(db: Session, service_id: int):
+    """
+    Delete a service along with its price chart and fuel type mappings.
+    
+    Args:
+        db: Async database session
+        service_id: Service ID to delete
+        
+    Returns:
+        dict: Success message
+        
+    Raises:
+        HTTPException: 404 if service is not found
+    """
+    message = await crud.delete_record_by_primary_key(db, service_id, Service)
+    await booking_service.invalidate_booking_views(db)
+    await bump_catalog_version()
+    return message
+
+
 async def create_review(review: ServiceReviewCreate, db: Session, payload: dict):
     """
-    Create a service review.
+    Create a service review and update the service's rating aggregates.
     
     Args:
         review: Service review creation data
@@ -258,7 +355,9 @@ async def create_review(review: ServiceReviewCreate, db: Session, payload: dict)
         ServiceReview: Created review instance
         
     Raises:
-        HTTPException: 403 if user is not a customer
+        HTTPException: 
+            - 403 if user is not a customer
+            - 400 if there's an integrity error (invalid service or duplicate review)
     """
     customer_id = payload.get("user_id")
     if not customer_id.startswith("CST"):
@@ -266,11 +365,24 @@ async def create_review(review: ServiceReviewCreate, db: Session, payload: dict)
     
     data = review.model_dump()
     data["customer_id"] = customer_id
-    return await crud.create_record(db, data, ServiceReview)
+    record = ServiceReview(**data)
+    db.add(record)
+
+    try:
+        await db.flush()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Invalid foreign key reference")
+
+    await apply_rating_change(db, record.service_id, added_rating=record.rating)
+
+    await db.commit()
+    await db.refresh(record)
+    return record
 
 async def update_review_by_id(service_id: int, review: ServiceReviewUpdate, db: Session, payload: dict):
     """
-    Update a service review.
+    Update a service review and the service's rating aggregates.
     
     Args:
         service_id: Service ID for the review
@@ -282,22 +394,41 @@ async def update_review_by_id(service_id: int, review: ServiceReviewUpdate, db:
         ServiceReview: Updated review instance
         
     Raises:
-        HTTPException: 403 if user is not a customer
+        HTTPException: 
+            - 403 if user is not a customer
+            - 404 if review is not found
     """
     customer_id = payload.get("user_id")
     if not customer_id.startswith("CST"):
         raise HTTPException(status_code=403, detail="Operation not permitted. Only Customers can update reviews")
     
-    # build composite primary key
-    pk = {
-        "customer_id": customer_id,
-        "service_id": service_id
-    }
-    return await crud.update_record_by_composite_key(db, pk, review.model_dump(exclude_none=True), ServiceReview)
+    # lock the review so the old rating used for the aggregate delta stays accurate
+    result = await db.execute(
+        select(ServiceReview)
+        .where(
+            ServiceReview.customer_id == customer_id,
+            ServiceReview.service_id == service_id,
+        )
+        .with_for_update()
+    )
+    record = result.scalar_one_or_none()
+    if not record:
+        raise HTTPException(status_code=404, detail="ServiceReview not found.")
+
+    old_rating = record.rating
+    for key, value in review.model_dump(exclude_none=True).items():
+        setattr(record, key, value)
+
+    if record.rating != old_rating:
+        await apply_rating_change(db, service_id, added_rating=record.rating, removed_rating=old_rating)
+
+    await db.commit()
+    await db.refresh(record)
+    return record
 
 async def delete_review_by_id(service_id: int, db: Session, payload: dict):
     """
-    Delete a service review.
+    Delete a service review and update the service's rating aggregates.
     
     Args:
         service_id: Service ID for the review
@@ -308,23 +439,130 @@ async def delete_review_by_id(service_id: int, db: Session, payload: dict):
         JSONResponse: Success message
         
     Raises:
-        HTTPException: 403 if user is not a customer
+        HTTPException: 
+            - 403 if user is not a customer
+            - 404 if review is not found
     """
     customer_id = payload.get("user_id")
     if not customer_id.startswith("CST"):
         raise HTTPException(status_code=403, detail="Operation not permitted. Only Customers can delete reviews")
     
-    # build composite primary key
-    pk = {
-        "customer_id": customer_id,
-        "service_id": service_id
+    result = await db.execute(
+        delete(ServiceReview)
+        .where(
+            ServiceReview.customer_id == customer_id,
+            ServiceReview.service_id == service_id,
+        )
+        .returning(ServiceReview.rating)
+    )
+    removed_rating = result.scalar_one_or_none()
+    if removed_rating is None:
+        raise HTTPException(status_code=404, detail="ServiceReview not found.")
+
+    await apply_rating_change(db, service_id, removed_rating=removed_rating)
+    await db.commit()
+
+    return JSONResponse(content={"detail": "ServiceReview deleted successfully."})
+
+
+async def get_service_reviews(db: Session, service_id: int, limit: int = 20, cursor: Optional[str] = None):
+    """
+    Get a page of reviews for a service, newest first, using keyset pagination.
+    
+    Pages are seeked on (created_at, customer_id) so deep pages cost the same
+    as the first one. Only the reviewing customer is loaded with each review.
+    
+    Args:
+        db: Async database session
+        service_id: Service ID
+        limit: Maximum number of reviews in the page
+        cursor: Optional cursor returned with the previous page
+        
+    Returns:
+        dict: Reviews and the cursor for the next page
+    """
+    query = (
+        select(ServiceReview)
+        .options(
+            selectinload(ServiceReview.customer).options(
+                noload(Customer.addresses),
+                noload(Customer.favourites),
+                noload(Customer.cart),
+            ),
+            noload(ServiceReview.service),
+        )
+        .where(ServiceReview.service_id == service_id)
+        .order_by(ServiceReview.created_at.desc(), ServiceReview.customer_id.desc())
+        .limit(limit + 1)
+    )
+
+    if cursor:
+        created_at, customer_id = decode_cursor(cursor, 2)
+        query = query.where(
+            tuple_(ServiceReview.created_at, ServiceReview.customer_id) < tuple_(created_at, customer_id)
+        )
+
+    result = await db.execute(query)
+    reviews = result.scalars().all()
+
+    next_cursor = None
+    if len(reviews) > limit:
+        reviews = reviews[:limit]
+        last = reviews[-1]
+        next_cursor = encode_cursor([last.created_at, last.customer_id])
+
+    return {"reviews": reviews, "next_cursor": next_cursor}
+
+
+async def get_service_rating_stats(db: Session, service_id: int):
+    """
+    Get the rating aggregates of a service.
+    
+    Args:
+        db: Async database session
+        service_id: Service ID
+        
+    Returns:
+        dict: Review count, average rating and rating distribution
+    """
+    rating = await db.get(ServiceRating, service_id)
+    if not rating:
+        rating = ServiceRating(service_id=service_id, review_count=0, rating_sum=0, rating_1=0, rating_2=0, rating_3=0, rating_4=0, rating_5=0)
+
+    return {
+        "service_id": service_id,
+        "total_reviews": rating.review_count,
+        "average_rating": rating.average_rating,
+        "rating_distribution": rating.rating_distribution,
     }
-    message = await crud.delete_record_by_composite_key(db, pk, ServiceReview)
-    return JSONResponse(content=message)
 
 
-async def recommend_service(query: str, db: Session):
-    query_embedding = await recommendation.generate_embedding(query)
+async def recommend_service(query: str, db: Session, limit: int = 5):
+    """
+    Recommend services matching a free text query using vector similarity.
+    
+    Results are cached per normalized query and limit, and stamped with the
+    catalog version so any catalog write invalidates them. Cached lists are
+    shared between callers and must not be mutated.
+    
+    Args:
+        query: User query describing car issues, symptoms, or service needs
+        db: Async database session
+        limit: Maximum number of services to return
+        
+    Returns:
+        list: Services with similarity score (0-100)
+    """
+    normalized_query = recommendation.normalize_query(query)
+    cache_key = (normalized_query, limit)
+
+    # read the version before querying so a concurrent catalog write marks this result stale
+    catalog_version = get_catalog_version()
+    cached = recommendation_cache.get(cache_key, catalog_version)
+    if cached is not None:
+        return cached
+
+    query_embedding = await recommendation.generate_query_embedding(normalized_query)
 
     VECTOR_DIM = 768
     similarity = (
@@ -349,7 +587,7 @@ async def recommend_service(query: str, db: Session):
                 cast(query_embedding, Vector(VECTOR_DIM))
             )
         )
-        .limit(5)
+        .limit(limit)
     )
 
     rows = await db.execute(stmt)
@@ -359,11 +597,21 @@ async def recommend_service(query: str, db: Session):
         {**service_json(service), "score": round(float(score) * 100, 1)}
         for service, score in results
     ]
+
+    recommendation_cache.set(cache_key, catalog_version, result)
     return result
 
 
-async def get_services_categorized(db: Session):
-    services: List[Service] = await crud.get_all_records(db, Service)
+def group_services_by_category(services: List[Service]):
+    """
+    Group services into the categorized customer page format.
+    
+    Args:
+        services: Service instances with category, price_chart and fuel_types loaded
+        
+    Returns:
+        list: Categories with their services in service_json format
+    """
     category_dict = {}
 
     for service in services:
@@ -379,4 +627,153 @@ async def get_services_categorized(db: Session):
                 'services': [json]
             }
 
-    return category_dict.values()
+    return list(category_dict.values())
+
+
+class CatalogSnapshot:
+    """
+    Immutable, pre-serialized view of the service catalog.
+    
+    Holds the JSON bodies (and their ETags) served by the service listing
+    routes, built once per catalog version.
+    """
+    __slots__ = ("version", "categorized", "categorized_etag", "services", "services_etag", "services_by_category")
+
+    def __init__(self, version: int, categorized: bytes, services: bytes, services_by_category: Dict[int, bytes]):
+        self.version = version
+        self.categorized = categorized
+        self.categorized_etag = make_etag(categorized)
+        self.services = services
+        self.services_etag = make_etag(services)
+        self.services_by_category = {
+            category_id: (body, make_etag(body))
+            for category_id, body in services_by_category.items()
+        }
+
+    def services_for_category(self, category_id: Optional[int]):
+        """
+        Get the serialized service listing, optionally restricted to a category.
+        
+        Args:
+            category_id: Optional category ID to filter by
+            
+        Returns:
+            tuple: (body, etag)
+        """
+        if not category_id:
+            return self.services, self.services_etag
+        return self.services_by_category.get(category_id, (EMPTY_LIST_JSON, EMPTY_LIST_ETAG))
+
+
+EMPTY_LIST_JSON = b"[]"
+EMPTY_LIST_ETAG = make_etag(EMPTY_LIST_JSON)
+
+services_adapter = TypeAdapter(List[ServiceResponse])
+categorized_adapter = TypeAdapter(List[ServicePageResponse])
+
+_catalog_snapshot: Optional[CatalogSnapshot] = None
+_catalog_snapshot_lock = asyncio.Lock()
+
+
+async def build_catalog_snapshot(db: Session, version: int) -> CatalogSnapshot:
+    """
+    Load the service catalog and serialize every listing view once.
+    
+    Only the relationships the listings need are loaded; reviews and the
+    back references of categories and price charts are skipped so the
+    selectin cascade does not pull in customers and their graphs.
+    
+    Args:
+        db: Async database session
+        version: Catalog version the snapshot is built at
+        
+    Returns:
+        CatalogSnapshot: Pre-serialized catalog
+    """
+    result = await db.execute(
+        select(Service)
+        .options(
+            selectinload(Service.category).noload(ServiceCategory.services),
+            selectinload(Service.price_chart).selectinload(PriceChart.car_class),
+            selectinload(Service.price_chart).noload(PriceChart.service),
+            selectinload(Service.fuel_types),
+            noload(Service.reviews),
+        )
+        .order_by(Service.id)
+    )
+    services: List[Service] = result.scalars().all()
+
+    # validate through the response schemas so bodies match what the routes used to return
+    service_models = services_adapter.validate_python(services, from_attributes=True)
+    services_by_category: Dict[int, list] = {}
+    for service_model in service_models:
+        services_by_category.setdefault(service_model.category.id, []).append(service_model)
+
+    categorized_models = categorized_adapter.validate_python(group_services_by_category(services))
+
+    return CatalogSnapshot(
+        version=version,
+        categorized=categorized_adapter.dump_json(categorized_models, by_alias=True),
+        services=services_adapter.dump_json(service_models, by_alias=True),
+        services_by_category={
+            category_id: services_adapter.dump_json(models, by_alias=True)
+            for category_id, models in services_by_category.items()
+        },
+    )
+
+
+async def get_catalog_snapshot(db: Session) -> CatalogSnapshot:
+    """
+    Get the catalog snapshot for the current catalog version, rebuilding it if stale.
+    
+    Concurrent requests after a catalog write wait for a single rebuild.
+    
+    Args:
+        db: Async database session
+        
+    Returns:
+        CatalogSnapshot: Pre-serialized catalog
+    """
+    global _catalog_snapshot
+
+    snapshot = _catalog_snapshot
+    if snapshot is not None and snapshot.version == get_catalog_version():
+        return snapshot
+
+    async with _catalog_snapshot_lock:
+        version = get_catalog_version()
+        snapshot = _catalog_snapshot
+        if snapshot is None or snapshot.version != version:
+            snapshot = await build_catalog_snapshot(db, version)
+            _catalog_snapshot = snapshot
+
+    return snapshot
+
+
+async def get_services_categorized(db: Session):
+    """
+    Get all services grouped by category, pre-serialized.
+    
+    Args:
+        db: Async database session
+        
+    Returns:
+        tuple: (body, etag)
+    """
+    snapshot = await get_catalog_snapshot(db)
+    return snapshot.categorized, snapshot.categorized_etag
+
+
+async def get_services(db: Session, category_id: Optional[int] = None):
+    """
+    Get all services, optionally filtered by category, pre-serialized.
+    
+    Args:
+        db: Async database session
+        category_id: Optional category ID to filter by
+        
+    Returns:
+        tuple: (body, etag)
+    """
+    snapshot = await get_catalog_snapshot(db)
+    return snapshot.services_for_category(category_id)
@@ -5,9 +5,11 @@ from sqlalchemy.ext.asyncio import AsyncSession as Session
 from sqlalchemy.exc import IntegrityError
 from app.auth import hashing
 from app.models import Customer, User, Role, Admin, Mechanic, ServiceCategory
-from app.schemas import CustomerCreate, CustomerUpdate, AdminCreate, MechanicCreate, MechanicUpdate, MechanicUpdateWithForeignData
+from app.schemas import CustomerCreate, CustomerUpdate, AdminCreate, MechanicCreate, MechanicUpdate, MechanicUpdateWithForeignData, CustomerResponse, MechanicResponse
+from app.utilities.listing import list_response
+from typing import Optional
 from app.utilities.data_utils import filter_data_for_model
-from app.services import crud
+from app.services import crud, bookings as booking_service, service as car_service
 
 async def create_user(db: Session, user: CustomerCreate | AdminCreate, model: Customer | Admin):
     """
@@ -77,7 +79,7 @@ async def create_user(db: Session, user: CustomerCreate | AdminCreate, model: Cu
         raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
 
 
-async def get_mechanics(db: Session, payload: dict, mechanic_id: str | None):
+async def get_mechanics(db: Session, payload: dict, mechanic_id: str | None, limit: Optional[int] = None, cursor: Optional[str] = None):
     """
     Get mechanic(s) information with access control.
     
@@ -88,9 +90,11 @@ async def get_mechanics(db: Session, payload: dict, mechanic_id: str | None):
         db: Async database session
         payload: Token payload containing user_id and role
         mechanic_id: Optional mechanic ID to filter by
+        limit: Optional page size; without it all records are streamed
+        cursor: Optional cursor from the previous page's X-Next-Cursor header
         
     Returns:
-        list: List of Mechanic instances
+        Response: Page or stream of mechanics
         
     Raises:
         HTTPException: 403 if mechanic tries to access another mechanic's data
@@ -106,7 +110,7 @@ async def get_mechanics(db: Session, payload: dict, mechanic_id: str | None):
         if user_id.startswith("MEC"):
             filters = {"id": user_id}
 
-    return await crud.get_all_records(db, Mechanic, filters=filters)
+    return await list_response(db, Mechanic, MechanicResponse, limit, cursor, filters=filters)
 
 
 async def create_mechanic(db: Session, user: MechanicCreate):
@@ -213,6 +217,7 @@ async def update_mechanic(db: Session, mechanic_id: int, update_schema: Mechanic
     if new_data:
         flag = True
         await crud.update_record_by_primary_key(db, mechanic_id, new_data, Mechanic)
+        await booking_service.invalidate_booking_views(db)
     
     if update_schema.service_category_ids is not None:
         flag = True
@@ -257,10 +262,11 @@ async def delete_mechanic(id: str, db: Session, payload: dict):
         raise HTTPException(status_code=403, detail="Operation not permitted. Trying to access data of other mechanics.")
     
     message = await crud.delete_record_by_primary_key(db, id.strip(), Mechanic)
+    await booking_service.invalidate_booking_views(db)
     return JSONResponse(content=message)
 
 
-async def get_customers(db: Session, payload: dict, customer_id: str | None):
+async def get_customers(db: Session, payload: dict, customer_id: str | None, limit: Optional[int] = None, cursor: Optional[str] = None):
     """
     Get customer(s) information with access control.
     
@@ -271,9 +277,11 @@ async def get_customers(db: Session, payload: dict, customer_id: str | None):
         db: Async database session
         payload: Token payload containing user_id and role
         customer_id: Optional customer ID to filter by
+        limit: Optional page size; without it all records are streamed
+        cursor: Optional cursor from the previous page's X-Next-Cursor header
         
     Returns:
-        list: List of Customer instances
+        Response: Page or stream of customers
         
     Raises:
         HTTPException: 403 if customer tries to access another customer's data
@@ -289,7 +297,7 @@ async def get_customers(db: Session, payload: dict, customer_id: str | None):
         if user_id.startswith("CST"):
             filters = {"id": user_id}
 
-    return await crud.get_all_records(db, Customer, filters=filters)
+    return await list_response(db, Customer, CustomerResponse, limit, cursor, filters=filters)
 
 
 async def update_customer(id: str, customer_data: CustomerUpdate, db: Session, payload: dict):
@@ -336,5 +344,7 @@ async def delete_customer(id: str, db: Session, payload: dict):
     if payload.get("role") == 3 and payload.get("user_id") != id:
         raise HTTPException(status_code=403, detail="Operation not permitted. Trying to access data of other customers.")
     
+    # reviews go by ON DELETE CASCADE; take them out of the aggregates in the same transaction
+    await car_service.remove_customer_ratings(db, id.strip())
     message = await crud.delete_record_by_primary_key(db, id.strip(), Customer)
     return JSONResponse(content=message)
@@ -1,9 +1,10 @@
 from sqlalchemy.ext.asyncio import AsyncSession as Session
 from sqlalchemy.inspection import inspect
 from sqlalchemy import select
+from decimal import Decimal
 from app.schemas import PriceChartResponseWithService
 from app.models import Service, Role
-from app.database.dependencies import get_mongo_db
+from app.core.settings_cache import get_app_settings
 
 
 async def get_role_id(db: Session, role: str):
@@ -98,44 +99,38 @@ def model_to_dict(obj):
     return {c.key: getattr(obj, c.key) for c in inspect(obj).mapper.column_attrs}
 
 
-async def get_gst_percent() -> str | None:
+async def get_gst_percent() -> int | None:
     """
-    Fetch only the GST percent value from the single GST record.
-
-    Retrieves the GST percentage from MongoDB. The GST record is a singleton
-    record in the database.
+    Get the GST percent from the cached application settings.
 
     Returns:
-        str | None: GST percent string (e.g., "18%"), or None if not found
+        int | None: GST percent (e.g., 18), or None if not set
     """
-    db = get_mongo_db()
-    gst_record = await db.gst.find_one({}, {"_id": 0, "percent": 1})
-    return gst_record.get("percent") if gst_record else None
+    return (await get_app_settings()).gst_percent
 
-async def get_validation_automation_status() -> str | None:
+async def get_gst_rate() -> Decimal:
     """
-    Fetch only the GST percent value from the single GST record.
-
-    Retrieves the GST percentage from MongoDB. The GST record is a singleton
-    record in the database.
+    Get the GST rate from the cached application settings.
 
     Returns:
-        str | None: GST percent string (e.g., "18%"), or None if not found
+        Decimal: GST percent / 100 (e.g., Decimal("0.18")), 0 if not set
+    """
+    return (await get_app_settings()).gst_rate
+
+async def get_validation_automation_status() -> bool | None:
     """
-    db = get_mongo_db()
-    record = await db.app_settings.find_one({"setting_id": "validation_automation"}, {"_id": 0, "state": 1})
-    return record.get("state") if record else None
+    Get whether booking progress validation is automated, from the cached application settings.
 
-async def get_analysis_validation_automation_status() -> str | None:
+    Returns:
+        bool | None: Automation state, or None if not set
     """
-    Fetch only the GST percent value from the single GST record.
+    return (await get_app_settings()).validation_automation
 
-    Retrieves the GST percentage from MongoDB. The GST record is a singleton
-    record in the database.
+async def get_analysis_validation_automation_status() -> bool | None:
+    """
+    Get whether booking analysis validation is automated, from the cached application settings.
 
     Returns:
-        str | None: GST percent string (e.g., "18%"), or None if not found
+        bool | None: Automation state, or None if not set
     """
-    db = get_mongo_db()
-    record = await db.app_settings.find_one({"setting_id": "analysis_validation_automation"}, {"_id": 0, "state": 1})
-    return record.get("state") if record else None
+    return (await get_app_settings()).analysis_validation_automation
@@ -0,0 +1,61 @@
+import hashlib
+from fastapi import Request
+from fastapi.responses import Response
+
+
+def make_etag(body: bytes) -> str:
+    """
+    Build a strong ETag for a pre-serialized response body.
+
+    Args:
+        body: Serialized response body
+
+    Returns:
+        str: Quoted ETag value
+    """
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the client's If-None-Match header matches the given ETag.
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+
+    Returns:
+        bool: True if the client already holds the current representation
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def etag_response(request: Request, body: bytes, etag: str, media_type: str = "application/json") -> Response:
+    """
+    Serve a pre-serialized body, or 304 Not Modified if the client's copy is current.
+
+    Args:
+        request: Incoming request
+        body: Serialized response body
+        etag: ETag of the body
+        media_type: Response content type
+
+    Returns:
+        Response: 304 response without body, or 200 response with the body
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
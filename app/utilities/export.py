@@ -0,0 +1,110 @@
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from datetime import date, datetime, time
+from decimal import Decimal
+from sqlalchemy.ext.asyncio import AsyncSession as Session
+from typing import Any, AsyncIterator, List
+import csv
+import io
+import json
+
+from app.services import crud
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+EXPORT_CHUNK_SIZE = 1000
+
+
+def encode_value(value: Any) -> Any:
+    """Convert a column value to its JSON/CSV representation."""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (list, tuple)):
+        return [encode_value(item) for item in value]
+    return value
+
+
+async def encode_ndjson(chunks: AsyncIterator[List[Any]]) -> AsyncIterator[bytes]:
+    """
+    Encode row chunks as newline-delimited JSON, one object per row.
+
+    Args:
+        chunks: Async iterator of Row chunks
+
+    Yields:
+        bytes: NDJSON lines of one chunk
+    """
+    async for rows in chunks:
+        if not rows:
+            continue
+        lines = [
+            json.dumps({key: encode_value(value) for key, value in row._mapping.items()}, separators=(",", ":"))
+            for row in rows
+        ]
+        yield ("\n".join(lines) + "\n").encode()
+
+
+async def encode_csv(columns: List[str], chunks: AsyncIterator[List[Any]]) -> AsyncIterator[bytes]:
+    """
+    Encode row chunks as CSV with a header line.
+
+    Args:
+        columns: Column names for the header line
+        chunks: Async iterator of Row chunks
+
+    Yields:
+        bytes: CSV text of the header, then of one chunk at a time
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(columns)
+    yield buffer.getvalue().encode()
+
+    async for rows in chunks:
+        buffer.seek(0)
+        buffer.truncate()
+        for row in rows:
+            values = [encode_value(value) for value in row]
+            writer.writerow([json.dumps(value) if isinstance(value, list) else value for value in values])
+        yield buffer.getvalue().encode()
+
+
+def export_response(db: Session, query, format: str, filename: str) -> StreamingResponse:
+    """
+    Stream the rows of a column select as an NDJSON or CSV download.
+
+    Rows are read from a server-side cursor and encoded one chunk at a time,
+    so memory use does not grow with the number of rows.
+
+    Args:
+        db: Async database session
+        query: Select statement of plain columns
+        format: "ndjson" or "csv"
+        filename: Download file name without extension
+
+    Returns:
+        StreamingResponse: Streamed export
+
+    Raises:
+        HTTPException: 400 if the format is not supported
+    """
+    if format not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail=f"Unsupported export format. Use one of: {', '.join(EXPORT_MEDIA_TYPES)}.")
+
+    chunks = crud.stream_rows(db, query, EXPORT_CHUNK_SIZE)
+    if format == "csv":
+        body = encode_csv([column.name for column in query.selected_columns], chunks)
+    else:
+        body = encode_ndjson(chunks)
+
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{format}"'},
+    )
@@ -0,0 +1,96 @@
+from fastapi.responses import Response, StreamingResponse
+from functools import lru_cache
+from pydantic import TypeAdapter
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.orm.strategy_options import _AbstractLoad
+from sqlalchemy.ext.asyncio import AsyncSession as Session
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from app.services import crud
+
+MAX_PAGE_SIZE = 500
+
+
+@lru_cache(maxsize=None)
+def list_adapter(schema: Any) -> TypeAdapter:
+    return TypeAdapter(List[schema])
+
+
+def serialize_records(schema: Any, records: List[Any]) -> bytes:
+    """
+    Serialize ORM records to a JSON array the same way a response_model would.
+    
+    Args:
+        schema: Pydantic response schema of one record
+        records: ORM instances
+        
+    Returns:
+        bytes: JSON array
+    """
+    adapter = list_adapter(schema)
+    return adapter.dump_json(adapter.validate_python(records, from_attributes=True), by_alias=True)
+
+
+async def stream_json_array(schema: Any, chunks: AsyncIterator[List[Any]]) -> AsyncIterator[bytes]:
+    """
+    Encode chunks of records into one JSON array incrementally.
+    
+    Args:
+        schema: Pydantic response schema of one record
+        chunks: Async iterator of record chunks
+        
+    Yields:
+        bytes: Parts of the JSON array
+    """
+    yield b"["
+    first = True
+    async for records in chunks:
+        if not records:
+            continue
+        body = serialize_records(schema, records)
+        yield (b"" if first else b",") + body[1:-1]
+        first = False
+    yield b"]"
+
+
+async def list_response(
+        db: Session,
+        model: Any,
+        schema: Any,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[InstrumentedAttribute] = None,
+        desc: bool = False,
+        options: Optional[List[_AbstractLoad]] = None,
+    ) -> Response:
+    """
+    Serve a list endpoint either as a keyset page or as a streamed JSON array.
+    
+    With a limit (or cursor) one page is returned and the cursor of the next
+    page is sent in the X-Next-Cursor header. Without one, all rows are
+    streamed in chunks from a server-side cursor so memory stays flat.
+    
+    Args:
+        db: Async database session
+        model: SQLAlchemy model class
+        schema: Pydantic response schema of one record
+        limit: Optional page size
+        cursor: Optional cursor from the previous page's X-Next-Cursor header
+        filters: Optional dictionary of field:value pairs to filter by
+        order_by: Optional model attribute to order by (defaults to primary key order)
+        desc: If True, order descending; if False, order ascending
+        options: Optional list of SQLAlchemy loading options
+        
+    Returns:
+        Response: JSON page, or streamed JSON array
+    """
+    if limit is None and cursor is None:
+        chunks = crud.stream_records(db, model, filters=filters, order_by=order_by, desc=desc, options=options)
+        return StreamingResponse(stream_json_array(schema, chunks), media_type="application/json")
+
+    limit = min(limit or MAX_PAGE_SIZE, MAX_PAGE_SIZE)
+    records, next_cursor = await crud.get_page(db, model, filters=filters, limit=limit, cursor=cursor, order_by=order_by, desc=desc, options=options)
+
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return Response(content=serialize_records(schema, records), media_type="application/json", headers=headers)
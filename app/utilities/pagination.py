@@ -0,0 +1,65 @@
+import base64
+import json
+from datetime import datetime, date
+from decimal import Decimal
+from fastapi import HTTPException
+from typing import Any, List
+
+
+def _encode_value(value: Any):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"n": str(value)}
+    return value
+
+
+def _decode_value(value: Any):
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        if "n" in value:
+            return Decimal(value["n"])
+    return value
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """
+    Encode the sort key of the last returned row into an opaque cursor.
+
+    Args:
+        values: Sort key values of the last row, in ORDER BY order
+
+    Returns:
+        str: URL-safe cursor string
+    """
+    raw = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, length: int) -> List[Any]:
+    """
+    Decode an opaque cursor back into sort key values.
+
+    Args:
+        cursor: Cursor string produced by encode_cursor
+        length: Expected number of sort key values
+
+    Returns:
+        list: Sort key values
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != length:
+            raise ValueError("cursor length mismatch")
+        return [_decode_value(v) for v in values]
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor.")
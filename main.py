@@ -4,8 +4,19 @@ from fastapi.middleware.cors import CORSMiddleware
 from app import revare_v1
 from app.middlewares.error_handler import register_exception_handlers
 from app.middlewares.logging import register_logger
-from app.database.mongo import close_mongo_connection
+from app.middlewares.idempotency import register_idempotency
+from app.middlewares.read_routing import register_read_routing
+from app.database.mongo import close_mongo_connection, get_mongo_database
+from app.database.mongo_indexes import ensure_mongo_indexes, check_index_coverage
 from app.database import Base, engine
+from app.database.dependencies import db_session
+from app.services.idempotency import purge_expired_keys
+from app.core.events import booking_events
+from app.core.settings_cache import app_settings_cache, APP_SETTINGS_CHANNEL
+from app.core.cache import invalidate_catalog, CATALOG_CHANNEL
+from app.core.booking_state import invalidate_status_cache, STATUS_CHANNEL
+from app.services.content import content_cache, CONTENT_CHANNEL
+from app.database.replica import replica_monitor, record_write, RECENT_WRITER_CHANNEL
 from app.utilities.seed import run_seed
 from contextlib import asynccontextmanager
 
@@ -21,19 +32,50 @@ async def lifespan(app: FastAPI):
         None: Control is yielded to the application
     """
     print("Running startup tasks...")
+    # await run_seed()
+    # async with engine.begin() as conn:
+    #     await conn.run_sync(Base.metadata.create_all)
+    print("Postgre db connected")
+    print("Mongo db connected")
+
+    # Cross-worker cache invalidation and SSE depend on the LISTEN connection;
+    # start it first and apart from the other tasks (it reconnects on its own)
+    # so a failed startup task cannot leave it off for the life of the worker.
+    booking_events.add_channel(APP_SETTINGS_CHANNEL, app_settings_cache.invalidate)
+    booking_events.add_channel(CONTENT_CHANNEL, content_cache.invalidate)
+    booking_events.add_channel(CATALOG_CHANNEL, invalidate_catalog)
+    booking_events.add_channel(STATUS_CHANNEL, invalidate_status_cache)
+    booking_events.add_channel(RECENT_WRITER_CHANNEL, record_write)
+    await booking_events.start()
+    await replica_monitor.start()
+
+    try:
+        async with db_session() as db:
+            purged = await purge_expired_keys(db)
+        print(f"Purged {purged} expired idempotency keys")
+    except Exception as e:
+        print(f"Purging expired idempotency keys failed: {e}")
+
     try:
-        # await run_seed()
-        # async with engine.begin() as conn:
-        #     await conn.run_sync(Base.metadata.create_all)
-        print("Postgre db connected")
-        print("Mongo db connected")
-        
-        print("Startup complete.")
+        mongo_db = get_mongo_database()
+        await ensure_mongo_indexes(mongo_db)
+        for query in await check_index_coverage(mongo_db):
+            print(f"Mongo query not covered by an index: {query}")
     except Exception as e:
-        print(f"Startup failed: {e}")
+        print(f"Mongo index bootstrap failed: {e}")
+
+    try:
+        await app_settings_cache.load()
+    except Exception as e:
+        # settings are loaded lazily on first use instead
+        print(f"Preloading app settings failed: {e}")
+
+    print("Startup complete.")
 
     yield
 
+    await booking_events.stop()
+    await replica_monitor.stop()
     await close_mongo_connection()
     print("Server shutting down...")
 
@@ -49,11 +91,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Dashboard-Cursor", "X-Dashboard-Resync", "Idempotent-Replayed", "X-Next-Cursor", "X-Read-Primary-Until"],
 )
 
 # custom middlewares
 register_logger(app)
 register_exception_handlers(app)
+register_idempotency(app)
+register_read_routing(app)
 
 app.include_router(revare_v1.router, prefix='/api/v1')
 
@@ -0,0 +1,21 @@
+import os
+
+import pytest
+
+
+@pytest.fixture
+def postgres_url():
+    """Scratch database for the benchmarks that need PostgreSQL; they write to it."""
+    url = os.environ.get("BENCHMARK_POSTGRESQL_URL")
+    if not url:
+        pytest.skip("set BENCHMARK_POSTGRESQL_URL to a migrated and seeded scratch database")
+    return url
+
+
+@pytest.fixture
+def mongodb_uri():
+    """Scratch MongoDB for the benchmarks that need it; they write to it."""
+    uri = os.environ.get("BENCHMARK_MONGODB_URI")
+    if not uri:
+        pytest.skip("set BENCHMARK_MONGODB_URI to a scratch MongoDB deployment")
+    return uri
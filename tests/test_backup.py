@@ -0,0 +1,107 @@
+import asyncio
+import os
+import resource
+import time
+import zlib
+
+from app.core.config import settings
+from app.services.backup import BackupProgress, dump_table, read_table_chunks
+
+# The backup is specified against a 10M-row table; set BACKUP_BENCHMARK_ROWS=10000000
+# to run it at full size. The default keeps the suite quick.
+ROW_COUNT = int(os.environ.get("BACKUP_BENCHMARK_ROWS", 1_000_000))
+COLUMNS = ["id", "customer_id", "amount", "created_at"]
+ROWS_PER_BLOCK = 1000
+
+# Growth of peak RSS allowed while dumping and restoring ROW_COUNT rows. Holding
+# the COPY output or the archive in memory takes hundreds of MB at 1M rows.
+MAX_RSS_GROWTH_KB = 64 * 1024
+
+# Dump throughput required relative to compressing the same COPY stream inline,
+# which is what pg_dump -Fc does per table.
+MIN_RELATIVE_THROUGHPUT = 0.5
+
+
+def synthetic_copy_blocks(row_count: int = ROW_COUNT):
+    """Yield CSV COPY output in blocks, the way the server streams it."""
+    for offset in range(0, row_count, ROWS_PER_BLOCK):
+        yield "".join(
+            f"{i},CUS{i:08d},{i // 100}.{i % 100:02d},2026-01-01 00:00:00+00\n"
+            for i in range(offset, min(offset + ROWS_PER_BLOCK, row_count))
+        ).encode()
+
+
+class SyntheticCopyConnection:
+    """asyncpg connection stand-in whose tables hold row_count synthetic rows."""
+
+    def __init__(self, row_count: int = ROW_COUNT):
+        self.row_count = row_count
+
+    async def copy_from_table(self, table_name, *, schema_name, columns, output, format):
+        for block in synthetic_copy_blocks(self.row_count):
+            await output(block)
+        return f"COPY {self.row_count}"
+
+
+def full_dump_job(name: str = "bookings"):
+    return {"name": name, "mode": "full", "columns": COLUMNS, "query": None, "args": ()}
+
+
+async def dump(backup_path, row_count: int = ROW_COUNT):
+    progress = BackupProgress("benchmark", 1, 1, max_bytes=1 << 40)
+    return await dump_table(SyntheticCopyConnection(row_count), full_dump_job(), backup_path, "csv", "gzip", progress)
+
+
+async def count_restored_rows(backup_path, table) -> int:
+    rows = 0
+    async for data in read_table_chunks(backup_path, table, "gzip"):
+        rows += data.count(b"\n")
+    return rows
+
+
+def peak_rss_kb() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def compress_inline(row_count: int = ROW_COUNT) -> int:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    size = 0
+    for block in synthetic_copy_blocks(row_count):
+        size += len(compressor.compress(block))
+    return size + len(compressor.flush())
+
+
+def test_dump_table_memory_is_bounded(tmp_path, monkeypatch):
+    # small chunks so the table is split and every chunk is verified on restore
+    monkeypatch.setattr(settings, "backup_chunk_size_mb", 8)
+
+    # warm up so one-off allocations (imports, compressors, threads) are not counted
+    (tmp_path / "warmup").mkdir()
+    asyncio.run(dump(tmp_path / "warmup", 10 * ROWS_PER_BLOCK))
+    baseline = peak_rss_kb()
+
+    table = asyncio.run(dump(tmp_path))
+    restored = asyncio.run(count_restored_rows(tmp_path, table))
+
+    growth = peak_rss_kb() - baseline
+    assert table["rows"] == restored == ROW_COUNT
+    assert len(table["chunks"]) > 1
+    assert growth < MAX_RSS_GROWTH_KB, f"peak RSS grew by {growth} KB while backing up {ROW_COUNT} rows"
+
+
+def test_dump_table_throughput(tmp_path):
+    started = time.perf_counter()
+    compress_inline()
+    inline_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    table = asyncio.run(dump(tmp_path))
+    dump_seconds = time.perf_counter() - started
+
+    print(
+        f"\nbackup of {ROW_COUNT} rows: {ROW_COUNT / dump_seconds:,.0f} rows/s, "
+        f"{table['raw_bytes'] / dump_seconds / 1e6:.1f} MB/s raw, "
+        f"{table['raw_bytes'] / table['size_bytes']:.1f}x compression; "
+        f"inline compression {ROW_COUNT / inline_seconds:,.0f} rows/s"
+    )
+    assert inline_seconds / dump_seconds > MIN_RELATIVE_THROUGHPUT
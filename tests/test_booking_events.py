@@ -0,0 +1,173 @@
+import asyncio
+import json
+import time
+
+import asyncpg
+
+from app.core import events
+from app.core.config import settings
+from app.core.events import BOOKING_EVENTS_CHANNEL, BookingEventBroker, SUBSCRIBER_QUEUE_SIZE, booking_events
+from app.services.bookings import booking_event_stream
+
+# Open SSE streams per worker: STREAMS_PER_BOOKING customers on each of BOOKING_COUNT
+# bookings, plus ADMIN_STREAMS dashboards receiving every event. Admins get all
+# BOOKING_COUNT events at once, which must fit their queue.
+BOOKING_COUNT = SUBSCRIBER_QUEUE_SIZE
+STREAMS_PER_BOOKING = 100
+ADMIN_STREAMS = 100
+
+# workers simulated against a real database, and subscribers on each
+WORKER_COUNT = 4
+SUBSCRIBERS_PER_WORKER = 1000
+
+
+class FakeListenConnection:
+    """asyncpg connection stand-in that delivers notifications sent with notify()."""
+
+    def __init__(self):
+        self.listeners = {}
+        self.closed = False
+
+    async def add_listener(self, channel, callback):
+        self.listeners[channel] = callback
+
+    async def execute(self, query):
+        return "SELECT 1"
+
+    def is_closed(self):
+        return self.closed
+
+    def terminate(self):
+        self.closed = True
+
+    async def close(self):
+        self.closed = True
+
+    def notify(self, channel, payload):
+        self.listeners[channel](self, 0, channel, payload)
+
+
+class StreamRequest:
+    """Request stand-in for an SSE client that stays connected."""
+
+    async def is_disconnected(self):
+        return False
+
+
+def booking_event(booking_id: int) -> str:
+    return json.dumps({"booking_id": booking_id, "customer_status": "booked", "updated_at": "2026-01-01T00:00:00"})
+
+
+async def read_events(stream, expected: int):
+    received = []
+    try:
+        async for message in stream:
+            if message.startswith("event: booking"):
+                received.append(json.loads(message.split("data: ", 1)[1]))
+                if len(received) == expected:
+                    break
+    finally:
+        await stream.aclose()
+    return received
+
+
+async def wait_until(condition, timeout: float = 30) -> None:
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        assert time.perf_counter() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+async def run_stream_load(connections):
+    await booking_events.start()
+    try:
+        await wait_until(lambda: connections)
+        listen = connections[0]
+
+        started = time.perf_counter()
+        customers = [
+            asyncio.create_task(read_events(booking_event_stream(StreamRequest(), booking_id, as_customer=True), 1))
+            for booking_id in range(BOOKING_COUNT)
+            for _ in range(STREAMS_PER_BOOKING)
+        ]
+        admins = [
+            asyncio.create_task(read_events(booking_event_stream(StreamRequest()), BOOKING_COUNT))
+            for _ in range(ADMIN_STREAMS)
+        ]
+        await wait_until(lambda: booking_events.subscriber_count == len(customers) + len(admins))
+        subscribed = time.perf_counter()
+
+        for booking_id in range(BOOKING_COUNT):
+            listen.notify(BOOKING_EVENTS_CHANNEL, booking_event(booking_id))
+        customer_events = await asyncio.gather(*customers)
+        admin_events = await asyncio.gather(*admins)
+        delivered = time.perf_counter()
+    finally:
+        await booking_events.stop()
+
+    return customer_events, admin_events, subscribed - started, delivered - subscribed
+
+
+def test_streams_share_one_listen_connection(monkeypatch):
+    connections = []
+
+    async def connect(dsn):
+        connections.append(FakeListenConnection())
+        return connections[-1]
+
+    monkeypatch.setattr(events.asyncpg, "connect", connect)
+    customer_events, admin_events, subscribe_seconds, fan_out_seconds = asyncio.run(run_stream_load(connections))
+
+    streams = len(customer_events) + len(admin_events)
+    messages = len(customer_events) + len(admin_events) * BOOKING_COUNT
+    print(
+        f"\n{streams} streams on {len(connections)} LISTEN connection: subscribed in {subscribe_seconds:.2f}s, "
+        f"{messages} events delivered in {fan_out_seconds:.2f}s ({messages / fan_out_seconds:,.0f}/s)"
+    )
+    assert len(connections) == 1
+    assert booking_events.subscriber_count == 0
+    for index, received in enumerate(customer_events):
+        assert [event["booking_id"] for event in received] == [index // STREAMS_PER_BOOKING]
+    for received in admin_events:
+        assert [event["booking_id"] for event in received] == list(range(BOOKING_COUNT))
+
+
+async def count_backends(conn) -> int:
+    return await conn.fetchval("SELECT count(*) FROM pg_stat_activity WHERE datname = current_database()")
+
+
+async def run_worker_load(dsn: str):
+    control = await asyncpg.connect(dsn)
+    brokers = [BookingEventBroker() for _ in range(WORKER_COUNT)]
+    # channel callbacks run once the broker's LISTENs are in place
+    ready = set()
+    for broker in brokers:
+        broker.add_channel("benchmark_ready", lambda payload, broker=broker: ready.add(broker))
+    try:
+        before = await count_backends(control)
+        for broker in brokers:
+            await broker.start()
+        queues = [[broker.subscribe(booking_id) for booking_id in range(SUBSCRIBERS_PER_WORKER)] for broker in brokers]
+        await wait_until(lambda: len(ready) == WORKER_COUNT)
+        listening = await count_backends(control) - before
+
+        started = time.perf_counter()
+        for booking_id in range(SUBSCRIBERS_PER_WORKER):
+            await control.execute("SELECT pg_notify($1, $2)", BOOKING_EVENTS_CHANNEL, booking_event(booking_id))
+        await wait_until(lambda: all(queue.qsize() == 1 for worker in queues for queue in worker))
+        return listening, time.perf_counter() - started
+    finally:
+        for broker in brokers:
+            await broker.stop()
+        await control.close()
+
+
+def test_workers_use_one_listen_connection_each(postgres_url, monkeypatch):
+    monkeypatch.setattr(settings, "postgresql_url", postgres_url)
+    listening, seconds = asyncio.run(run_worker_load(postgres_url.replace("+asyncpg", "")))
+
+    print(
+        f"\n{WORKER_COUNT} workers x {SUBSCRIBERS_PER_WORKER} subscribers on {listening} connections: "
+        f"{SUBSCRIBERS_PER_WORKER} events fanned out in {seconds:.2f}s"
+    )
+    assert listening == WORKER_COUNT
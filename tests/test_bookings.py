@@ -0,0 +1,113 @@
+import asyncio
+import os
+import time
+from datetime import date, timedelta
+from uuid import uuid4
+
+from fastapi import BackgroundTasks
+from sqlalchemy import delete, event, func, insert, select
+
+from app.database.postgresql import create_postgres_engine, create_sessionmaker
+from app.models import Address, Area, Car, Customer, CustomerCar, PriceChart, Timeslot
+from app.schemas import BookingCreate
+from app.services import bookings as booking_service
+
+# Run against a migrated database seeded by app.utilities.seed. The benchmark
+# calls create_booking directly, so checking out an older commit and running
+# it again gives the before numbers.
+BOOKING_COUNT = int(os.environ.get("BOOKING_BENCHMARK_COUNT", 200))
+SERVICES_PER_BOOKING = 3
+
+# validation query, INSERT ... RETURNING of the booking, executemany of its services
+MAX_QUERIES_PER_BOOKING = 3
+
+
+class StatementCounter:
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine.sync_engine, "before_cursor_execute", self.record)
+
+    def record(self, *args):
+        self.count += 1
+
+
+async def create_fixtures(db):
+    """A customer car with priced services and two saved addresses, in the seeded data."""
+    customer_id = await db.scalar(select(Customer.id).order_by(Customer.id).limit(1))
+    priced = (
+        select(PriceChart.car_class_id, func.array_agg(PriceChart.service_id).label("service_ids"))
+        .group_by(PriceChart.car_class_id)
+        .having(func.count() >= SERVICES_PER_BOOKING)
+        .subquery()
+    )
+    car = (await db.execute(
+        select(Car.id, priced.c.service_ids).join(priced, priced.c.car_class_id == Car.car_class_id).limit(1)
+    )).one()
+    area_id = await db.scalar(select(Area.id).limit(1))
+    timeslot_id = await db.scalar(select(Timeslot.id).limit(1))
+
+    customer_car_id = await db.scalar(
+        insert(CustomerCar)
+        .values(reg_number=f"BENCH{uuid4().hex[:10].upper()}", car_model_id=car.id, customer_id=customer_id)
+        .returning(CustomerCar.id)
+    )
+    address_ids = (await db.scalars(
+        insert(Address).returning(Address.id, sort_by_parameter_order=True),
+        [{"customer_id": customer_id, "line1": f"Benchmark {label}", "area_id": area_id} for label in ("pickup", "drop")],
+    )).all()
+    await db.commit()
+
+    pickup_date = date.today() + timedelta(days=1)
+    booking = BookingCreate(
+        customer_car_id=customer_car_id,
+        pickup_address_id=address_ids[0],
+        drop_address_id=address_ids[1],
+        pickup_date=pickup_date,
+        drop_date=pickup_date + timedelta(days=30),
+        pickup_timeslot_id=timeslot_id,
+        drop_timeslot_id=timeslot_id,
+        service_price={service_id: 0 for service_id in car.service_ids[:SERVICES_PER_BOOKING]},
+    )
+    return booking, {"user_id": customer_id}, address_ids
+
+
+async def remove_fixtures(db, booking: BookingCreate, address_ids) -> None:
+    # bookings, their services and views go with the car
+    await db.execute(delete(CustomerCar).where(CustomerCar.id == booking.customer_car_id))
+    await db.execute(delete(Address).where(Address.id.in_(address_ids)))
+    await db.commit()
+
+
+async def run_benchmark(postgres_url: str):
+    engine = create_postgres_engine(postgres_url, "benchmark")
+    Session = create_sessionmaker(engine)
+    try:
+        async with Session() as db:
+            booking, payload, address_ids = await create_fixtures(db)
+        try:
+            # warm up the price matrix and the statement caches
+            async with Session() as db:
+                await booking_service.create_booking(db, booking, payload, BackgroundTasks())
+
+            counter = StatementCounter(engine)
+            started = time.perf_counter()
+            for _ in range(BOOKING_COUNT):
+                async with Session() as db:
+                    await booking_service.create_booking(db, booking, payload, BackgroundTasks())
+            return time.perf_counter() - started, counter.count
+        finally:
+            async with Session() as db:
+                await remove_fixtures(db, booking, address_ids)
+    finally:
+        await engine.dispose()
+
+
+def test_create_booking_throughput(postgres_url):
+    seconds, statements = asyncio.run(run_benchmark(postgres_url))
+
+    queries_per_booking = statements / BOOKING_COUNT
+    print(
+        f"\n{BOOKING_COUNT} bookings of {SERVICES_PER_BOOKING} services: "
+        f"{BOOKING_COUNT / seconds:,.1f} bookings/s, {queries_per_booking:.1f} queries per booking"
+    )
+    assert queries_per_booking <= MAX_QUERIES_PER_BOOKING
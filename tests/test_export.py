@@ -0,0 +1,68 @@
+import asyncio
+import resource
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from app.utilities.export import EXPORT_CHUNK_SIZE, encode_csv, encode_ndjson
+
+ROW_COUNT = 1_000_000
+COLUMNS = ["id", "customer_id", "amount", "images", "created_at"]
+
+# Growth of peak RSS allowed while exporting ROW_COUNT rows. Holding the rows
+# or the encoded output in memory takes several hundred MB.
+MAX_RSS_GROWTH_KB = 64 * 1024
+
+
+class SyntheticRow(tuple):
+    """Tuple with the _mapping accessor of a SQLAlchemy Row."""
+
+    @property
+    def _mapping(self):
+        return dict(zip(COLUMNS, self))
+
+
+async def synthetic_chunks(row_count: int = ROW_COUNT, chunk_size: int = EXPORT_CHUNK_SIZE):
+    """Yield row chunks the way crud.stream_rows does, building each chunk on demand."""
+    start = datetime(2026, 1, 1)
+    for offset in range(0, row_count, chunk_size):
+        yield [
+            SyntheticRow((
+                i,
+                f"CUS{i:08d}",
+                Decimal(i) / 100,
+                [f"https://img.example.com/{i}.jpg"],
+                start + timedelta(seconds=i),
+            ))
+            for i in range(offset, min(offset + chunk_size, row_count))
+        ]
+
+
+async def drain(body) -> int:
+    total = 0
+    async for part in body:
+        total += len(part)
+    return total
+
+
+def peak_rss_kb() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def assert_streams_in_bounded_memory(make_body):
+    # warm up so one-off allocations (imports, encoders) are not counted
+    asyncio.run(drain(make_body(synthetic_chunks(10 * EXPORT_CHUNK_SIZE))))
+    baseline = peak_rss_kb()
+
+    size = asyncio.run(drain(make_body(synthetic_chunks())))
+
+    growth = peak_rss_kb() - baseline
+    assert size > ROW_COUNT
+    assert growth < MAX_RSS_GROWTH_KB, f"peak RSS grew by {growth} KB while exporting {ROW_COUNT} rows"
+
+
+def test_encode_ndjson_memory_is_bounded():
+    assert_streams_in_bounded_memory(encode_ndjson)
+
+
+def test_encode_csv_memory_is_bounded():
+    assert_streams_in_bounded_memory(lambda chunks: encode_csv(COLUMNS, chunks))
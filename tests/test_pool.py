@@ -0,0 +1,77 @@
+import asyncio
+import os
+import time
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.database.pool import get_pool_status, pool_metrics
+from app.database.postgresql import create_postgres_engine
+
+# Concurrent requests are ramped through CONCURRENCY_LEVELS, each request holding
+# a pooled connection for QUERY_SECONDS, like a short endpoint query.
+CONCURRENCY_LEVELS = [1, 2, 4, 8, 16, 32, 64, 128, 256]
+LEVEL_SECONDS = float(os.environ.get("POOL_LOAD_LEVEL_SECONDS", 3))
+QUERY_SECONDS = 0.01
+POOL_NAME = "loadtest"
+
+# A level saturates the pool when doubling concurrency raises throughput by less than this
+MIN_THROUGHPUT_GAIN = 1.1
+
+
+async def run_level(engine, concurrency: int) -> dict:
+    pool_metrics.pop(POOL_NAME, None)
+    completed = 0
+    deadline = time.perf_counter() + LEVEL_SECONDS
+
+    async def simulated_request():
+        nonlocal completed
+        while time.perf_counter() < deadline:
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT pg_sleep(:seconds)"), {"seconds": QUERY_SECONDS})
+            completed += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(simulated_request() for _ in range(concurrency)))
+    status = get_pool_status(engine)
+    return {
+        "concurrency": concurrency,
+        "requests_per_second": completed / (time.perf_counter() - started),
+        "avg_wait_ms": status["avg_wait_ms"],
+        "max_wait_ms": status["max_wait_ms"],
+        "timeouts": status["timeouts"],
+    }
+
+
+async def ramp(postgres_url: str):
+    engine = create_postgres_engine(postgres_url, POOL_NAME)
+    try:
+        return [await run_level(engine, concurrency) for concurrency in CONCURRENCY_LEVELS]
+    finally:
+        await engine.dispose()
+
+
+def find_saturation(levels):
+    """Highest concurrency that still raised throughput, None if it never levelled off."""
+    for previous, level in zip(levels, levels[1:]):
+        if level["requests_per_second"] < previous["requests_per_second"] * MIN_THROUGHPUT_GAIN:
+            return previous
+    return None
+
+
+def test_pool_saturation_point(postgres_url):
+    levels = asyncio.run(ramp(postgres_url))
+    saturation = find_saturation(levels)
+
+    capacity = settings.db_pool_size + settings.db_max_overflow
+    print(f"\npool {settings.db_pool_size} + {settings.db_max_overflow} overflow, {QUERY_SECONDS * 1000:.0f} ms per request")
+    for level in levels:
+        print(
+            f"{level['concurrency']:>5} concurrent: {level['requests_per_second']:>8,.0f} req/s, "
+            f"wait avg {level['avg_wait_ms']:.1f} ms max {level['max_wait_ms']:.1f} ms, {level['timeouts']} timeouts"
+        )
+    print(f"saturated at {saturation['concurrency'] if saturation else 'none'} concurrent requests")
+
+    assert saturation is not None
+    # concurrency doubles per level, so the pool's capacity is reached within one step
+    assert saturation["concurrency"] <= 2 * capacity
@@ -0,0 +1,108 @@
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.database.mongo_indexes import check_index_coverage, ensure_mongo_indexes
+from app.services.query import get_queries_page
+
+DOCUMENT_COUNT = int(os.environ.get("QUERY_BENCHMARK_DOCUMENTS", 1_000_000))
+INSERT_BATCH_SIZE = 10_000
+PAGE_SIZE = 50
+PAGES_WALKED = 200
+
+# Keyset pages cost the same at any depth; allow noise, not growth with depth
+MAX_DEEP_PAGE_SLOWDOWN = 3
+
+WORDS = ["brake", "engine", "invoice", "refund", "pickup", "delay", "noise", "battery", "tyre", "service", "oil", "clutch"]
+RESPONSE = "Thank you for reaching out. " * 40
+
+
+def synthetic_queries(offset: int, count: int):
+    start = datetime(2026, 1, 1)
+    return [
+        {
+            "customer_email": f"customer{i % 50_000}@example.com",
+            "query": f"My {WORDS[i % len(WORDS)]} and {WORDS[i * 7 % len(WORDS)]} need a look, booking {i}",
+            "response": RESPONSE if i % 2 else None,
+            "responded_by": "ADM000001" if i % 2 else None,
+            "created_at": start + timedelta(seconds=i),
+            "responded_at": start + timedelta(seconds=i, hours=1) if i % 2 else None,
+        }
+        for i in range(offset, offset + count)
+    ]
+
+
+async def seed(db) -> None:
+    for offset in range(0, DOCUMENT_COUNT, INSERT_BATCH_SIZE):
+        await db.queries.insert_many(synthetic_queries(offset, min(INSERT_BATCH_SIZE, DOCUMENT_COUNT - offset)), ordered=False)
+    await ensure_mongo_indexes(db)
+
+
+async def timed(call):
+    started = time.perf_counter()
+    result = await call
+    return result, (time.perf_counter() - started) * 1000
+
+
+async def walk_pages(db, **filters):
+    """Milliseconds per page while following next cursors from the newest query."""
+    timings = []
+    cursor = None
+    for _ in range(PAGES_WALKED):
+        (queries, cursor), ms = await timed(get_queries_page(db, PAGE_SIZE, cursor, **filters))
+        assert len(queries) == PAGE_SIZE
+        assert all("response" not in query for query in queries)
+        timings.append(ms)
+    return timings
+
+
+async def run_benchmark(mongodb_uri: str):
+    client = AsyncIOMotorClient(mongodb_uri)
+    db = client[f"query_benchmark_{uuid4().hex[:8]}"]
+    try:
+        started = time.perf_counter()
+        await seed(db)
+        seed_seconds = time.perf_counter() - started
+
+        results = {
+            "seed_seconds": seed_seconds,
+            "uncovered": await check_index_coverage(db),
+            "all": await walk_pages(db),
+            "unresponded": await walk_pages(db, responded=False),
+            "responded": await walk_pages(db, responded=True),
+        }
+        (queries, _), results["search_ms"] = await timed(get_queries_page(db, PAGE_SIZE, search="clutch refund"))
+        results["search_hits"] = len(queries)
+        # what GET /queries used to do
+        loaded, results["full_load_ms"] = await timed(db.queries.find().sort("created_at", -1).to_list(None))
+        results["full_load_count"] = len(loaded)
+        return results
+    finally:
+        await client.drop_database(db.name)
+        client.close()
+
+
+def test_query_inbox_pages(mongodb_uri):
+    results = asyncio.run(run_benchmark(mongodb_uri))
+
+    print(f"\n{DOCUMENT_COUNT} queries seeded in {results['seed_seconds']:.1f}s")
+    for name in ("all", "unresponded", "responded"):
+        timings = results[name]
+        print(
+            f"{name:>11}: first page {timings[0]:.1f} ms, "
+            f"pages 1-10 avg {sum(timings[:10]) / 10:.1f} ms, "
+            f"pages {PAGES_WALKED - 9}-{PAGES_WALKED} avg {sum(timings[-10:]) / 10:.1f} ms"
+        )
+    print(f"     search: {results['search_hits']} hits in {results['search_ms']:.1f} ms")
+    print(f"  full load: {results['full_load_count']} documents in {results['full_load_ms']:.0f} ms")
+
+    assert results["uncovered"] == []
+    assert results["search_hits"] > 0
+    assert results["full_load_count"] == DOCUMENT_COUNT
+    for name in ("all", "unresponded", "responded"):
+        timings = results[name]
+        assert sum(timings[-10:]) <= MAX_DEEP_PAGE_SLOWDOWN * sum(timings[:10]), f"{name} pages slow down with depth"